@@ -1,9 +1,13 @@
+import numpy as np
 from asv_runner.benchmarks.mark import SkipNotImplemented
 
 import astropy.units as u
 from astropy.coordinates import HCRS, ITRS, HeliocentricMeanEcliptic, SphericalRepresentation
+from astropy.time import Time
 
 import sunpy.coordinates.frames as f
+from sunpy.coordinates import disable_transformation_cache, get_earth, sun
+from sunpy.coordinates.ephemeris import ephemeris_cache
 
 
 class TransformationHeliographic:
@@ -34,6 +38,39 @@ class TransformationHeliographic:
     def time_transform(self, frames, src, dest):
         frames[src].transform_to(frames[dest])
 
+    def time_transform_repeated(self, frames, src, dest):
+        # For example, the pixels of many maps taken at the same time
+        for _ in range(20):
+            frames[src].transform_to(frames[dest])
+
+    def time_transform_repeated_uncached(self, frames, src, dest):
+        with disable_transformation_cache():
+            for _ in range(20):
+                frames[src].transform_to(frames[dest])
+
+
+class TransformationArrayObstime:
+    params = ([1, 10, 100, 1000], ['batched', 'loop'])
+    param_names = ['n', 'mode']
+
+    def setup(self, n, mode):
+        times = Time('2023-01-01') + np.linspace(0, 365, n) * u.day
+        observer = f.HeliographicStonyhurst(np.linspace(-50, 50, n)*u.deg, 0*u.deg, 1*u.AU,
+                                            obstime=times)
+        self.coord = f.Helioprojective(np.zeros(n)*u.arcsec, np.zeros(n)*u.arcsec,
+                                       obstime=times, observer=observer)
+        self.frame = f.HeliographicCarrington(obstime=times, observer='earth')
+        if mode == 'loop':
+            self.coords = [self.coord[i] for i in range(n)]
+            self.frames = [self.frame.replicate_without_data(obstime=times[i]) for i in range(n)]
+
+    def time_transform(self, n, mode):
+        if mode == 'batched':
+            self.coord.transform_to(self.frame)
+        else:
+            for coord, frame in zip(self.coords, self.frames):
+                coord.transform_to(frame)
+
 
 class TransformationEcliptic:
     frame_names = ['HAE', 'HEE', 'GSE', 'GEI']
@@ -83,3 +120,52 @@ class TransformationMagnetic:
 
     def time_transform(self, frames, src, dest):
         frames[src].transform_to(frames[dest])
+
+
+class EphemerisCache:
+    params = [True, False]
+    param_names = ['enabled']
+
+    def setup(self, enabled):
+        ephemeris_cache.enabled = enabled
+        self.times = Time('2020-01-01') + np.linspace(0, 365, 1000) * u.day
+        # Populate the cache so that the benchmarks measure repeated queries
+        get_earth(self.times)
+
+    def teardown(self, enabled):
+        ephemeris_cache.enabled = True
+
+    def time_get_earth_array(self, enabled):
+        get_earth(self.times)
+
+    def time_get_earth_scalar(self, enabled):
+        for time in self.times[:20]:
+            get_earth(time)
+
+    def time_hgs_to_hgc(self, enabled):
+        f.HeliographicStonyhurst(0*u.deg, 0*u.deg, obstime=self.times).transform_to(
+            f.HeliographicCarrington(observer='earth', obstime=self.times))
+
+
+class SunEphemeris:
+    params = ([False, True],)
+    param_names = ['fast']
+
+    def setup(self, fast):
+        self.times = Time('2000-01-01') + np.linspace(0, 3650, 100000) * u.day
+        self.crot = np.linspace(1900, 2030, 1000)
+
+    def time_B0(self, fast):
+        sun.B0(self.times, fast=fast)
+
+    def time_L0(self, fast):
+        sun.L0(self.times, fast=fast)
+
+    def time_P(self, fast):
+        sun.P(self.times, fast=fast)
+
+    def time_carrington_rotation_number(self, fast):
+        sun.carrington_rotation_number(self.times, fast=fast)
+
+    def time_carrington_rotation_time(self, fast):
+        sun.carrington_rotation_time(self.crot, fast=fast)
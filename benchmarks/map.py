@@ -1,3 +1,4 @@
+from contextlib import ExitStack
 from io import BytesIO
 
 from asv_runner.benchmarks.mark import SkipNotImplemented, skip_benchmark
@@ -7,7 +8,8 @@ import astropy.units as u
 
 import sunpy.data.sample
 import sunpy.map
-from sunpy.coordinates import propagate_with_solar_surface
+from sunpy.coordinates import PlanarScreen, SphericalScreen, get_earth, propagate_with_solar_surface
+from sunpy.physics.differential_rotation import DifferentialRotationWarp
 
 
 class Creation:
@@ -30,20 +32,93 @@ class Creation:
         sunpy.map.Map(self.filename)
 
 
+class MultiFileCreation:
+    params = [None, 1, 4]
+    param_names = ['workers']
+
+    def setup(self, workers):
+        self.filenames = [sunpy.data.sample.AIA_171_IMAGE, sunpy.data.sample.HMI_LOS_IMAGE] * 10
+
+    def time_create_maps(self, workers):
+        sunpy.map.Map(self.filenames, workers=workers)
+
+    def peakmem_create_maps(self, workers):
+        sunpy.map.Map(self.filenames, workers=workers)
+
+
+class MetaDerivedProperties:
+    params = ['wcs', 'coordinate_frame', 'observer_coordinate', 'scale', 'rotation_matrix']
+    param_names = ['prop']
+
+    def setup(self, prop):
+        self.aiamap = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE)
+        getattr(self.aiamap, prop)
+
+    def time_repeated_access(self, prop):
+        for _ in range(1000):
+            getattr(self.aiamap, prop)
+
+    def time_access_after_meta_change(self, prop):
+        self.aiamap.meta['crpix1'] += 1
+        getattr(self.aiamap, prop)
+
+
+class PixelToWorld:
+    params = ['wcs', 'values']
+    param_names = ['path']
+
+    def setup_cache(self):
+        aiamap = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE)
+        return aiamap
+
+    def time_all_pixels(self, aiamap, path):
+        if path == 'values':
+            sunpy.map.pixel_to_helioprojective_values(aiamap)
+        else:
+            sunpy.map.all_coordinates_from_map(aiamap._new_instance(aiamap.data, aiamap.meta))
+
+    def peakmem_all_pixels(self, aiamap, path):
+        if path == 'values':
+            sunpy.map.pixel_to_helioprojective_values(aiamap)
+        else:
+            sunpy.map.all_coordinates_from_map(aiamap._new_instance(aiamap.data, aiamap.meta))
+
+
 class Resample:
+    params = ['nearest', 'linear', 'spline']
+    param_names = ['method']
+
     def setup_cache(self):
         aiamap = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE)
         return aiamap
 
-    def time_resample(self, aiamap):
-        aiamap.resample([100, 100] * u.pix)
+    def time_resample(self, aiamap, method):
+        aiamap.resample([100, 100] * u.pix, method=method)
+
+    def peakmem_resample(self, aiamap, method):
+        aiamap.resample([100, 100] * u.pix, method=method)
+
+    def peakmem_resample_upsample(self, aiamap, method):
+        aiamap.resample([2048, 2048] * u.pix, method=method)
+
+
+class Superpixel:
+    params = [False, True]
+    param_names = ['memmap']
+
+    def setup(self, memmap):
+        # Not cached, because a memory-mapped array is not preserved by pickling
+        self.aiamap = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE, memmap=memmap)
 
-    def peakmem_resample(self, aiamap):
-        aiamap.resample([100, 100] * u.pix)
+    def time_superpixel(self, memmap):
+        self.aiamap.superpixel([4, 4] * u.pix)
+
+    def peakmem_superpixel(self, memmap):
+        self.aiamap.superpixel([4, 4] * u.pix)
 
 
 class Rotate:
-    params = (['scipy', 'scikit-image', 'opencv'], range(0, 6))
+    params = (['scipy', 'scipy-tiled', 'scikit-image', 'opencv'], range(0, 6))
     param_names = ['method', 'order']
 
     def setup_cache(self):
@@ -61,6 +136,33 @@ class Rotate:
         aiamap.rotate(30*u.deg, method=method, order=order)
 
 
+class SequenceOperations:
+    params = ['per-map', 'batch']
+    param_names = ['mode']
+
+    def setup_cache(self):
+        aiamap = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE).resample([256, 256] * u.pix)
+        return sunpy.map.MapSequence([aiamap] * 20, stack=True)
+
+    def time_superpixel(self, sequence, mode):
+        if mode == 'batch':
+            sequence.superpixel([4, 4] * u.pix)
+        else:
+            [m.superpixel([4, 4] * u.pix) for m in sequence]
+
+    def time_submap(self, sequence, mode):
+        if mode == 'batch':
+            sequence.submap([10, 10] * u.pix, top_right=[200, 200] * u.pix)
+        else:
+            [m.submap([10, 10] * u.pix, top_right=[200, 200] * u.pix) for m in sequence]
+
+    def time_rotate(self, sequence, mode):
+        if mode == 'batch':
+            sequence.rotate(30*u.deg, order=1)
+        else:
+            [m.rotate(30*u.deg, order=1) for m in sequence]
+
+
 class Reproject:
     params = ['interpolation', 'adaptive']
     param_names = ['algorithm']
@@ -105,3 +207,43 @@ class Autoalign:
         maps[1].plot(axes=ax, autoalign=autoalign)
         buf = BytesIO()
         fig.savefig(buf, format='png')
+
+
+class ReprojectScreen:
+    params = (['spherical', 'planar'], [False, True])
+    param_names = ['screen', 'diffrot']
+
+    def setup_cache(self):
+        maps = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE, sunpy.data.sample.HMI_LOS_IMAGE)
+        return [m.resample([512, 512] * u.pix) for m in maps]
+
+    def time_reproject_to(self, maps, screen, diffrot):
+        screen_class = SphericalScreen if screen == 'spherical' else PlanarScreen
+        with ExitStack() as stack:
+            if diffrot:
+                stack.enter_context(propagate_with_solar_surface())
+            stack.enter_context(screen_class(maps[0].observer_coordinate))
+            maps[1].reproject_to(maps[0].wcs)
+
+
+class DifferentialRotate:
+    params = [1, 8]
+    param_names = ['grid_step']
+
+    def setup_cache(self):
+        aiamap = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE).resample([512, 512] * u.pix)
+        return aiamap
+
+    def setup(self, aiamap, grid_step):
+        self.new_observer = get_earth(aiamap.date + 1*u.day)
+        self.warp = DifferentialRotationWarp(aiamap, observer=self.new_observer, grid_step=grid_step)
+        self.warp(aiamap)
+
+    def time_create_warp(self, aiamap, grid_step):
+        DifferentialRotationWarp(aiamap, observer=self.new_observer, grid_step=grid_step)(aiamap)
+
+    def time_reuse_warp(self, aiamap, grid_step):
+        self.warp(aiamap)
+
+    def time_reuse_warp_sequence(self, aiamap, grid_step):
+        self.warp.apply([aiamap] * 10, workers=4)
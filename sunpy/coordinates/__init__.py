@@ -19,7 +19,14 @@ below (see `astropy.coordinates.builtin_frames`).
 """
 
 from . import sun
-from ._transformations import _make_sunpy_graph, propagate_with_solar_surface, transform_with_sun_center
+from ._transformations import (
+    _make_sunpy_graph,
+    clear_transformation_cache,
+    disable_transformation_cache,
+    propagate_with_solar_surface,
+    transform_with_sun_center,
+    transformation_cache_info,
+)
 from .ephemeris import *
 from .frames import *
 from .metaframes import *
@@ -13,6 +13,8 @@ This module contains the functions for converting one
 
 """
 import logging
+import threading
+from collections import OrderedDict, namedtuple
 from contextvars import ContextVar
 from copy import deepcopy
 from functools import wraps
@@ -31,7 +33,7 @@ from astropy.coordinates import (
     BaseCoordinateFrame,
     ConvertError,
     HeliocentricMeanEcliptic,
-    get_body_barycentric,
+    solar_system_ephemeris,
 )
 from astropy.coordinates.baseframe import frame_transform_graph
 from astropy.coordinates.builtin_frames import make_transform_graph_docs
@@ -49,6 +51,7 @@ from astropy.time import Time
 from sunpy import log
 from sunpy.sun import constants
 from sunpy.util.decorators import sunpycontextmanager
+from .ephemeris import ephemeris_cache
 from .frames import (
     _J2000,
     GeocentricEarthEquatorial,
@@ -68,7 +71,10 @@ from .frames import (
 RSUN_METERS = constants.get('radius').si.to(u.m)
 
 __all__ = ['transform_with_sun_center',
-           'propagate_with_solar_surface']
+           'propagate_with_solar_surface',
+           'disable_transformation_cache',
+           'clear_transformation_cache',
+           'transformation_cache_info']
 
 
 # Thread-safe storage of the current states of the transformation options
@@ -79,6 +85,8 @@ __all__ = ['transform_with_sun_center',
 _ignore_sun_motion = ContextVar('_ignore_sun_motion', default=False)
 # If not None, the name of the differential-rotation model to use for any obstime change
 _autoapply_diffrot = ContextVar('_autoapply_diffrot', default=None)
+# Boolean flag for whether to use the cache of transformation matrices
+_use_matrix_cache = ContextVar('_use_matrix_cache', default=True)
 
 
 @sunpycontextmanager
@@ -222,6 +230,168 @@ def propagate_with_solar_surface(rotation_model='howard'):
             _autoapply_diffrot.reset(token)
 
 
+@sunpycontextmanager
+def disable_transformation_cache():
+    """
+    Context manager for coordinate transformations to not use the cache of
+    transformation matrices.
+
+    The matrices (and offsets) used by the transformations between many of the
+    frames in `sunpy.coordinates` depend on only the observation time (and, for
+    some frames, the observer distance or the equinox). They are cached, so
+    that repeated transformations with the same frame attributes, for example
+    of the pixels of many maps taken at the same time, do not recalculate the
+    ephemerides and matrices each time. The cache holds the most recently used
+    1024 entries, and is keyed on the exact values of the times and distances.
+
+    Under this context manager, the matrices are always recalculated, and the
+    cache is neither used nor updated.
+
+    See Also
+    --------
+    clear_transformation_cache, transformation_cache_info
+
+    Examples
+    --------
+    >>> from astropy.coordinates import SkyCoord
+    >>> from sunpy.coordinates import HeliocentricInertial, disable_transformation_cache
+    >>> import astropy.units as u
+    >>> coord = SkyCoord(0*u.deg, 0*u.deg, 1*u.AU, frame='heliographic_stonyhurst',
+    ...                  obstime='2001-01-01')
+    >>> with disable_transformation_cache():
+    ...     hci_coord = coord.transform_to(HeliocentricInertial(obstime='2001-01-01'))
+    """
+    try:
+        token = _use_matrix_cache.set(False)
+        yield
+    finally:
+        _use_matrix_cache.reset(token)
+
+
+def clear_transformation_cache():
+    """
+    Discard all of the cached transformation matrices and reset the counters
+    of cache hits and misses.
+
+    See Also
+    --------
+    disable_transformation_cache, transformation_cache_info
+    """
+    _matrix_cache.clear()
+
+
+def transformation_cache_info():
+    """
+    Return statistics about the cache of transformation matrices.
+
+    Returns
+    -------
+    `~collections.namedtuple`
+        The number of ``hits`` and ``misses`` of the cache since it was last
+        cleared, and its ``maxsize`` and current size (``currsize``).
+
+    See Also
+    --------
+    disable_transformation_cache, clear_transformation_cache
+    """
+    return _matrix_cache.info()
+
+
+_TransformationCacheInfo = namedtuple('TransformationCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class _MatrixCache:
+    """
+    A thread-safe LRU cache for the functions that calculate transformation
+    matrices, keyed on the exact values of their arguments.
+    """
+    # Arguments with more elements than this (e.g., a distance for every coordinate) are not cached
+    _max_argument_size = 1000
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __call__(self, func):
+        @wraps(func)
+        def wrapped_func(*args):
+            key = self._key(args) if _use_matrix_cache.get() else None
+            if key is None:
+                return func(*args)
+            # The results also depend on the ephemeris and the transformation options
+            key = (func.__name__, solar_system_ephemeris.get(), ephemeris_cache.enabled,
+                   ephemeris_cache.tolerance.to_value(u.m), _ignore_sun_motion.get(),
+                   _autoapply_diffrot.get()) + key
+
+            with self._lock:
+                if key in self._cache:
+                    self._hits += 1
+                    self._cache.move_to_end(key)
+                    return self._cache[key]
+                self._misses += 1
+
+            result = func(*args)
+            _make_read_only(result)
+            with self._lock:
+                self._cache[key] = result
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+            return result
+        return wrapped_func
+
+    def _key(self, args):
+        """
+        Return a hashable key for the arguments, or `None` if they cannot be cached.
+        """
+        key = []
+        for arg in args:
+            if arg is None or isinstance(arg, str):
+                key.append(arg)
+            elif isinstance(arg, Time):
+                if arg.location is not None or arg.size > self._max_argument_size:
+                    return None
+                key.append(('Time', arg.scale, arg.shape,
+                            np.asarray(arg.jd1).tobytes(), np.asarray(arg.jd2).tobytes()))
+            elif isinstance(arg, u.Quantity):
+                if arg.size > self._max_argument_size:
+                    return None
+                key.append(('Quantity', arg.unit.to_string(), arg.dtype.str, arg.shape,
+                            np.asarray(arg.value).tobytes()))
+            elif isinstance(arg, BaseCoordinateFrame) and not arg.has_data:
+                frame_key = self._key([getattr(arg, name) for name in arg.frame_attributes])
+                if frame_key is None:
+                    return None
+                key.append((type(arg).__name__,) + frame_key)
+            else:
+                return None
+        return tuple(key)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        with self._lock:
+            return _TransformationCacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+
+def _make_read_only(value):
+    # Cached results are shared, so guard against them being modified in place
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, tuple):
+        for item in value:
+            _make_read_only(item)
+
+
+_matrix_cache = _MatrixCache(maxsize=1024)
+
+
 # Global counter to keep track of the layer of transformation
 _layer_level = 0
 
@@ -320,6 +490,11 @@ def _check_observer_defined(frame):
 def _times_are_equal(time_1, time_2):
     # Checks whether times are equal
     if isinstance(time_1, Time) and isinstance(time_2, Time):
+        # Avoid converting the times, which is costly for arrays, if they are trivially equal
+        if time_1 is time_2 or (time_1.scale == time_2.scale and time_1.shape == time_2.shape
+                                and np.array_equal(time_1.jd1, time_2.jd1)
+                                and np.array_equal(time_1.jd2, time_2.jd2)):
+            return True
         # We explicitly perform the check in TAI to avoid possible numerical precision differences
         # between a time in UTC and the same time after a UTC->TAI->UTC conversion
         return np.all(time_1.tai == time_2.tai)
@@ -351,6 +526,7 @@ def _transform_obstime(frame, obstime):
         return new_frame
 
 
+@_matrix_cache
 def _rotation_matrix_hgs_to_hgc(obstime, observer_distance_from_sun):
     """
     Return the rotation matrix from HGS to HGC at the same observation time
@@ -661,13 +837,31 @@ def _rotation_matrix_reprs_to_reprs(start_representation, end_representation):
         # This line works around some input/output quirks of Astropy's rotation_matrix()
         matrix = np.array(rotation_matrix(rotation_angle, rotation_axis.xyz.value.tolist()))
     else:
-        matrix_list = [np.array(rotation_matrix(angle, axis.xyz.value.tolist()))
-                       for angle, axis in zip(rotation_angle, rotation_axis)]
-        matrix = np.stack(matrix_list)
+        matrix = _stacked_rotation_matrix(rotation_angle, rotation_axis)
 
     return matrix
 
 
+def _stacked_rotation_matrix(angle, axis):
+    """
+    Return a stack of matrices for rotations by angles about arbitrary axes, with the same
+    convention as Astropy's `~astropy.coordinates.matrix_utilities.rotation_matrix`, but without
+    calculating each matrix separately.
+    """
+    axis = axis.xyz.value
+    axis = np.moveaxis(axis / np.sqrt(np.sum(axis**2, axis=0)), 0, -1)
+    c = np.cos(angle.to_value(u.rad))[..., np.newaxis, np.newaxis]
+    s = np.sin(angle.to_value(u.rad))[..., np.newaxis, np.newaxis]
+
+    # The matrix is c * I + (1 - c) * outer(axis, axis) - s * cross(axis)
+    x, y, z = axis[..., 0], axis[..., 1], axis[..., 2]
+    zero = np.zeros_like(x)
+    cross = np.stack([np.stack([zero, -z, y], axis=-1),
+                      np.stack([z, zero, -x], axis=-1),
+                      np.stack([-y, x, zero], axis=-1)], axis=-2)
+    return c * np.eye(3) + (1 - c) * axis[..., :, np.newaxis] * axis[..., np.newaxis, :] - s * cross
+
+
 def _rotation_matrix_reprs_to_xz_about_z(representations):
     """
     Return one or more matrices for rotating one or more representations around the Z axis into the
@@ -690,8 +884,8 @@ def _sun_earth_icrf(time):
     """
     Return the Sun-Earth vector for ICRF-based frames.
     """
-    sun_pos_icrs = get_body_barycentric('sun', time)
-    earth_pos_icrs = get_body_barycentric('earth', time)
+    sun_pos_icrs = ephemeris_cache.get_body_barycentric('sun', time)
+    earth_pos_icrs = ephemeris_cache.get_body_barycentric('earth', time)
     return earth_pos_icrs - sun_pos_icrs
 
 
@@ -708,6 +902,7 @@ _SUN_DETILT_MATRIX = _rotation_matrix_reprs_to_reprs(_SOLAR_NORTH_POLE_HCRS,
                                                      CartesianRepresentation(0, 0, 1))
 
 
+@_matrix_cache
 def _affine_params_hcrs_to_hgs(hcrs_time, hgs_time):
     """
     Return the affine parameters (matrix and offset) from HCRS to HGS
@@ -722,8 +917,8 @@ def _affine_params_hcrs_to_hgs(hcrs_time, hgs_time):
     """
     # Determine the Sun-Earth vector in ICRS
     # Since HCRS is ICRS with an origin shift, this is also the Sun-Earth vector in HCRS
-    sun_pos_icrs = get_body_barycentric('sun', hgs_time)
-    earth_pos_icrs = get_body_barycentric('earth', hgs_time)
+    sun_pos_icrs = ephemeris_cache.get_body_barycentric('sun', hgs_time)
+    earth_pos_icrs = ephemeris_cache.get_body_barycentric('earth', hgs_time)
     sun_earth = earth_pos_icrs - sun_pos_icrs
 
     # De-tilt the Sun-Earth vector to the frame with the Sun's rotation axis parallel to the Z axis
@@ -737,7 +932,7 @@ def _affine_params_hcrs_to_hgs(hcrs_time, hgs_time):
     # All of the above is calculated for the HGS observation time
     # If the HCRS observation time is different, calculate the translation in origin
     if not _ignore_sun_motion.get() and np.any(hcrs_time != hgs_time):
-        sun_pos_old_icrs = get_body_barycentric('sun', hcrs_time)
+        sun_pos_old_icrs = ephemeris_cache.get_body_barycentric('sun', hcrs_time)
         offset_icrf = sun_pos_old_icrs - sun_pos_icrs
     else:
         offset_icrf = sun_pos_icrs * 0  # preserves obstime shape
@@ -851,6 +1046,7 @@ def hcc_to_hcc(from_coo, to_frame):
     return hgscoord.transform_to(to_frame)
 
 
+@_matrix_cache
 def _rotation_matrix_hme_to_hee(hmeframe):
     """
     Return the rotation matrix from HME to HEE at the same observation time
@@ -984,12 +1180,13 @@ def gse_to_hee(gsecoord, heeframe):
     return heeframe._replicate(newrepr, obstime=int_coord.obstime)
 
 
+@_matrix_cache
 def _rotation_matrix_gei_to_gse(geiframe):
     """
     Return the rotation matrix from GEI to gse at the same observation time
     """
     # Get the Earth-Sun vector
-    sun = ICRS(get_body_barycentric('sun', geiframe.obstime))
+    sun = ICRS(ephemeris_cache.get_body_barycentric('sun', geiframe.obstime))
     earth_sun_gei = sun.transform_to(geiframe).cartesian
 
     # Go from equatorial to ecliptic
@@ -1053,6 +1250,7 @@ def gse_to_gei(gsecoord, geiframe):
 frame_transform_graph._add_merged_transform(GeocentricSolarEcliptic, GeocentricEarthEquatorial, GeocentricSolarEcliptic)
 
 
+@_matrix_cache
 def _rotation_matrix_hgs_to_hci(obstime):
     """
     Return the rotation matrix from HGS to HCI at the same observation time
@@ -1132,6 +1330,7 @@ def hci_to_hci(from_coo, to_frame):
             transform_to(to_frame)
 
 
+@_matrix_cache
 def _rotation_matrix_obliquity(time):
     """
     Return the rotation matrix from Earth equatorial to ecliptic coordinates
@@ -2,9 +2,12 @@
 Ephemeris calculations using SunPy coordinate frames
 """
 import re
+import threading
+from collections import OrderedDict
 
 import numpy as np
 import requests
+from numpy.polynomial import chebyshev
 
 import astropy.units as u
 from astropy.constants import c as speed_of_light
@@ -14,6 +17,7 @@ from astropy.coordinates import (
     SkyCoord,
     get_body_barycentric,
     get_body_barycentric_posvel,
+    solar_system_ephemeris,
 )
 from astropy.coordinates.representation import (
     CartesianDifferential,
@@ -30,7 +34,185 @@ from sunpy.util.decorators import add_common_docstring
 from .frames import HeliographicStonyhurst
 
 __all__ = ['get_body_heliographic_stonyhurst', 'get_earth',
-           'get_horizons_coord']
+           'get_horizons_coord', 'EphemerisCache', 'ephemeris_cache']
+
+
+class EphemerisCache:
+    """
+    An interpolating cache of the barycentric positions of solar-system bodies.
+
+    The position of each body is tabulated as Chebyshev polynomials over
+    consecutive spans of time ("segments") of 8 days, which are calculated
+    using `~astropy.coordinates.get_body_barycentric` the first time that a
+    time in the segment is requested. When a segment is created, the
+    polynomials are checked against the direct calculation at times between
+    the fitted ones, and if the error is larger than half of ``tolerance``
+    (leaving a margin for the times that are not checked) the segment is not
+    used, so times in it are always calculated directly. Once there are more than ``maxsize``
+    segments, the least recently used ones are discarded.
+
+    Segments are specific to the current
+    `~astropy.coordinates.solar_system_ephemeris`, so changing the ephemeris
+    does not mix positions from different ephemerides. Velocities are never
+    cached.
+
+    The instance `~sunpy.coordinates.ephemeris.ephemeris_cache` is used by
+    `~sunpy.coordinates.get_body_heliographic_stonyhurst` (and hence
+    `~sunpy.coordinates.get_earth`), by the calculations in
+    `sunpy.coordinates.sun` that use the positions of the Sun and the Earth,
+    and by the coordinate transformations that need them.
+
+    Parameters
+    ----------
+    tolerance : `~astropy.units.Quantity`, optional
+        The largest allowed difference between the interpolated position and
+        the direct calculation. Defaults to 1 cm.
+    maxsize : `int`, optional
+        The maximum number of segments to keep across all bodies. Defaults to
+        4096, which is about 90 years for each of the Sun and the Earth.
+    enabled : `bool`, optional
+        If `False`, positions are always calculated directly. Defaults to `True`.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> from sunpy.coordinates.ephemeris import ephemeris_cache
+    >>> ephemeris_cache.tolerance = 1 * u.m  # doctest: +SKIP
+    >>> ephemeris_cache.enabled = False  # doctest: +SKIP
+    """
+    # The length of each segment in days and the number of Chebyshev nodes in it
+    _segment_length = 8
+    _nodes = 16
+
+    def __init__(self, *, tolerance=1*u.cm, maxsize=4096, enabled=True):
+        self._lock = threading.Lock()
+        self._segments = OrderedDict()
+        self.tolerance = tolerance
+        self.maxsize = maxsize
+        self.enabled = enabled
+
+        # Fit at the Chebyshev nodes, and check at the extrema (which include the ends)
+        nodes = np.cos(np.pi * (np.arange(self._nodes) + 0.5) / self._nodes)
+        check = np.cos(np.pi * np.arange(self._nodes + 1) / self._nodes)
+        self._sample_points = np.concatenate([nodes, check])
+        self._fit_matrix = np.linalg.inv(chebyshev.chebvander(nodes, self._nodes - 1)).T
+        self._check_matrix = chebyshev.chebvander(check, self._nodes - 1).T
+
+    @property
+    def tolerance(self):
+        """
+        The largest allowed difference between the interpolated position and
+        the direct calculation. Changing it clears the cache.
+        """
+        return self._tolerance
+
+    @tolerance.setter
+    def tolerance(self, value):
+        self._tolerance = u.Quantity(value, u.m)
+        self.clear()
+
+    def clear(self):
+        """
+        Discard all of the cached segments.
+        """
+        with self._lock:
+            self._segments.clear()
+
+    def get_body_barycentric(self, body, time):
+        """
+        Return the barycentric position of a solar-system body, as
+        `~astropy.coordinates.get_body_barycentric` does.
+
+        Parameters
+        ----------
+        body : `str`
+            The solar-system body.
+        time : `~astropy.time.Time`
+            The time or times.
+
+        Returns
+        -------
+        `~astropy.coordinates.CartesianRepresentation`
+            The barycentric position of the body.
+        """
+        if not self.enabled or not isinstance(body, str):
+            return get_body_barycentric(body, time)
+
+        tdb = time.tdb
+        jd1 = np.ravel(tdb.jd1)
+        jd2 = np.ravel(tdb.jd2)
+        index = np.floor((jd1 + jd2) / self._segment_length).astype(np.int64)
+        unique_index, inverse = np.unique(index, return_inverse=True)
+        segments = self._get_segments(solar_system_ephemeris.get(), body.lower(), unique_index)
+        good = np.array([seg is not None for seg in segments])
+        if not good.any():
+            return get_body_barycentric(body, time)
+
+        unit = next(seg[1] for seg in segments if seg is not None)
+        coefficients = np.stack([seg[0] if seg is not None else np.full((3, self._nodes), np.nan)
+                                 for seg in segments])
+
+        # Position within each segment, scaled to [-1, 1]
+        x = 2 * ((jd1 - index * self._segment_length) + jd2) / self._segment_length - 1
+        xyz = np.einsum('nj,ncj->cn', chebyshev.chebvander(x, self._nodes - 1),
+                        coefficients[inverse])
+
+        direct = ~good[inverse]
+        if direct.any():
+            xyz[:, direct] = get_body_barycentric(body, time.ravel()[direct]).xyz.to_value(unit)
+
+        return CartesianRepresentation(xyz.reshape((3,) + time.shape) * unit)
+
+    def _get_segments(self, ephemeris, body, indices):
+        """
+        Return the (coefficients, unit) of the segments with the given indices,
+        or `None` for segments that do not meet the tolerance.
+        """
+        segments = {}
+        missing = []
+        with self._lock:
+            for i in indices:
+                key = (ephemeris, body, int(i))
+                if key in self._segments:
+                    self._segments.move_to_end(key)
+                    segments[int(i)] = self._segments[key]
+                else:
+                    missing.append(int(i))
+
+        if missing:
+            new_segments = self._create_segments(body, np.array(missing))
+            with self._lock:
+                for i, segment in zip(missing, new_segments):
+                    segments[i] = segment
+                    self._segments[(ephemeris, body, i)] = segment
+                while len(self._segments) > self.maxsize:
+                    self._segments.popitem(last=False)
+
+        return [segments[int(i)] for i in indices]
+
+    def _create_segments(self, body, indices):
+        """
+        Fit the segments with the given indices using the direct calculation.
+        """
+        offsets = (self._sample_points + 1) / 2 * self._segment_length
+        times = Time(np.multiply.outer(indices * self._segment_length, np.ones_like(offsets)),
+                     np.broadcast_to(offsets, (len(indices), len(offsets))),
+                     format='jd', scale='tdb')
+        xyz = get_body_barycentric(body, times).xyz
+        unit = xyz.unit
+        values = xyz.value
+
+        coefficients = values[..., :self._nodes] @ self._fit_matrix
+        error = np.linalg.norm(coefficients @ self._check_matrix - values[..., self._nodes:], axis=0)
+        # The error can be a little larger between the checked times
+        good = np.max(error, axis=-1) <= self.tolerance.to_value(unit) / 2
+        if not good.all():
+            log.debug(f"Not caching {np.count_nonzero(~good)} ephemeris segments for {body} "
+                      "that exceed the tolerance")
+        return [(coefficients[:, i], unit) if good[i] else None for i in range(len(indices))]
+
+
+ephemeris_cache = EphemerisCache()
 
 
 @add_common_docstring(**_variables_for_parse_time_docstring())
@@ -113,7 +295,7 @@ def get_body_heliographic_stonyhurst(body, time='now', observer=None, *, include
         emitted_time = obstime
         delta_light_travel_time = 1.*u.s  # placeholder value
         while np.any(np.fabs(delta_light_travel_time) > 1.0e-8*u.s):
-            body_icrs = get_body_barycentric(body, emitted_time)
+            body_icrs = ephemeris_cache.get_body_barycentric(body, emitted_time)
             distance = (body_icrs - observer_icrs).norm()
             delta_light_travel_time = light_travel_time - distance / speed_of_light
             light_travel_time = distance / speed_of_light
@@ -131,7 +313,7 @@ def get_body_heliographic_stonyhurst(body, time='now', observer=None, *, include
         pos, vel = get_body_barycentric_posvel(body, emitted_time)
         body_icrs = pos.with_differentials(vel.represent_as(CartesianDifferential))
     else:
-        body_icrs = get_body_barycentric(body, emitted_time)
+        body_icrs = ephemeris_cache.get_body_barycentric(body, emitted_time)
 
     body_hgs = ICRS(body_icrs).transform_to(HeliographicStonyhurst(obstime=obstime))
 
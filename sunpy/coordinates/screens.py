@@ -12,6 +12,7 @@ from astropy.coordinates.representation import CartesianRepresentation, UnitSphe
 from sunpy import log
 from sunpy.coordinates import HeliographicStonyhurst, Helioprojective
 from sunpy.coordinates._transformations import _autoapply_diffrot
+from sunpy.sun.models import differential_rotation
 from sunpy.util.decorators import _active_contexts
 from sunpy.util.exceptions import warn_user
 
@@ -45,6 +46,19 @@ class BaseScreen(abc.ABC):
         _active_contexts.reset(self._active_contexts_token)
         Helioprojective._assumed_screen.reset(self._assumed_screen_token)
 
+    @staticmethod
+    def _needs_iteration(frame, screen_obstime):
+        """
+        Return whether the distance to the screen needs to be solved for numerically.
+
+        That is the case only if the screen is being differentially rotated to a different
+        time. A rigid rotation moves the screen as a whole, which is already accounted for by
+        transforming the location that defines the screen to the frame of the coordinate.
+        """
+        rotation_model = _autoapply_diffrot.get()
+        return (rotation_model is not None and rotation_model != 'rigid'
+                and np.any(frame.obstime != screen_obstime))
+
     def _iterate_calculate_distance(self, coord, distance, screen_frame):
         """
         Numerically calculates the distance component to a screen to promote a
@@ -61,6 +75,12 @@ class BaseScreen(abc.ABC):
         guess, we linearly interpolate/extrapolate between the latest guess and the
         closest guess over past iterations to estimate where the shift will be zero.
 
+        If the coordinate has a scalar ``obstime`` and observer, the transformation to
+        the native frame of the screen is a rigid transformation to heliographic
+        Stonyhurst, then the differential rotation, then another rigid transformation.
+        The two rigid transformations are determined once, so each iteration is performed
+        on Cartesian arrays rather than through coordinate transformations.
+
         The maximum number of iterations is hard-coded to 20, but convergence will
         typically take no more than 8 iterations. When working with an array coordinate,
         elements that have converged are skipped in subsequent iterations.
@@ -69,6 +89,7 @@ class BaseScreen(abc.ABC):
         debug_output = log.getEffectiveLevel() <= logging.DEBUG
 
         log.debug("Differentially rotating the screen")
+        calculate_delta = self._delta_function(coord, screen_frame)
         use = np.ones(distance.shape, dtype=bool)
         delta = np.empty_like(distance)
         for niter in range(20):
@@ -90,10 +111,7 @@ class BaseScreen(abc.ABC):
 
             # Calculate the corresponding delta of a 3D->2D->3D transformation in the native frame of the screen
             # If delta is zero in that frame, then the 3D point is exactly on the screen, so the guessed distance is correct
-            other_3d = coord[use].realize_frame(coord[use].represent_as(UnitSphericalRepresentation) * distance[use])
-            native_3d = other_3d.transform_to(screen_frame)
-            native_2d = native_3d.realize_frame(native_3d.represent_as(UnitSphericalRepresentation))
-            delta[use] = self.calculate_distance(native_2d) - native_3d.spherical.distance
+            delta[use] = calculate_delta(distance, use)
 
             # Continue computations on only those elements that do not meet the tolerance
             # A tolerance of 1e-11 is larger than numerical-precision errors (~1e-12), and only 1.5 meters at 1 AU
@@ -116,6 +134,60 @@ class BaseScreen(abc.ABC):
                   "Using the best guess.")
         return distance
 
+    def _delta_function(self, coord, screen_frame):
+        """
+        Return a function that calculates, for the guessed distances of the elements of
+        ``coord`` selected by ``use``, the amount that each 3D point shifts in a 3D->2D->3D
+        transformation in the native frame of the screen.
+        """
+        if not (coord.obstime.isscalar and isinstance(coord.observer, HeliographicStonyhurst)
+                and coord.observer.isscalar and screen_frame.obstime.isscalar):
+            def transform_delta(distance, use):
+                other_3d = coord[use].realize_frame(coord[use].represent_as(UnitSphericalRepresentation) * distance[use])
+                native_3d = other_3d.transform_to(screen_frame)
+                native_2d = native_3d.realize_frame(native_3d.represent_as(UnitSphericalRepresentation))
+                return self.calculate_distance(native_2d) - native_3d.spherical.distance
+            return transform_delta
+
+        hgs_frame = HeliographicStonyhurst(obstime=coord.obstime)
+        to_hgs_matrix, to_hgs_offset = _rigid_transformation(coord, hgs_frame)
+        # The differential rotation is applied separately in HGS at the obstime of the coordinate
+        token = _autoapply_diffrot.set(None)
+        try:
+            to_native_matrix, to_native_offset = _rigid_transformation(hgs_frame, screen_frame)
+        finally:
+            _autoapply_diffrot.reset(token)
+
+        rotation_model = _autoapply_diffrot.get()
+        duration = (screen_frame.obstime - coord.obstime).to('day')
+        direction = coord.represent_as(UnitSphericalRepresentation).to_cartesian().get_xyz().to_value(u.one)
+
+        def cartesian_delta(distance, use):
+            hgs = to_hgs_matrix @ (direction[:, use] * distance[use].to_value(u.m)) + to_hgs_offset
+            latitude = np.arctan2(hgs[2], np.hypot(hgs[0], hgs[1])) * u.rad
+            dlon = differential_rotation(duration, latitude, model=rotation_model,
+                                         frame_time='sidereal').to_value(u.rad)
+            hgs = np.stack([np.cos(dlon) * hgs[0] - np.sin(dlon) * hgs[1],
+                            np.sin(dlon) * hgs[0] + np.cos(dlon) * hgs[1],
+                            hgs[2]])
+            native_3d = CartesianRepresentation((to_native_matrix @ hgs + to_native_offset) * u.m)
+            native_2d = screen_frame.realize_frame(native_3d.represent_as(UnitSphericalRepresentation))
+            return self.calculate_distance(native_2d) - native_3d.norm()
+        return cartesian_delta
+
+
+def _rigid_transformation(from_frame, to_frame):
+    """
+    Return the matrix and the offset (in meters) of a rigid transformation between the
+    Cartesian representations of two frames, determined by transforming four points.
+    """
+    scale = (1*u.AU).to_value(u.m)
+    points = np.hstack([np.zeros((3, 1)), np.eye(3) * scale])
+    xyz = from_frame.realize_frame(CartesianRepresentation(points * u.m)).transform_to(to_frame)
+    xyz = xyz.cartesian.get_xyz().to_value(u.m)
+    offset = xyz[:, :1]
+    return (xyz[:, 1:] - offset) / scale, offset
+
 
 class SphericalScreen(BaseScreen):
     """
@@ -149,7 +221,8 @@ class SphericalScreen(BaseScreen):
     -----
     If this context manager is combined with the :func:`~sunpy.coordinates.propagate_with_solar_surface`
     context manager, significantly more computations are required to numerically solve for the
-    distance to the differentially rotated screen.
+    distance to the differentially rotated screen. No numerical solving is needed for the
+    ``'rigid'`` rotation model.
 
     Examples
     --------
@@ -205,7 +278,7 @@ class SphericalScreen(BaseScreen):
             distance = ((-1*b) + np.sqrt(b**2 - 4*c)) / 2  # use the "far" solution
 
         # Iterate the calculation if differential rotation is being applied
-        if _autoapply_diffrot.get() is not None and np.any(frame.obstime != self._center.obstime):
+        if self._needs_iteration(frame, self._center.obstime):
             screen_frame = Helioprojective(observer=self._center, obstime=self._center.obstime)
             distance = self._iterate_calculate_distance(frame, distance, screen_frame)
 
@@ -242,7 +315,8 @@ class PlanarScreen(BaseScreen):
     -----
     If this context manager is combined with the :func:`~sunpy.coordinates.propagate_with_solar_surface`
     context manager, significantly more computations are required to numerically solve for the
-    distance to the differentially rotated screen.
+    distance to the differentially rotated screen. No numerical solving is needed for the
+    ``'rigid'`` rotation model.
 
     Examples
     --------
@@ -291,7 +365,7 @@ class PlanarScreen(BaseScreen):
         distance = d_from_plane / rep.dot(direction)
 
         # Iterate the calculation if differential rotation is being applied
-        if _autoapply_diffrot.get() is not None and np.any(frame.obstime != self._vantage_point.obstime):
+        if self._needs_iteration(frame, self._vantage_point.obstime):
             screen_frame = Helioprojective(observer=self._vantage_point, obstime=self._vantage_point.obstime)
             distance = self._iterate_calculate_distance(frame, distance, screen_frame)
 
@@ -20,7 +20,6 @@ from astropy.coordinates import (
     Latitude,
     Longitude,
     SkyCoord,
-    get_body_barycentric,
 )
 from astropy.coordinates.builtin_frames.utils import get_jd12
 from astropy.coordinates.representation import CartesianRepresentation, SphericalRepresentation
@@ -32,7 +31,7 @@ from sunpy.time import parse_time
 from sunpy.time.time import _variables_for_parse_time_docstring
 from sunpy.util.decorators import add_common_docstring
 from ._transformations import _SOLAR_NORTH_POLE_HCRS, _SUN_DETILT_MATRIX
-from .ephemeris import get_body_heliographic_stonyhurst, get_earth
+from .ephemeris import ephemeris_cache, get_body_heliographic_stonyhurst
 from .frames import HeliographicStonyhurst
 
 __all__ = [
@@ -95,7 +94,7 @@ def sky_position(t='now', equinox_of_date=True):
 
 
 @u.quantity_input
-def carrington_rotation_time(crot, longitude: u.deg = None):
+def carrington_rotation_time(crot, longitude: u.deg = None, *, fast=False):
     """
     Return the time of a given Carrington rotation.
 
@@ -106,7 +105,7 @@ def carrington_rotation_time(crot, longitude: u.deg = None):
     Inputs can be arrays. If both ``crot`` and ``longitude`` are provided, the
     output shape will be the broadcasted combination.
     The round-trip from this method to `carrington_rotation_number` has
-    absolute errors of < 0.11 seconds.
+    absolute errors of < 1 millisecond.
 
     Parameters
     ----------
@@ -115,21 +114,30 @@ def carrington_rotation_time(crot, longitude: u.deg = None):
     longitude : `~astropy.units.Quantity`
         Carrington longitude(s), which must be > 0 degrees and <= 360 degrees.
         If provided, ``crot`` must be strictly integral.
+    fast : `bool`, optional
+        If True, use the fast mode of `carrington_rotation_number`, which changes the
+        returned times by less than 0.05 seconds. Defaults to False.
 
     Returns
     -------
     `astropy.time.Time`
 
+    Notes
+    -----
+    The time is found by iterating on an estimate until the correction is less than
+    1 millisecond, with all of the elements of an array input being solved at once.
+    Elements that have converged are skipped in subsequent iterations.
+
     Examples
     --------
     >>> from sunpy.coordinates.sun import carrington_rotation_time
     >>> import astropy.units as u
     >>> carrington_rotation_time(2242)
-    <Time object: scale='utc' format='iso' value=2021-03-17 22:31:37.030>
+    <Time object: scale='utc' format='iso' value=2021-03-17 22:31:37.055>
     >>> carrington_rotation_time(2000.25)
-    <Time object: scale='utc' format='iso' value=2003-02-27 02:52:57.315>
+    <Time object: scale='utc' format='iso' value=2003-02-27 02:52:57.373>
     >>> carrington_rotation_time(2000, 270*u.deg)
-    <Time object: scale='utc' format='iso' value=2003-02-27 02:52:57.315>
+    <Time object: scale='utc' format='iso' value=2003-02-27 02:52:57.373>
     """
     crot = crot << u.one
     if longitude is not None:
@@ -142,23 +150,40 @@ def carrington_rotation_time(crot, longitude: u.deg = None):
                 (crot - 1)) + constants.first_carrington_rotation
 
     # The above estimate is inaccurate (see comments below in carrington_rotation_number),
-    # so put the estimate into carrington_rotation_number to determine a correction amount
-    def refine(estimate):
-        crot_estimate = carrington_rotation_number(estimate)
-        dcrot = crot - crot_estimate
-        # Correct the estimate using a linear fraction of the Carrington rotation period
-        return estimate + (dcrot * constants.mean_synodic_period)
-
-    # Perform two iterations of the correction to achieve sub-second accuracy
-    estimate = refine(estimate)
-    estimate = refine(estimate)
-    t = Time(estimate, scale='tt', format='jd').utc
+    # so put the estimate into carrington_rotation_number to determine a correction amount.
+    # The correction is a linear fraction of the Carrington rotation period, and is repeated
+    # until it is small enough.  The elements of an array are corrected at the same time.
+    target = np.ravel(crot.to_value(u.one))
+    estimate = estimate.tt
+    estimate = Time(np.ravel(estimate.jd1), np.ravel(estimate.jd2), format='jd', scale='tt')
+    use = np.ones(target.shape, dtype=bool)
+    for niter in range(_CARRINGTON_MAX_ITERATIONS):
+        index = np.flatnonzero(use)
+        dcrot = target[index] - carrington_rotation_number(estimate[index], fast=fast)
+        correction = dcrot * constants.mean_synodic_period
+        estimate[index] = estimate[index] + correction
+        use[index] = np.abs(correction) >= _CARRINGTON_TOLERANCE
+        log.debug(f"Carrington rotation time: iteration {niter + 1}, "
+                  f"{np.count_nonzero(use)} of {use.size} elements not yet converged")
+        if not use.any():
+            break
+    else:
+        log.debug(f"Carrington rotation time: {np.count_nonzero(use)} elements did not converge "
+                  f"within {_CARRINGTON_MAX_ITERATIONS} iterations")
+
+    t = estimate.reshape(crot.shape).utc
     t.format = 'iso'
     return t
 
 
+# The tolerance and maximum number of iterations for solving for the time of a Carrington
+# rotation.  Convergence typically takes no more than 7 iterations.
+_CARRINGTON_TOLERANCE = 1*u.ms
+_CARRINGTON_MAX_ITERATIONS = 20
+
+
 @add_common_docstring(**_variables_for_parse_time_docstring())
-def carrington_rotation_number(t='now'):
+def carrington_rotation_number(t='now', *, fast=False):
     """
     Return the Carrington rotation number. Each whole rotation number marks when the Sun's prime
     meridian coincides with the central meridian as seen from Earth, with the first rotation
@@ -168,6 +193,9 @@ def carrington_rotation_number(t='now'):
     ----------
     t : {parse_time_types}
         Time to use in a parse-time-compatible format
+    fast : `bool`, optional
+        If True, use the fast mode of `L0`, which changes the rotation number by less than
+        1e-8 (0.02 seconds). Defaults to False.
     """
     time = parse_time(t)
 
@@ -179,7 +207,7 @@ def carrington_rotation_number(t='now'):
 
     # The fractional rotation number from the above estimate is inaccurate, so calculate the actual
     # fractional rotation number from the longitude of the central meridian (L0)
-    actual_frac = 1 - L0(time).to('deg').value / 360
+    actual_frac = 1 - L0(time, fast=fast).to('deg').value / 360
 
     # Calculate any adjustment to the integer rotation number due to wrapping
     wrap_adjustment = np.around(estimate_frac - actual_frac)
@@ -478,7 +506,7 @@ def print_params(t='now'):
 
 
 @add_common_docstring(**_variables_for_parse_time_docstring())
-def B0(time='now'):
+def B0(time='now', *, fast=False):
     """
     Return the B0 angle for the Sun at a specified time, which is the heliographic latitude of the
     of the center of the disk of the Sun as seen from Earth. The range of B0 is +/-7.25 degrees.
@@ -491,13 +519,19 @@ def B0(time='now'):
     ----------
     time : {parse_time_types}
         Time to use in a parse_time-compatible format
+    fast : `bool`, optional
+        If True, interpolate between values calculated at whole days, which is much faster for
+        large arrays of times and has errors of less than 0.01 arcseconds. Defaults to False.
 
     Returns
     -------
     out : `~astropy.coordinates.Latitude`
         The position angle
     """
-    return Latitude(get_earth(time).lat)
+    obstime = parse_time(time)
+    if fast:
+        return Latitude(_interpolate_daily(B0, obstime))
+    return Latitude(_earth_detilt(obstime).represent_as(SphericalRepresentation).lat)
 
 
 # Function returns a SkyCoord's longitude in the de-tilted frame (HCRS rotated so that the Sun's
@@ -507,6 +541,46 @@ def _detilt_lon(coord):
     return coord_detilt.represent_as(SphericalRepresentation).lon.to('deg')
 
 
+def _earth_detilt(obstime):
+    """
+    Return the position of the Earth relative to the Sun in the de-tilted frame.
+
+    This is equivalent to ``get_earth(obstime).hcrs`` followed by the de-tilt, but uses the
+    ephemeris positions directly rather than coordinate transformations.
+    """
+    earth = (ephemeris_cache.get_body_barycentric('earth', obstime)
+             - ephemeris_cache.get_body_barycentric('sun', obstime))
+    return earth.transform(_SUN_DETILT_MATRIX)
+
+
+def _interpolate_daily(func, obstime, *, wrap=None):
+    """
+    Evaluate ``func`` at whole Julian days (TT) and interpolate to ``obstime``.
+
+    ``func`` is called once for all of the days that are needed, so the cost depends on the
+    span of the times rather than on the number of times. The interpolation uses the four days
+    around each time (four-point Lagrange interpolation). If ``wrap`` is provided, the values
+    are angles that wrap with that period.
+    """
+    tt = obstime.tt
+    jd1 = np.ravel(tt.jd1)
+    jd2 = np.ravel(tt.jd2)
+    day = np.floor(jd1 + jd2)
+    x = ((jd1 - day) + jd2)[:, np.newaxis]
+
+    nodes, inverse = np.unique(day[:, np.newaxis] + np.arange(-1, 3), return_inverse=True)
+    values = func(Time(nodes, format='jd', scale='tt'))[inverse.reshape(-1, 4)]
+    if wrap is not None:
+        reference = values[:, 1:2]
+        values = reference + (values - reference + wrap / 2) % wrap - wrap / 2
+
+    weights = np.concatenate([-x * (x - 1) * (x - 2) / 6,
+                              (x + 1) * (x - 1) * (x - 2) / 2,
+                              -(x + 1) * x * (x - 2) / 2,
+                              (x + 1) * x * (x - 1) / 6], axis=1)
+    return np.sum(weights * values, axis=1).reshape(obstime.shape)
+
+
 # J2000.0 epoch
 _J2000 = Time('J2000.0', scale='tt')
 
@@ -525,7 +599,9 @@ _DLON_MERIDIAN = Longitude(_detilt_lon(_NODE) + constants.get('W_0'))
 def L0(time='now',
         light_travel_time_correction=True,
         nearest_point=True,
-        aberration_correction=False):
+        aberration_correction=False,
+        *,
+        fast=False):
     """
     Return the L0 angle for the Sun at a specified time, which is the apparent Carrington longitude
     of the Sun-disk center as seen from Earth.
@@ -545,6 +621,9 @@ def L0(time='now',
         radius). Defaults to True.
     aberration_correction : `bool`
         If True, apply the stellar-aberration correction due to Earth's motion. Defaults to False.
+    fast : `bool`, optional
+        If True, interpolate between values calculated at whole days, which is much faster for
+        large arrays of times and has errors of less than 0.01 arcseconds. Defaults to False.
 
     Returns
     -------
@@ -575,20 +654,25 @@ def L0(time='now',
       `(link) <https://apps.dtic.mil/sti/pdfs/ADA482955.pdf>`__
     """
     obstime = parse_time(time)
-    earth = get_earth(obstime)
+    if fast:
+        def exact(nodes):
+            return L0(nodes, light_travel_time_correction, nearest_point, aberration_correction)
+        return Longitude(_interpolate_daily(exact, obstime, wrap=360*u.deg))
+
+    earth = _earth_detilt(obstime).represent_as(SphericalRepresentation)
 
     # Calculate the de-tilt longitude of the Earth
-    dlon_earth = _detilt_lon(earth)
+    dlon_earth = earth.lon.to('deg')
 
     # Calculate the distance to the nearest point on the Sun's surface
-    distance = earth.radius - constants.radius if nearest_point else earth.radius
+    distance = earth.distance - constants.radius if nearest_point else earth.distance
 
     # Apply a correction for aberration due to Earth motion
     # This expression is an approximation to reduce computations (e.g., it does not account for the
     # inclination of the Sun's rotation axis relative to the ecliptic), but the estimated error is
     # <0.2 arcseconds
     if aberration_correction:
-        dlon_earth -= 20.496*u.arcsec * 1*u.AU / earth.radius
+        dlon_earth -= 20.496*u.arcsec * 1*u.AU / earth.distance
 
     # Antedate the observation time to account for light travel time for the Sun-Earth distance
     antetime = (obstime - distance / speed_of_light) if light_travel_time_correction else obstime
@@ -601,7 +685,7 @@ def L0(time='now',
 
 
 @add_common_docstring(**_variables_for_parse_time_docstring())
-def P(time='now'):
+def P(time='now', *, fast=False):
     """
     Return the position (P) angle for the Sun at a specified time, which is the angle between
     geocentric north and solar north as seen from Earth, measured eastward from geocentric north.
@@ -611,6 +695,10 @@ def P(time='now'):
     ----------
     time : {parse_time_types}
         Time to use in a parse_time-compatible format
+    fast : `bool`, optional
+        If True, interpolate between values calculated at whole days, which is much faster for
+        large arrays of times. The small daily variation of geocentric north is not captured,
+        so the errors are up to 2 arcseconds. Defaults to False.
 
     Returns
     -------
@@ -618,6 +706,8 @@ def P(time='now'):
         The position angle
     """
     obstime = parse_time(time)
+    if fast:
+        return Angle(_interpolate_daily(P, obstime), u.deg)
 
     # Define the frame where its Z axis is aligned with geocentric north
     geocentric = ITRS(obstime=obstime)
@@ -626,7 +716,7 @@ def P(time='now'):
 
 
 @add_common_docstring(**_variables_for_parse_time_docstring())
-def earth_distance(time='now'):
+def earth_distance(time='now', *, fast=False):
     """
     Return the distance between the Sun and the Earth at a specified time.
 
@@ -634,6 +724,9 @@ def earth_distance(time='now'):
     ----------
     time : {parse_time_types}
         Time to use in a parse_time-compatible format
+    fast : `bool`, optional
+        If True, interpolate between values calculated at whole days, which is much faster for
+        large arrays of times and has errors of less than 1 kilometer. Defaults to False.
 
     Returns
     -------
@@ -641,7 +734,10 @@ def earth_distance(time='now'):
         The Sun-Earth distance
     """
     obstime = parse_time(time)
-    vector = get_body_barycentric('earth', obstime) - get_body_barycentric('sun', obstime)
+    if fast:
+        return Distance(_interpolate_daily(earth_distance, obstime))
+    vector = (ephemeris_cache.get_body_barycentric('earth', obstime)
+              - ephemeris_cache.get_body_barycentric('sun', obstime))
     return Distance(vector.norm())
 
 
@@ -6,11 +6,17 @@ from numpy.testing import assert_array_equal
 
 import astropy.units as u
 from astropy.constants import c as speed_of_light
-from astropy.coordinates import SkyCoord, solar_system_ephemeris
+from astropy.coordinates import SkyCoord, get_body_barycentric, solar_system_ephemeris
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.time import Time
 
-from sunpy.coordinates.ephemeris import get_body_heliographic_stonyhurst, get_earth, get_horizons_coord
+from sunpy.coordinates.ephemeris import (
+    EphemerisCache,
+    ephemeris_cache,
+    get_body_heliographic_stonyhurst,
+    get_earth,
+    get_horizons_coord,
+)
 from sunpy.coordinates.tests.strategies import times
 
 # Ensure all of these tests are run on the same parallel worker
@@ -78,6 +84,65 @@ def test_get_earth():
     assert_quantity_allclose(e2.radius, 1.0092561*u.AU, atol=5e-7*u.AU)
 
 
+@pytest.mark.parametrize('body', ['sun', 'earth', 'moon', 'mars'])
+def test_ephemeris_cache_accuracy(body):
+    cache = EphemerisCache()
+    rng = np.random.default_rng(0)
+    times = Time('2000-01-01') + rng.uniform(0, 30 * 365.25, size=(20, 10)) * u.day
+
+    cached = cache.get_body_barycentric(body, times)
+    direct = get_body_barycentric(body, times)
+    assert cached.shape == times.shape
+    assert_quantity_allclose((cached - direct).norm(), 0*u.m, atol=cache.tolerance)
+    assert cached.x.unit == direct.x.unit
+
+    # Scalar times, including ones in segments that have already been created
+    for time in [times[3, 4], Time('1990-05-06 07:08:09')]:
+        cached = cache.get_body_barycentric(body, time)
+        assert cached.shape == ()
+        assert_quantity_allclose((cached - get_body_barycentric(body, time)).norm(), 0*u.m,
+                                 atol=cache.tolerance)
+
+
+def test_ephemeris_cache_lru():
+    cache = EphemerisCache(maxsize=3)
+    times = Time('2020-01-01') + np.arange(10) * cache._segment_length * u.day
+    cache.get_body_barycentric('earth', times)
+    assert len(cache._segments) == 3
+
+    # The most recently used segments are kept
+    cache.get_body_barycentric('earth', times[7])
+    cache.get_body_barycentric('sun', times[0])
+    index = np.floor(times.tdb.jd / cache._segment_length).astype(int)
+    assert [key[1:] for key in cache._segments] == [('earth', index[9]), ('earth', index[7]),
+                                                    ('sun', index[0])]
+
+
+def test_ephemeris_cache_fallback():
+    # No segment can meet a zero tolerance, so every position is calculated directly
+    cache = EphemerisCache(tolerance=0*u.m)
+    times = Time('2020-01-01') + np.arange(5) * u.day
+    assert_array_equal(cache.get_body_barycentric('earth', times).xyz,
+                       get_body_barycentric('earth', times).xyz)
+
+    cache = EphemerisCache(enabled=False)
+    assert_array_equal(cache.get_body_barycentric('earth', times).xyz,
+                       get_body_barycentric('earth', times).xyz)
+    assert len(cache._segments) == 0
+
+
+@pytest.mark.thread_unsafe(reason="disables the global ephemeris cache")
+def test_get_earth_ephemeris_cache():
+    times = Time('2010-01-01') + np.linspace(0, 5000, 50) * u.day
+    cached = get_earth(times)
+    ephemeris_cache.enabled = False
+    try:
+        direct = get_earth(times)
+    finally:
+        ephemeris_cache.enabled = True
+    assert_quantity_allclose(cached.separation_3d(direct), 0*u.m, atol=ephemeris_cache.tolerance)
+
+
 @pytest.mark.remote_data
 def test_get_horizons_coord():
     # Validate against published values from the Astronomical Almanac (2013)
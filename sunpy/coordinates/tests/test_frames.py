@@ -685,3 +685,30 @@ def test_screen_plus_diffrot_array_obstime(screen, only_off_disk):
         for point_2d, point_3d in zip(coord_2d, coord_3d):
             point_2d_3d = point_2d.make_3d()
             assert_quantity_allclose(point_2d_3d.separation_3d(point_3d), 0*u.m, atol=1*u.m)
+
+
+@pytest.mark.parametrize('rotation_model', ['howard', 'rigid'])
+@pytest.mark.parametrize('screen', [SphericalScreen, PlanarScreen])
+def test_screen_plus_diffrot_on_screen(off_limb_coord, screen, rotation_model):
+    new_observer = HeliographicStonyhurst(0*u.deg, 0*u.deg, 1*u.AU, obstime=off_limb_coord.obstime + 1*u.day)
+    with propagate_with_solar_surface(rotation_model), screen(new_observer):
+        olc_3d = off_limb_coord.make_3d()
+
+        # Rotating the 3D points to the time of the screen should put them on the screen
+        native_3d = olc_3d.transform_to(Helioprojective(observer=new_observer, obstime=new_observer.obstime))
+        native_2d = native_3d.realize_frame(native_3d.represent_as(UnitSphericalRepresentation))
+        assert_quantity_allclose(native_2d.make_3d().distance, native_3d.distance, rtol=1e-10)
+
+
+def test_screen_plus_diffrot_matches_transformation(off_limb_coord):
+    # Force the iteration through coordinate transformations by using an array observer
+    new_observer = HeliographicStonyhurst(0*u.deg, 0*u.deg, 1*u.AU, obstime=off_limb_coord.obstime + 1*u.day)
+    array_observer = HeliographicStonyhurst([off_limb_coord.observer.lon] * 3,
+                                            [off_limb_coord.observer.lat] * 3,
+                                            [off_limb_coord.observer.radius] * 3,
+                                            obstime=off_limb_coord.obstime)
+    array_coord = Helioprojective(off_limb_coord.Tx, off_limb_coord.Ty,
+                                  observer=array_observer, obstime=off_limb_coord.obstime)
+    with propagate_with_solar_surface(), SphericalScreen(new_observer):
+        assert_quantity_allclose(off_limb_coord.make_3d().distance, array_coord.make_3d().distance,
+                                 atol=1*u.m)
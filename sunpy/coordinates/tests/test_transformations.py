@@ -36,10 +36,14 @@ from sunpy.coordinates import (
     HelioprojectiveRadial,
     SolarMagnetic,
     SphericalScreen,
+    clear_transformation_cache,
+    disable_transformation_cache,
     propagate_with_solar_surface,
     sun,
     transform_with_sun_center,
+    transformation_cache_info,
 )
+from sunpy.coordinates._transformations import _rotation_matrix_reprs_to_reprs
 from sunpy.coordinates.ephemeris import get_body_heliographic_stonyhurst, get_earth
 from sunpy.coordinates.frames import _J2000
 from sunpy.sun.constants import radius as _RSUN
@@ -1009,6 +1013,33 @@ def test_array_obstime():
     assert isinstance(t2.frame, Helioprojective)
 
 
+def test_rotation_matrix_reprs_to_reprs_array():
+    rng = np.random.default_rng(0)
+    start = CartesianRepresentation(*rng.normal(size=(3, 4, 5)))
+    end = CartesianRepresentation(*rng.normal(size=(3, 4, 5)))
+    matrix = _rotation_matrix_reprs_to_reprs(start, end)
+    assert matrix.shape == (4, 5, 3, 3)
+    for index in np.ndindex(4, 5):
+        expected = _rotation_matrix_reprs_to_reprs(start[index], end[index])
+        np.testing.assert_allclose(matrix[index], expected, atol=1e-15)
+
+
+@pytest.mark.parametrize("frame", [HeliographicCarrington(observer='earth'), HeliocentricInertial(),
+                                   Helioprojective(observer='earth'), Heliocentric(observer='earth')])
+def test_array_obstime_and_observer_matches_loop(frame):
+    # A feature tracked through many frames, each with its own obstime and observer
+    times = Time('2020-01-01') + np.linspace(0, 300, 12) * u.day
+    observer = HeliographicStonyhurst(np.linspace(-50, 50, 12)*u.deg, np.linspace(-7, 7, 12)*u.deg,
+                                      np.linspace(0.3, 1.1, 12)*u.AU, obstime=times)
+    coord = SkyCoord(np.linspace(-500, 500, 12)*u.arcsec, np.linspace(200, -200, 12)*u.arcsec,
+                     frame=Helioprojective(obstime=times, observer=observer))
+
+    batched = coord.transform_to(frame.replicate_without_data(obstime=times))
+    for i in range(len(times)):
+        single = coord[i].transform_to(frame.replicate_without_data(obstime=times[i]))
+        assert_quantity_allclose(batched[i].cartesian.xyz, single.cartesian.xyz, atol=1*u.mm)
+
+
 _frames_wo_observer = [HeliographicStonyhurst, HeliocentricInertial,
                        HeliocentricEarthEcliptic, GeocentricSolarEcliptic,
                        GeocentricEarthEquatorial]
@@ -1234,3 +1265,48 @@ def test_propagate_with_solar_surface():
     assert_quantity_allclose(result4.lon, result1.lon)
     assert_quantity_allclose(result4.lat, result1.lat)
     assert_quantity_allclose(result4.distance, result1.distance)
+
+
+@pytest.mark.parametrize("frame_class", [HeliographicCarrington, HeliocentricInertial,
+                                         HeliocentricEarthEcliptic, GeocentricSolarEcliptic,
+                                         GeocentricEarthEquatorial])
+def test_transformation_cache(frame_class):
+    obstime = Time('2022-03-04 05:06:07')
+    coord = SkyCoord([10, 20]*u.deg, [30, 40]*u.deg, [1, 2]*u.AU,
+                     frame=HeliographicStonyhurst(obstime=obstime))
+    frame = frame_class(obstime=obstime, observer='earth') if frame_class is HeliographicCarrington \
+        else frame_class(obstime=obstime)
+
+    clear_transformation_cache()
+    first = coord.transform_to(frame)
+    info = transformation_cache_info()
+    assert info.misses > 0
+    assert info.currsize > 0
+
+    # Transforming again with an equal obstime uses only cached matrices
+    second = coord.transform_to(frame.replicate_without_data(obstime=Time('2022-03-04 05:06:07')))
+    new_info = transformation_cache_info()
+    assert new_info.misses == info.misses
+    assert new_info.hits > info.hits
+    assert_quantity_allclose(second.cartesian.xyz, first.cartesian.xyz, rtol=0)
+
+    with disable_transformation_cache():
+        uncached = coord.transform_to(frame)
+    assert transformation_cache_info() == new_info
+    assert_quantity_allclose(uncached.cartesian.xyz, first.cartesian.xyz, rtol=0)
+
+    clear_transformation_cache()
+    info = transformation_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_transformation_cache_options():
+    # The cache distinguishes results that depend on the transformation options
+    start = SkyCoord(0*u.deg, 0*u.deg, 0*u.AU, frame=HeliographicStonyhurst(obstime='2001-01-01'))
+    end_frame = HeliographicStonyhurst(obstime='2001-02-01')
+    moved = start.transform_to(end_frame)
+    with transform_with_sun_center():
+        not_moved = start.transform_to(end_frame)
+    assert_quantity_allclose(not_moved.radius, 0*u.AU, atol=1*u.m)
+    assert_quantity_allclose(start.transform_to(end_frame).radius, moved.radius)
+    assert moved.radius > 1e-4*u.AU
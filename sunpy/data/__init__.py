@@ -11,6 +11,7 @@ from sunpy.data.data_manager.storage import SqliteStorage
 from sunpy.util.config import CACHE_DIR
 
 _download_dir = config.get('downloads', 'remote_data_manager_dir')
+_cache_max_size = float(config.get('downloads', 'cache_max_size'))
 
 
 manager = DataManager(
@@ -24,7 +25,8 @@ cache = Cache(
     ParfiveDownloader(),
     SqliteStorage(CACHE_DIR + '/cache.db'),
     CACHE_DIR,
-    expiry=int(config.get('downloads', 'cache_expiry')) * u.day
+    expiry=int(config.get('downloads', 'cache_expiry')) * u.day,
+    max_size=_cache_max_size * u.MB if _cache_max_size > 0 else None,
 )
 
 __all__ = ["EARTH_IMAGE", "manager", "cache"]
@@ -1,16 +1,24 @@
+import os
+import threading
 from pathlib import Path
 from datetime import datetime
+from contextlib import suppress
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from urllib.request import urlopen
 
 import astropy.units as u
 from astropy.time import TimeDelta
 
+from sunpy.data.data_manager.storage import StorageProviderBase
 from sunpy.util.exceptions import warn_user
 from sunpy.util.net import get_filename
 from sunpy.util.util import hash_file
 
 __all__ = ['Cache']
 
+_DownloadOutcome = namedtuple('DownloadOutcome', ['path', 'url', 'cached', 'error'])
+
 
 class Cache:
     """
@@ -27,13 +35,27 @@ class Cache:
     expiry: `astropy.units.quantity.Quantity` or `None`, optional
         The interval after which the cache is invalidated. If the expiry is `None`,
         then the expiry is not checked. Defaults to 10 days.
+    max_size: `astropy.units.quantity.Quantity` or `None`, optional
+        The maximum total size of the files in the cache. When it is exceeded,
+        the least recently used files are removed. If the maximum size is `None`,
+        then the size is not limited. Defaults to `None`. A maximum size can
+        only be used with a storage which implements ``find_all``.
+
+    Notes
+    -----
+    Files with the same content, which are downloaded from different urls, are
+    only stored once.
     """
 
-    def __init__(self, downloader, storage, cache_dir, expiry=10*u.day):
+    def __init__(self, downloader, storage, cache_dir, expiry=10*u.day, max_size=None):
         self._downloader = downloader
         self._storage = storage
         self._cache_dir = Path(cache_dir)
         self._expiry = expiry if expiry is None else TimeDelta(expiry)
+        self._max_size = max_size if max_size is None else max_size.to_value(u.byte)
+        if max_size is not None and type(storage).find_all is StorageProviderBase.find_all:
+            raise ValueError(f"A maximum size can not be used with {type(storage).__name__}, "
+                             "as it does not implement find_all.")
 
     def download(self, urls, namespace='', redownload=False):
         """
@@ -61,7 +83,7 @@ class Cache:
         # Logic plan
         # 1. Check if the file is present in cache by url
         # 2. If present and it has not expired nor redownload, return the file path
-        # 3. If not present or present and (expired or redownload), download the file and update cache
+        # 3. If not present or present and (expired or redownload or removed), download the file and update cache
         #   a. If there is an error from the above steps, we will return the file from the cache if present
         for url in urls:
             cache_details = self._get_by_url(url)
@@ -69,21 +91,27 @@ class Cache:
                 break
         # If we have a cache hit and we do not want to redownload it and its still valid
         # We want to just return the file
-        if cache_details and not redownload and not self._has_expired(cache_details):
+        # The file could have been removed by another process to keep its cache below the maximum size
+        if (cache_details and not redownload and not self._has_expired(cache_details)
+                and Path(cache_details['file_path']).is_file()):
+            self._storage.update_by_key('url', cache_details['url'],
+                                        {'last_used': datetime.now().isoformat()})
             return Path(cache_details['file_path'])
         try:
             file_path, file_hash, url = self._download_and_hash(urls, namespace)
-            # We explicitly check for redownload or expiry:
-            # This isn't needed as it should be caught by the above if statement
-            # but this is more explicit
-            if cache_details and (redownload or self._has_expired(cache_details)):
+            if cache_details:
                 self._storage.delete_by_key('url', cache_details['url'])
+            file_path = self._deduplicate(file_path, file_hash)
+            now = datetime.now().isoformat()
             self._storage.store({
                 'file_hash': file_hash,
                 'file_path': str(file_path),
                 'url': url,
-                'time': datetime.now().isoformat(),
+                'time': now,
+                'last_used': now,
+                'size': file_path.stat().st_size,
              })
+            self._evict(keep={file_path})
             return file_path
         except Exception as e:
             if not cache_details:
@@ -94,6 +122,102 @@ class Cache:
             )
             return Path(cache_details['file_path'])
 
+    def download_many(self, urls, namespace='', redownload=False, max_workers=8):
+        """
+        Downloads several files at the same time.
+
+        The cached details of all of the files are found at once, and the files
+        which are not in the cache are downloaded and hashed concurrently.
+
+        Parameters
+        ----------
+        urls : `list`
+            For each file, a list of urls of the file from different sources or
+            a single url.
+        namespace : `str` or `list` of `str`, optional
+            A namespace to be used for the file names, or one for each file.
+            Defaults to an empty string.
+        redownload : `bool`, optional
+            Whether to skip cache and redownload.
+            Defaults to `False`.
+        max_workers : `int`, optional
+            The maximum number of files that are hashed, or whose names are
+            found, at the same time. Defaults to 8.
+
+        Returns
+        -------
+        `list` of `~collections.namedtuple`
+            For each file, a named tuple with the path to the file (``path``),
+            the url it was downloaded from (``url``), whether it was already in
+            the cache (``cached``) and the exception raised when it could not be
+            downloaded (``error``). If a file could not be downloaded, ``path``
+            is the stale version of the file in the cache, or `None` if it is
+            not in the cache.
+
+        Examples
+        --------
+        >>> from sunpy.data import cache
+        >>> outcomes = cache.download_many(['https://example.com/a.fits',
+        ...                                 'https://example.com/b.fits'])  # doctest: +SKIP
+        >>> [outcome.path for outcome in outcomes if outcome.error is None]  # doctest: +SKIP
+        """
+        files = [[url] if isinstance(url, str | Path) else list(url) for url in urls]
+        namespaces = [namespace] * len(files) if isinstance(namespace, str) else list(namespace)
+        if len(namespaces) != len(files):
+            raise ValueError("There must be a namespace for each file.")
+        # Find the cached details of every url at once
+        cached = self._storage.find_many('url', [str(url) for file_urls in files for url in file_urls])
+        outcomes = [None] * len(files)
+        stale = {}
+        now = datetime.now().isoformat()
+        for i, file_urls in enumerate(files):
+            cache_details = next((cached[str(url)] for url in file_urls if str(url) in cached), None)
+            if (cache_details and not redownload and not self._has_expired(cache_details)
+                    and Path(cache_details['file_path']).is_file()):
+                self._storage.update_by_key('url', cache_details['url'], {'last_used': now})
+                outcomes[i] = _DownloadOutcome(Path(cache_details['file_path']), cache_details['url'],
+                                               True, None)
+            else:
+                stale[i] = cache_details
+
+        results = self._download_and_hash_many({i: files[i] for i in stale},
+                                               {i: namespaces[i] for i in stale}, max_workers)
+        new_details = []
+        file_paths = {}
+        for i, result in results.items():
+            cache_details = stale[i]
+            if isinstance(result, Exception):
+                if not cache_details:
+                    outcomes[i] = _DownloadOutcome(None, None, False, result)
+                    continue
+                warn_user(f"{result!r} \nDue to the above error, you will be working with a "
+                          "stale version of the file in the cache.")
+                outcomes[i] = _DownloadOutcome(Path(cache_details['file_path']), cache_details['url'],
+                                               True, result)
+                continue
+            file_path, file_hash, url = result
+            if cache_details:
+                self._storage.delete_by_key('url', cache_details['url'])
+            # Files with the same content can also be downloaded together
+            if file_hash in file_paths and file_paths[file_hash] != file_path:
+                file_path.unlink()
+                file_path = file_paths[file_hash]
+            else:
+                file_path = self._deduplicate(file_path, file_hash)
+            file_paths[file_hash] = file_path
+            new_details.append({
+                'file_hash': file_hash,
+                'file_path': str(file_path),
+                'url': str(url),
+                'time': now,
+                'last_used': now,
+                'size': file_path.stat().st_size,
+            })
+            outcomes[i] = _DownloadOutcome(file_path, str(url), False, None)
+        self._storage.store_many(new_details)
+        self._evict(keep={outcome.path for outcome in outcomes if outcome.path is not None})
+        return outcomes
+
     def _has_expired(self, details):
         """
         Whether the url corresponding to details in cache has expired or not.
@@ -112,6 +236,91 @@ class Cache:
         time = datetime.fromisoformat(time)
         return self._expiry and datetime.now() - time > self._expiry
 
+    def stats(self):
+        """
+        Returns statistics of the files in the cache.
+
+        This can only be used with a storage which implements ``find_all``.
+
+        Returns
+        -------
+        `dict`
+            The number of files (``'files'``), the number of urls they were
+            downloaded from (``'urls'``), their total size (``'size'``) and the
+            maximum size of the cache (``'max_size'``, which is `None` if the size
+            is not limited).
+
+        Examples
+        --------
+        >>> from sunpy.data import cache
+        >>> cache.stats()  # doctest: +SKIP
+        {'files': 12, 'urls': 13, 'size': <Quantity 402.85 MB>, 'max_size': None}
+        """
+        files = self._files()
+        max_size = None if self._max_size is None else (self._max_size * u.byte).to(u.MB)
+        return {
+            'files': len(files),
+            'urls': sum(len(file['urls']) for file in files.values()),
+            'size': (sum(file['size'] for file in files.values()) * u.byte).to(u.MB),
+            'max_size': max_size,
+        }
+
+    def _files(self):
+        """
+        Returns the size, the time of last use and the urls of each file in the cache.
+        """
+        files = {}
+        for details in self._storage.find_all():
+            file = files.setdefault(details['file_path'], {'size': None, 'last_used': '', 'urls': []})
+            file['urls'].append(details['url'])
+            # Entries stored by older versions do not have a size or a time of last use
+            file['last_used'] = max(file['last_used'], details.get('last_used') or details.get('time', ''))
+            if details.get('size') is not None:
+                file['size'] = int(details['size'])
+        for file_path, file in files.items():
+            if file['size'] is None:
+                path = Path(file_path)
+                file['size'] = path.stat().st_size if path.is_file() else 0
+        return files
+
+    def _deduplicate(self, file_path, file_hash):
+        """
+        Returns the path of a file in the cache with the same content as a
+        downloaded file, and removes the downloaded file.
+
+        If there is no such file, the path of the downloaded file is returned.
+        """
+        existing = self._storage.find_by_key('file_hash', file_hash)
+        if existing is not None:
+            existing_path = Path(existing['file_path'])
+            if existing_path.is_file() and existing_path != Path(file_path):
+                Path(file_path).unlink()
+                return existing_path
+        return Path(file_path)
+
+    def _evict(self, keep=None):
+        """
+        Removes the least recently used files until the cache is below its maximum size.
+
+        Parameters
+        ----------
+        keep : `set` of `pathlib.Path`, optional
+            Files which are not removed, even if they are above the maximum size on their own.
+        """
+        if self._max_size is None:
+            return
+        files = self._files()
+        total = 0
+        for file_path in sorted(files, key=lambda path: files[path]['last_used'], reverse=True):
+            total += files[file_path]['size']
+            if total <= self._max_size or (keep and Path(file_path) in keep):
+                continue
+            for url in files[file_path]['urls']:
+                self._storage.delete_by_key('url', url)
+            # The file could have been removed by another process, or be open on Windows
+            with suppress(OSError):
+                Path(file_path).unlink()
+
     def get_by_hash(self, sha_hash):
         """
         Returns the details which is matched by hash if present in cache.
@@ -123,6 +332,18 @@ class Cache:
         """
         return self._storage.find_by_key('file_hash', sha_hash)
 
+    def _get_many_by_hash(self, sha_hashes):
+        """
+        Returns the details which are matched by several hashes, with the hashes
+        as the keys.
+
+        Parameters
+        ----------
+        sha_hashes : `list` of `str`
+            SHA-256 hashes of the files.
+        """
+        return self._storage.find_many('file_hash', sha_hashes)
+
     def _get_by_url(self, url):
         """
         Returns the details which is matched by url if present in cache.
@@ -152,9 +373,15 @@ class Cache:
         for url in urls:
             try:
                 path = self._cache_dir / (namespace + get_filename(urlopen(url), url))
-
-                self._downloader.download(url, path, overwrite=True)
-                shahash = hash_file(path)
+                # Download to a temporary file, so that another process never
+                # reads a file which is partly downloaded
+                temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.part")
+                try:
+                    self._downloader.download(url, temp_path, overwrite=True)
+                    shahash = hash_file(temp_path)
+                    os.replace(temp_path, path)
+                finally:
+                    temp_path.unlink(missing_ok=True)
                 return path, shahash, url
             except Exception as e:
                 errors.append(e)
@@ -163,3 +390,84 @@ class Cache:
                 raise errors[0]
             msg = "Download failed for all URLs, the first error is shown above."
             raise RuntimeError(msg) from errors[0]
+
+    def _download_and_hash_many(self, files, namespaces, max_workers):
+        """
+        Downloads several files and returns the path, hash, and URL it used to
+        download for each file, or the exception raised if it could not be
+        downloaded.
+
+        Parameters
+        ----------
+        files : `dict`
+            The list of URLs of each file.
+        namespaces : `dict`
+            The namespace of each file, with the same keys as ``files``.
+        max_workers : `int`
+            The maximum number of files that are hashed, or whose names are
+            found, at the same time.
+
+        Returns
+        -------
+        `dict`
+            A `tuple` of the path to the downloaded file, SHA-256 hash and the
+            URL used, or an exception, with the same keys as ``files``.
+        """
+        remaining = {key: list(urls) for key, urls in files.items()}
+        errors = {key: [] for key in files}
+        results = {}
+
+        def get_path(key):
+            url = remaining[key][0]
+            return self._cache_dir / (namespaces[key] + get_filename(urlopen(url), url))
+
+        def hash_and_move(temp_path, path):
+            shahash = hash_file(temp_path)
+            os.replace(temp_path, path)
+            return shahash
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Each round tries the next URL of each file that has not been downloaded
+            while remaining:
+                paths = {}
+                for key, future in [(key, executor.submit(get_path, key)) for key in remaining]:
+                    try:
+                        paths[key] = future.result()
+                    except Exception as e:
+                        errors[key].append(e)
+                # Download to temporary files, so that another process never
+                # reads a file which is partly downloaded
+                temp_paths = {key: path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.part")
+                              for key, path in paths.items()}
+                try:
+                    download_errors = self._downloader.download_many(
+                        [(remaining[key][0], temp_paths[key]) for key in paths])
+                    futures = {}
+                    for key, error in zip(paths, download_errors):
+                        if error is None:
+                            futures[key] = executor.submit(hash_and_move, temp_paths[key], paths[key])
+                        else:
+                            errors[key].append(error)
+                    for key, future in futures.items():
+                        try:
+                            results[key] = paths[key], future.result(), remaining[key][0]
+                        except Exception as e:
+                            errors[key].append(e)
+                finally:
+                    for temp_path in temp_paths.values():
+                        temp_path.unlink(missing_ok=True)
+
+                for key in list(remaining):
+                    remaining[key].pop(0)
+                    if key in results:
+                        del remaining[key]
+                    elif not remaining[key]:
+                        del remaining[key]
+                        if len(errors[key]) == 1:
+                            results[key] = errors[key][0]
+                        else:
+                            msg = "Download failed for all URLs, the first error is shown above."
+                            error = RuntimeError(msg)
+                            error.__cause__ = errors[key][0]
+                            results[key] = error
+        return {key: results[key] for key in files}
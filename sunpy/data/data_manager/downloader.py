@@ -28,6 +28,30 @@ class DownloaderBase(metaclass=ABCMeta):
             DownloaderError is raised when download errors.
         """
 
+    def download_many(self, downloads):
+        """
+        Downloads several files.
+
+        Parameters
+        ----------
+        downloads : `list` of `tuple`
+            The URL of each file and the path where it should be downloaded to.
+
+        Returns
+        -------
+        `list`
+            For each file, the exception raised when it failed to download,
+            or `None` if it was downloaded.
+        """
+        errors = []
+        for url, path in downloads:
+            try:
+                self.download(url, path)
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
+
 
 class DownloaderError(Exception):
     """
@@ -53,3 +77,22 @@ class ParfiveDownloader(DownloaderBase):
             raise DownloaderError from e
         if output.errors:
             raise DownloaderError(output.errors[0].exception)
+
+    def download_many(self, downloads, **kwargs):
+        """
+        Downloads several files at the same time.
+
+        See `~sunpy.data.data_manager.downloader.DownloaderBase.download_many`.
+        """
+        # A file left at one of the paths by an earlier failed download must
+        # not be mistaken for the downloaded file
+        downloader = Downloader(overwrite=True)
+        for url, path in downloads:
+            path = Path(path)
+            downloader.enqueue_file(url, path.parent, path.name, **kwargs)
+        try:
+            output = downloader.download()
+        except Exception as e:
+            return [DownloaderError(e)] * len(downloads)
+        failed = {error.url: DownloaderError(error.exception) for error in output.errors}
+        return [failed.get(url) for url, _ in downloads]
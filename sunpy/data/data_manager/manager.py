@@ -1,8 +1,10 @@
 import pathlib
 import functools
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
+from sunpy.data.data_manager.cache import _DownloadOutcome
 from sunpy.util.exceptions import warn_user
 from sunpy.util.util import hash_file
 
@@ -28,6 +30,8 @@ class DataManager:
         self._skip_hash_check = False
         self._skip_file = {}
         self._require_files = {}
+        # The files required by the decorated functions, for prefetch
+        self._required = {}
 
     def require(self, name, urls, sha_hash, defer_download=False):
         """
@@ -50,6 +54,11 @@ class DataManager:
             urls = [urls]
 
         def decorator(func):
+            self._required[name, self._get_module(func)] = {
+                'urls': urls,
+                'sha_hash': sha_hash,
+            }
+
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
                 self._namespace = self._get_module(func)
@@ -136,6 +145,89 @@ class DataManager:
 
         return pathlib.Path(self._file_cache[name][self._namespace])
 
+    def prefetch(self, names=None, max_workers=8):
+        """
+        Downloads the files required by the decorated functions, before the
+        functions are called.
+
+        The files which are already in the cache are found at once, and the
+        other files are downloaded and checked against their hashes concurrently.
+
+        Parameters
+        ----------
+        names : `list` of `str`, optional
+            The names of the files to download, as provided in
+            `~sunpy.data.data_manager.manager.DataManager.require`.
+            Defaults to all of the required files.
+        max_workers : `int`, optional
+            The maximum number of files that are hashed at the same time.
+            Defaults to 8.
+
+        Returns
+        -------
+        `dict`
+            A named tuple for each file, with the path to the file (``path``),
+            the url it was downloaded from (``url``), whether it was already in
+            the cache (``cached``) and the exception raised when it could not be
+            downloaded or did not match its hash (``error``). The keys are
+            ``(name, package)`` tuples, where ``package`` is the name of the
+            top-level package of the decorated function (or an empty string for
+            functions in ``__main__``), as functions in different packages can
+            require different files with the same name.
+
+        Raises
+        ------
+        `KeyError`
+            If one of ``names`` is not required by any function.
+
+        Examples
+        --------
+        >>> from sunpy.data import manager
+        >>> outcomes = manager.prefetch()  # doctest: +SKIP
+        >>> [name for (name, package), outcome in outcomes.items() if outcome.error]  # doctest: +SKIP
+        """
+        required = self._required
+        if names is not None:
+            required_names = {name for name, _ in self._required}
+            for name in names:
+                if name not in required_names:
+                    raise KeyError(name)
+            required = {key: info for key, info in self._required.items() if key[0] in names}
+
+        # Find the files that are already in the cache by their hashes at once
+        found = self._cache._get_many_by_hash([info['sha_hash'] for info in required.values()])
+        outcomes = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            hashes = {key: executor.submit(hash_file, found[info['sha_hash']]['file_path'])
+                      for key, info in required.items()
+                      if info['sha_hash'] in found and pathlib.Path(found[info['sha_hash']]['file_path']).is_file()}
+            for key, future in hashes.items():
+                # A file which is corrupted is redownloaded
+                details = found[required[key]['sha_hash']]
+                if future.result() == required[key]['sha_hash']:
+                    outcomes[key] = _DownloadOutcome(pathlib.Path(details['file_path']), details['url'],
+                                                     True, None)
+
+            missing = [key for key in required if key not in outcomes]
+            downloaded = self._cache.download_many([required[key]['urls'] for key in missing],
+                                                   namespace=[namespace for _, namespace in missing],
+                                                   redownload=True, max_workers=max_workers)
+            hashes = {key: executor.submit(hash_file, outcome.path)
+                      for key, outcome in zip(missing, downloaded) if outcome.error is None}
+            for key, outcome in zip(missing, downloaded):
+                if key in hashes:
+                    file_hash = hashes[key].result()
+                    if file_hash != required[key]['sha_hash']:
+                        outcome = outcome._replace(error=RuntimeError(
+                            f"Hash of local file ({file_hash}) does not match expected hash "
+                            f"({required[key]['sha_hash']}). File may have changed on the remote server."))
+                outcomes[key] = outcome
+
+        for (name, namespace), outcome in outcomes.items():
+            if outcome.error is None:
+                self._file_cache.setdefault(name, {})[namespace] = outcome.path
+        return {(name, namespace.rstrip('.')): outcomes[name, namespace] for name, namespace in required}
+
     @contextmanager
     def override_file(self, name, uri, sha_hash=None):
         """
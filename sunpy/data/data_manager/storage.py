@@ -3,7 +3,9 @@ Storage module contains the abstract implementation of storage
 for `sunpy.data.data_manager.Cache` and a concrete implementation
 using sqlite.
 """
+import os
 import sqlite3
+import threading
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
 from contextlib import contextmanager
@@ -72,6 +74,85 @@ class StorageProviderBase(metaclass=ABCMeta):
             Details to be stored.
         """
 
+    def update_by_key(self, key, value, details):
+        """
+        Updates some of the details of the matching entries.
+
+        Parameters
+        ----------
+        key : `str`
+            The key/column name of the field.
+        value : `str`
+            The value associated with the key of the entry.
+        details : `dict`
+            The details to change.
+
+        Raises
+        ------
+        ``KeyError``
+            KeyError is raised if key does not exist.
+        """
+        entry = self.find_by_key(key, value)
+        if entry is not None:
+            self.delete_by_key(key, value)
+            self.store({**entry, **details})
+
+    def find_many(self, key, values):
+        """
+        Returns the details of the entries which match any of several values.
+
+        Parameters
+        ----------
+        key : `str`
+            The key/column name of the field.
+        values : iterable of `str`
+            The values associated with the key of the entries.
+
+        Returns
+        -------
+        `dict`
+            The details of an entry for each value that was found, with the values as the keys.
+
+        Raises
+        ------
+        ``KeyError``
+            KeyError is raised if key does not exist.
+        """
+        found = {}
+        for value in values:
+            details = self.find_by_key(key, value)
+            if details is not None:
+                found[value] = details
+        return found
+
+    def store_many(self, details):
+        """
+        Stores the details of several entries in the storage.
+
+        Parameters
+        ----------
+        details : `list` of `dict`
+            Details to be stored.
+        """
+        for entry in details:
+            self.store(entry)
+
+    def find_all(self):
+        """
+        Returns the details of all of the entries in the storage.
+
+        This is used to find the total size of the cache, which is needed to
+        limit it to a maximum size and to report its statistics. Storage
+        providers which do not implement it can still be used by a cache
+        without a maximum size.
+
+        Returns
+        -------
+        `list` of `dict`
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support listing its entries, "
+                                  "which is needed to limit the size of the cache or report its statistics.")
+
 
 class InMemStorage(StorageProviderBase):
     """
@@ -95,39 +176,102 @@ class InMemStorage(StorageProviderBase):
                 return i
         return None
 
+    def update_by_key(self, key, value, details):
+        for i in self._store:
+            if i[key] == value:
+                i.update(details)
+
+    def find_all(self):
+        return list(self._store)
+
 
 class SqliteStorage(StorageProviderBase):
     """
     This provides a sqlite backend for storage.
 
+    Each thread reuses one connection to the database. The database is
+    in write-ahead logging mode by default, so that several processes can
+    read it while another one writes to it.
+
     Parameters
     ----------
     path: `str`
         Path to the database file.
+    journal_mode: `str` or `None`, optional
+        The sqlite journal mode of the database. Write-ahead logging (``"wal"``)
+        does not work for databases on network filesystems, for which this
+        should be set to `None` to keep the sqlite default. Defaults to ``"wal"``.
+    timeout: `float`, optional
+        The time in seconds to wait for another process to finish writing to
+        the database. Defaults to 30 seconds.
     """
     COLUMN_NAMES = [
         'file_hash',
         'file_path',
         'url',
         'time',
+        'last_used',
+        'size',
+    ]
+    INDEXED_COLUMNS = [
+        'file_hash',
+        'url',
     ]
+    # The maximum number of values in one query, below the sqlite limit on variables
+    _BATCH_SIZE = 500
 
-    def __init__(self, path):
+    def __init__(self, path, journal_mode="wal", timeout=30):
         self._db_path = Path(path)
         self._table_name = 'cache_storage'
+        self._journal_mode = journal_mode
+        self._timeout = timeout
+        self._local = threading.local()
 
+        # The database is set up when it is first connected to
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        if not self._db_path.exists():
-            # setup database
-            self._setup()
-
-    def _setup(self):
-        with self.connection(commit=True) as conn:
-            self._create_table(conn)
 
     def _create_table(self, conn):
         schema = ' text, '.join(self.COLUMN_NAMES) + ' text'
         conn.execute(f'''CREATE TABLE IF NOT EXISTS {self._table_name} ({schema})''')
+        # Databases made by older versions do not have all of the columns
+        existing = {row[1] for row in conn.execute(f'PRAGMA table_info({self._table_name})')}
+        for column in self.COLUMN_NAMES:
+            if column not in existing:
+                conn.execute(f'ALTER TABLE {self._table_name} ADD COLUMN {column} text')
+        for column in self.INDEXED_COLUMNS:
+            conn.execute(f'''CREATE INDEX IF NOT EXISTS {self._table_name}_{column}
+                             ON {self._table_name} ({column})''')
+
+    def _row_to_details(self, row):
+        # Columns that were not stored are left out, as in the details that were stored
+        return {key: value for key, value in zip(self.COLUMN_NAMES, row) if value is not None}
+
+    def _connect(self):
+        """
+        Returns the connection of the current thread, which is opened the first time.
+        """
+        conn = getattr(self._local, 'conn', None)
+        # A connection must not be used by a process forked from the one which opened it
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(str(self._db_path), timeout=self._timeout)
+            if self._journal_mode is not None:
+                conn.execute(f'PRAGMA journal_mode={self._journal_mode}')
+            self._create_table(conn)
+            conn.commit()
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def close(self):
+        """
+        Closes the connection of the current thread to the database.
+
+        A new connection is opened when the storage is used again.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.close()
+        self._local.conn = None
 
     @contextmanager
     def connection(self, commit=False):
@@ -139,39 +283,71 @@ class SqliteStorage(StorageProviderBase):
         commit : `bool`
             Whether to commit after successful execution of db command.
         """
-        conn = sqlite3.connect(str(self._db_path))
-        self._create_table(conn)
+        conn = self._connect()
         try:
             yield conn
             if commit:
                 conn.commit()
-        finally:
-            conn.close()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def _check_keys(self, *keys):
+        for key in keys:
+            if key not in self.COLUMN_NAMES:
+                raise KeyError(key)
 
     def find_by_key(self, key, value):
-        if key not in self.COLUMN_NAMES:
-            raise KeyError
+        self._check_keys(key)
         with self.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(f'''SELECT * FROM {self._table_name}
-                                      WHERE {key}="{value}"''')
+            cursor.execute(f'''SELECT {', '.join(self.COLUMN_NAMES)} FROM {self._table_name}
+                                      WHERE {key}=?''', (value,))
             row = cursor.fetchone()
             if row:
-                return dict(zip(self.COLUMN_NAMES, row))
+                return self._row_to_details(row)
             return None
 
+    def find_many(self, key, values):
+        self._check_keys(key)
+        values = list(dict.fromkeys(values))
+        found = {}
+        with self.connection() as conn:
+            for i in range(0, len(values), self._BATCH_SIZE):
+                batch = values[i:i + self._BATCH_SIZE]
+                rows = conn.execute(f'''SELECT {', '.join(self.COLUMN_NAMES)} FROM {self._table_name}
+                                        WHERE {key} IN ({', '.join('?' * len(batch))})''', batch)
+                for row in rows:
+                    details = self._row_to_details(row)
+                    found.setdefault(details[key], details)
+        # In the same order as the values
+        return {value: found[value] for value in values if value in found}
+
+    def find_all(self):
+        with self.connection() as conn:
+            rows = conn.execute(f'''SELECT {', '.join(self.COLUMN_NAMES)}
+                                    FROM {self._table_name}''').fetchall()
+        return [self._row_to_details(row) for row in rows]
+
+    def update_by_key(self, key, value, details):
+        self._check_keys(key, *details)
+        assignments = ', '.join(f'{k}=?' for k in details)
+        with self.connection(commit=True) as conn:
+            conn.execute(f'''UPDATE {self._table_name} SET {assignments}
+                             WHERE {key}=?''', [*details.values(), value])
+
     def delete_by_key(self, key, value):
-        if key not in self.COLUMN_NAMES:
-            raise KeyError
+        self._check_keys(key)
         with self.connection(commit=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute(f'''DELETE FROM {self._table_name}
-                                      WHERE {key}="{value}"''')
+            conn.execute(f'''DELETE FROM {self._table_name}
+                             WHERE {key}=?''', (value,))
 
     def store(self, details):
-        values = [details[k] for k in self.COLUMN_NAMES]
-        placeholder = '?,' * len(values)
-        placeholder = placeholder[:-1]
+        self.store_many([details])
+
+    def store_many(self, details):
+        rows = [[entry.get(k) for k in self.COLUMN_NAMES] for entry in details]
+        placeholder = ','.join('?' * len(self.COLUMN_NAMES))
         with self.connection(commit=True) as conn:
-            conn.execute(f'''INSERT INTO {self._table_name}
-                             VALUES ({placeholder})''', list(values))
+            conn.executemany(f'''INSERT INTO {self._table_name}
+                                 VALUES ({placeholder})''', rows)
@@ -20,6 +20,18 @@ class MockDownloader(DownloaderBase):
         return path
 
 
+class MockUrlDownloader(MockDownloader):
+    """
+    MockDownloader which writes 40 bytes of different contents for each url.
+    """
+
+    def download(self, url, path, **kwargs):
+        write_to_test_file(path, f"{url:<40}")
+        self.times_called += 1
+        self.last_called_url = url
+        return path
+
+
 def write_to_test_file(path, contents):
     with open(path, 'w') as f:
         f.write(contents)
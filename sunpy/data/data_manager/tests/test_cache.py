@@ -1,11 +1,15 @@
+from unittest import mock
 from unittest.mock import patch
 
 import pytest
 
+import astropy.units as u
+
+from sunpy.data.data_manager.cache import Cache
+from sunpy.data.data_manager.storage import SqliteStorage, StorageProviderBase
 from sunpy.util import hash_file
 from sunpy.util.exceptions import SunpyUserWarning
-from .mocks import MOCK_HASH
-
+from .mocks import MOCK_HASH, MockUrlDownloader
 
 pytestmark = pytest.mark.thread_unsafe(reason="uses shared cache")
 
@@ -91,3 +95,147 @@ def test_file_change(cache, mocker):
         #Overwrite == False, so the existing file should not be overwritten
         file_path, file_hash, url = mock_download_and_hash('https://example.com/abc.text', redownload=True)
         assert file_hash == modified_hash
+
+
+@pytest.fixture
+def sized_cache(tmp_path, mocker):
+    m = mock.Mock()
+    m.headers = {'Content-Disposition': 'test_file'}
+    mocker.patch('sunpy.data.data_manager.cache.urlopen', return_value=m)
+    return Cache(MockUrlDownloader(), SqliteStorage(tmp_path / 'cache.db'), tmp_path,
+                 max_size=100*u.byte)
+
+
+def test_cache_max_size(sized_cache):
+    paths = [sized_cache.download(f'https://example.com/file_{i}') for i in range(2)]
+    # Use the first file, so that the second file is the least recently used
+    assert sized_cache.download('https://example.com/file_0') == paths[0]
+    paths.append(sized_cache.download('https://example.com/file_2'))
+
+    assert sized_cache._downloader.times_called == 3
+    assert paths[0].is_file()
+    assert not paths[1].exists()
+    assert paths[2].is_file()
+    assert sized_cache._get_by_url('https://example.com/file_1') is None
+    stats = sized_cache.stats()
+    assert stats['files'] == stats['urls'] == 2
+    assert u.isclose(stats['size'], 80*u.byte)
+    assert u.isclose(stats['max_size'], 100*u.byte)
+
+    # The removed file is downloaded again
+    assert sized_cache.download('https://example.com/file_1') == paths[1]
+    assert sized_cache._downloader.times_called == 4
+    assert not paths[0].exists()
+
+
+def test_cache_max_size_keeps_new_file(tmp_path, sized_cache):
+    sized_cache._max_size = 10
+    path = sized_cache.download('https://example.com/file_0')
+    assert path.is_file()
+    assert sized_cache.stats()['files'] == 1
+
+
+class UnlistableStorage(StorageProviderBase):
+    """
+    A storage written before ``find_all`` was added to the base class.
+    """
+    def __init__(self):
+        self._store = []
+
+    def store(self, details):
+        self._store.append(details)
+
+    def delete_by_key(self, key, value):
+        self._store = [details for details in self._store if details[key] != value]
+
+    def find_by_key(self, key, value):
+        return next((details for details in self._store if details[key] == value), None)
+
+
+def test_cache_storage_without_find_all(tmp_path, downloader, mocker):
+    m = mock.Mock()
+    m.headers = {'Content-Disposition': 'test_file'}
+    mocker.patch('sunpy.data.data_manager.cache.urlopen', return_value=m)
+    cache = Cache(downloader, UnlistableStorage(), tmp_path)
+    path = cache.download('https://example.com/file')
+    assert cache.download('https://example.com/file') == path
+    with pytest.raises(NotImplementedError, match="UnlistableStorage does not support listing"):
+        cache.stats()
+
+    with pytest.raises(ValueError, match="can not be used with UnlistableStorage"):
+        Cache(downloader, UnlistableStorage(), tmp_path, max_size=100*u.byte)
+
+
+def test_cache_deduplicates(cache, tmp_path):
+    # The mock downloader gives the same contents for every url
+    first_path = cache.download('https://example.com/first')
+    second_path = cache.download('https://example.com/second')
+    assert second_path == first_path
+    assert [path.name for path in tmp_path.iterdir()] == ['first']
+    assert cache._get_by_url('https://example.com/second')['file_path'] == str(first_path)
+    stats = cache.stats()
+    assert stats['files'] == 1
+    assert stats['urls'] == 2
+    assert u.isclose(stats['size'], 1*u.byte)
+    assert stats['max_size'] is None
+
+
+def test_cache_removed_file(cache):
+    path = cache.download('https://example.com/abc.text')
+    path.unlink()
+    assert cache.download('https://example.com/abc.text') == path
+    assert path.is_file()
+    assert cache._downloader.times_called == 2
+    assert len(cache._storage.find_all()) == 1
+
+
+def test_cache_download_many(sized_cache, tmp_path):
+    sized_cache._max_size = None
+    m = mock.Mock()
+    m.headers = {}
+
+    def urlopen(url):
+        if 'missing' in url:
+            raise OSError(url)
+        return m
+
+    with patch('sunpy.data.data_manager.cache.urlopen', side_effect=urlopen):
+        first_path = sized_cache.download('https://example.com/file_0')
+        outcomes = sized_cache.download_many([
+            'https://example.com/file_0',
+            'https://example.com/file_1',
+            ['https://example.com/missing_2', 'https://example.com/file_2'],
+            ['https://example.com/missing_3', 'https://example.com/missing_4'],
+        ])
+
+    assert sized_cache._downloader.times_called == 3
+    assert outcomes[0] == (first_path, 'https://example.com/file_0', True, None)
+    assert outcomes[1] == (tmp_path / 'file_1', 'https://example.com/file_1', False, None)
+    assert outcomes[2] == (tmp_path / 'file_2', 'https://example.com/file_2', False, None)
+    assert outcomes[3].path is None
+    assert isinstance(outcomes[3].error, RuntimeError)
+    assert isinstance(outcomes[3].error.__cause__, OSError)
+    assert sized_cache._get_by_url('https://example.com/file_2')['file_path'] == str(outcomes[2].path)
+    assert sized_cache.stats()['files'] == 3
+    assert not list(tmp_path.glob('.*.part'))
+
+
+def test_cache_download_many_namespaces(cache, tmp_path):
+    outcomes = cache.download_many(['https://example.com/file', 'https://example.com/file'],
+                                   namespace=['a.', 'b.'], redownload=True)
+    # The mock downloader gives the same contents for every url, so the second file is removed
+    assert outcomes[0].path == outcomes[1].path == tmp_path / 'a.file'
+    assert [path.name for path in tmp_path.iterdir()] == ['a.file']
+    with pytest.raises(ValueError, match="namespace for each file"):
+        cache.download_many(['https://example.com/file'], namespace=['a.', 'b.'])
+
+
+def test_cache_download_many_stale(cache):
+    path = cache.download('https://example.com/file_name')
+    with patch('sunpy.data.data_manager.cache.hash_file', side_effect=OSError):
+        with pytest.warns(SunpyUserWarning, match="Due to the above error, you"):
+            outcome, = cache.download_many(['https://example.com/file_name'], redownload=True)
+    assert outcome.path == path
+    assert outcome.cached
+    assert isinstance(outcome.error, OSError)
+    assert cache._downloader.times_called == 2
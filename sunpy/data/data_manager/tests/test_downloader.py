@@ -18,3 +18,18 @@ def test_ParfiveDownloader_errors():
         download.return_value = results
         with pytest.raises(DownloaderError, match='TEST_ERROR'):
             downloader.download('https://www.fakewebsite.com', 'test_file')
+
+
+def test_ParfiveDownloader_download_many(tmp_path):
+    downloader = ParfiveDownloader()
+    results = Results()
+    results.errors.append(Error("", "https://www.fakewebsite.com/b", ValueError("TEST_ERROR")))
+    with patch('sunpy.data.data_manager.downloader.Downloader') as Downloader:
+        Downloader.return_value.download.return_value = results
+        errors = downloader.download_many([('https://www.fakewebsite.com/a', tmp_path / 'a'),
+                                           ('https://www.fakewebsite.com/b', tmp_path / 'b')])
+    Downloader.assert_called_once_with(overwrite=True)
+    Downloader.return_value.download.assert_called_once()
+    assert errors[0] is None
+    assert isinstance(errors[1], DownloaderError)
+    assert 'TEST_ERROR' in str(errors[1])
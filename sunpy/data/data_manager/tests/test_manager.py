@@ -282,3 +282,61 @@ def test_file_deleted_redownload(storage, downloader, data_function):
     assert downloader.times_called == 2
     assert len(storage._store) == 1
     assert test_file_path.exists()
+
+
+@pytest.mark.thread_unsafe(reason="uses shared downloader")
+def test_prefetch(manager, storage, downloader, data_function):
+    outcomes = manager.prefetch()
+    assert list(outcomes) == [('test_file', 'sunpy')]
+    outcome = outcomes['test_file', 'sunpy']
+    assert outcome.path.name == 'sunpy.test_file'
+    assert outcome.url == 'url1/test_file'
+    assert not outcome.cached
+    assert outcome.error is None
+    assert downloader.times_called == 1
+
+    # The function uses the file which was prefetched
+    data_function()
+    assert downloader.times_called == 1
+    assert manager.prefetch(['test_file'])['test_file', 'sunpy'].cached
+    assert downloader.times_called == 1
+    assert len(storage._store) == 1
+
+
+@pytest.mark.thread_unsafe(reason="uses shared downloader")
+def test_prefetch_file_tampered(manager, downloader, data_function):
+    manager.prefetch()
+    write_to_test_file(f'{manager._tempdir}/sunpy.test_file', 'b')
+    outcome = manager.prefetch()['test_file', 'sunpy']
+    assert not outcome.cached
+    assert outcome.error is None
+    assert downloader.times_called == 2
+
+
+def test_prefetch_wrong_hash(manager):
+    @manager.require('test_file', ['url1'], 'wrong_hash')
+    def test_foo():
+        pass
+
+    outcome = manager.prefetch()['test_file', 'sunpy']
+    assert isinstance(outcome.error, RuntimeError)
+    assert 'does not match expected hash' in str(outcome.error)
+    with pytest.raises(KeyError):
+        manager.prefetch(['other_file'])
+
+
+@pytest.mark.thread_unsafe(reason="uses shared downloader")
+def test_prefetch_same_name(manager, data_function, mocker):
+    # A function in another package requires a different file with the same name
+    mocker.patch.object(manager, '_get_module', return_value='other.')
+
+    @manager.require('test_file', ['url3/test_file'], MOCK_HASH)
+    def other_function():
+        pass
+
+    outcomes = manager.prefetch()
+    assert set(outcomes) == {('test_file', 'sunpy'), ('test_file', 'other')}
+    assert outcomes['test_file', 'sunpy'].url == 'url1/test_file'
+    assert outcomes['test_file', 'other'].url == 'url3/test_file'
+    assert all(outcome.error is None for outcome in outcomes.values())
+    assert set(manager._file_cache['test_file']) == {'sunpy.', 'other.'}
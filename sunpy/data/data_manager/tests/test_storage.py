@@ -1,5 +1,12 @@
+import multiprocessing
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import pytest
 
+from sunpy.data.data_manager.storage import SqliteStorage
+
 
 def test_find_by_key_success(sqlstorage):
     test_details = {
@@ -41,3 +48,104 @@ def test_delete(sqlstorage):
     sqlstorage.delete_by_key('file_hash', 'hash1')
     details = sqlstorage.find_by_key('file_hash', 'hash1')
     assert details is None
+
+
+def test_update(sqlstorage):
+    sqlstorage.update_by_key('url', 'https://example.com/test_file_1', {'last_used': '2020-01-01T00:00:00'})
+    details = sqlstorage.find_by_key('file_hash', 'hash1')
+    assert details['last_used'] == '2020-01-01T00:00:00'
+    assert details['file_path'] == '/tmp/test_file1'
+    with pytest.raises(KeyError):
+        sqlstorage.update_by_key('url', 'https://example.com/test_file_1', {'key_not': 1})
+
+
+def test_find_all(sqlstorage):
+    assert {details['file_hash'] for details in sqlstorage.find_all()} == {'hash1', 'hash2', 'hash3'}
+
+
+def test_old_database(tmp_path):
+    # A database made by a version without the last_used and size columns
+    path = tmp_path / 'old.db'
+    with sqlite3.connect(path) as conn:
+        conn.execute('CREATE TABLE cache_storage (file_hash text, file_path text, url text, time text)')
+        conn.execute('INSERT INTO cache_storage VALUES ("hash1", "/tmp/test_file1", "url1", "2019-06-17")')
+    conn.close()
+
+    storage = SqliteStorage(path)
+    assert storage.find_by_key('url', 'url1') == {
+        'file_hash': 'hash1', 'file_path': '/tmp/test_file1', 'url': 'url1', 'time': '2019-06-17'}
+    storage.update_by_key('url', 'url1', {'size': '10'})
+    assert storage.find_by_key('url', 'url1')['size'] == '10'
+    with storage.connection() as conn:
+        indexes = {row[1] for row in conn.execute('PRAGMA index_list(cache_storage)')}
+    assert indexes == {'cache_storage_file_hash', 'cache_storage_url'}
+
+
+def test_quoted_value(sqlstorage):
+    details = {'file_hash': 'hash"9', 'file_path': "/tmp/it's", 'url': 'https://example.com/"quoted"'}
+    sqlstorage.store(details)
+    assert sqlstorage.find_by_key('url', 'https://example.com/"quoted"') == details
+    sqlstorage.delete_by_key('file_hash', 'hash"9')
+    assert sqlstorage.find_by_key('url', 'https://example.com/"quoted"') is None
+
+
+def test_store_many_find_many(tmp_path):
+    storage = SqliteStorage(tmp_path / 'storage.db')
+    # More entries than fit in one query
+    entries = [{'file_hash': f'hash{i}', 'file_path': f'/tmp/file{i}', 'url': f'url{i}'}
+               for i in range(1200)]
+    storage.store_many(entries)
+    found = storage.find_many('url', [f'url{i}' for i in range(0, 1300, 2)])
+    assert list(found) == [f'url{i}' for i in range(0, 1200, 2)]
+    assert found['url10'] == entries[10]
+    with pytest.raises(KeyError):
+        storage.find_many('key_not', ['url1'])
+
+
+def test_connection_reused(tmp_path):
+    storage = SqliteStorage(tmp_path / 'storage.db')
+    with storage.connection() as conn:
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+    with storage.connection() as second_conn:
+        assert second_conn is conn
+    other_thread = []
+    thread = threading.Thread(target=lambda: other_thread.append(storage._connect()))
+    thread.start()
+    thread.join()
+    assert other_thread[0] is not conn
+
+    storage.close()
+    with storage.connection() as new_conn:
+        assert new_conn is not conn
+
+
+def test_failed_write_rolled_back(tmp_path):
+    storage = SqliteStorage(tmp_path / 'storage.db')
+    with pytest.raises(ValueError, match="failed"):  # NOQA: PT012
+        with storage.connection(commit=True) as conn:
+            conn.execute("INSERT INTO cache_storage (url) VALUES ('url1')")
+            raise ValueError("failed")
+    storage.store({'url': 'url2'})
+    assert [details['url'] for details in storage.find_all()] == ['url2']
+
+
+def _store_and_find(path, worker, n):
+    storage = SqliteStorage(path)
+    for i in range(n):
+        url = f'url{worker}_{i}'
+        storage.store({'file_hash': f'hash{worker}_{i}', 'url': url})
+        storage.update_by_key('url', url, {'last_used': str(i)})
+        assert storage.find_by_key('url', url)['last_used'] == str(i)
+    storage.store_many([{'url': f'many{worker}_{i}'} for i in range(n)])
+    return len(storage.find_many('url', [f'many{worker}_{i}' for i in range(n)]))
+
+
+@pytest.mark.parametrize('executor_class', [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_concurrent_use(tmp_path, executor_class):
+    path = tmp_path / 'storage.db'
+    nworkers, n = 4, 50
+    kwargs = {'mp_context': multiprocessing.get_context('spawn')} if executor_class is ProcessPoolExecutor else {}
+    with executor_class(nworkers, **kwargs) as executor:
+        futures = [executor.submit(_store_and_find, path, worker, n) for worker in range(nworkers)]
+        assert [future.result() for future in futures] == [n] * nworkers
+    assert len(SqliteStorage(path).find_all()) == 2 * nworkers * n
@@ -1,10 +1,18 @@
 """
 Image resampling methods.
 """
+from functools import partial
+
 import numpy as np
-import scipy.interpolate
 import scipy.ndimage
 
+try:
+    import dask.array
+    DASK_INSTALLED = True
+except ImportError:
+    DASK_INSTALLED = False
+
+from sunpy.image.transform import _map_coordinates_dask, _spline_coefficients_dask
 from sunpy.util.exceptions import warn_user
 
 __all__ = ['resample', 'reshape_image_to_4d_superpixel']
@@ -30,8 +38,8 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
         Dimensions that new `numpy.ndarray` should have.
     method : {``"nearest"``, ``"linear"``, ``"spline"``}, optional
         Method to use for resampling interpolation.
-            * nearest and linear - Uses "n x 1D" interpolations calculated by
-              `scipy.interpolate.interp1d`.
+            * nearest and linear - Uses "n x 1D" interpolations, one axis at
+              a time, without building the full grid of new coordinates.
             * spline - Uses `scipy.ndimage.map_coordinates`
     center : `bool`, optional
         If `False` (default) the interpolation points are at the front edge of the bin.
@@ -46,6 +54,7 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
     -------
     out : `numpy.ndarray`
         A new `numpy.ndarray` which has been resampled to the desired dimensions.
+        If ``orig`` is a `dask.array.Array`, this is also a `dask.array.Array`.
 
     References
     ----------
@@ -72,7 +81,10 @@ def resample(orig, dimensions, method='linear', center=False, minusone=False):
         data = _resample_nearest_linear(orig, dimensions, method,
                                         offset, m1)
     elif method == 'spline':
-        data = _resample_spline(orig, dimensions, offset, m1)
+        if DASK_INSTALLED and isinstance(orig, dask.array.Array):
+            data = _resample_spline_dask(orig, dimensions, offset, m1)
+        else:
+            data = _resample_spline(orig, dimensions, offset, m1)
     else:
         raise UnrecognizedInterpolationMethod(f"Unrecognized interpolation method requested: {method}")
 
@@ -83,6 +95,11 @@ def _resample_nearest_linear(orig, dimensions, method, offset, m1):
     """
     Resample Map using either linear or nearest interpolation.
 
+    The interpolation is separable, so it is done one axis at a time. This
+    gives the same result as `~scipy.interpolate.interpn` (including the
+    extrapolation beyond the edges of the input array), but without building
+    the full grid of new coordinates.
+
     Parameters
     ----------
     orig : array-like
@@ -90,7 +107,7 @@ def _resample_nearest_linear(orig, dimensions, method, offset, m1):
     dimensions : `tuple`
         Dimensions of resampled data.
     method : `str`
-        Interpolation method passed to `~scipy.interpolate.interpn`
+        Interpolation method, either ``"nearest"`` or ``"linear"``.
     offset : `float`
         Either 0 or 0.5, depending on whether interpolation is at the edge or
         centers of bins.
@@ -100,19 +117,40 @@ def _resample_nearest_linear(orig, dimensions, method, offset, m1):
         otherwise ``orig`` is resampled by ``(i-1)/(x-1) * (j-1)/(y-1)``.
         This prevents extrapolation one element beyond bounds of input array.
     """
-    old_coords = [np.arange(i, dtype=float) + offset for i in orig.shape]
-    scale = (orig.shape - m1) / (dimensions - m1)
-    new_coords = [(np.arange(dimensions[i], dtype=float) + offset) * scale[i] for i in
-                  range(len(dimensions))]
-    new_coords = np.stack(np.meshgrid(*new_coords, indexing='ij'), axis=-1)
-    # fill_value = None extrapolates outside the domain
-    new_data = scipy.interpolate.interpn(old_coords, orig, new_coords,
-                                         method=method, bounds_error=False,
-                                         fill_value=None)
-
+    new_data = orig
+    for axis, new_size in enumerate(dimensions):
+        new_data = _resample_axis(new_data, axis, new_size, method, offset, m1)
     return new_data
 
 
+def _resample_axis(orig, axis, new_size, method, offset, m1):
+    """
+    Resample ``orig`` along a single axis using either linear or nearest interpolation.
+
+    The indices and weights follow `~scipy.interpolate.RegularGridInterpolator`.
+    """
+    size = orig.shape[axis]
+    old_coords = np.arange(size, dtype=float) + offset
+    scale = (size - m1) / (new_size - m1)
+    new_coords = (np.arange(new_size, dtype=float) + offset) * scale
+
+    if size == 1:
+        return np.repeat(orig, new_coords.size, axis=axis)
+
+    # Index of the grid point at or below each new coordinate, clipped so that
+    # coordinates beyond the edges are extrapolated from the edge intervals
+    index = np.clip(np.searchsorted(old_coords, new_coords, side='right') - 1, 0, size - 2)
+    weight = (new_coords - old_coords[index]) / (old_coords[index + 1] - old_coords[index])
+
+    if method == 'nearest':
+        return np.take(orig, np.where(weight <= 0.5, index, index + 1), axis=axis)
+
+    # Broadcast the weights along the resampled axis
+    weight = weight.reshape((-1,) + (1,) * (orig.ndim - axis - 1))
+    return (np.take(orig, index, axis=axis) * (1 - weight) +
+            np.take(orig, index + 1, axis=axis) * weight)
+
+
 def _resample_spline(orig, dimensions, offset, m1):
     """
     Resample Map using spline-based interpolation.
@@ -137,6 +175,32 @@ def _resample_spline(orig, dimensions, offset, m1):
     return scipy.ndimage.map_coordinates(orig, newcoords)
 
 
+def _resample_spline_dask(orig, dimensions, offset, m1):
+    """
+    Lazily resample a `dask.array.Array` using spline-based interpolation.
+
+    This gives exactly the same values as `_resample_spline`, but each output
+    chunk only reads the spline coefficients that it needs.
+    """
+    deltas = (np.asarray(orig.shape) - m1) / (dimensions - m1)
+    coordinate_function = partial(_spline_coordinates, offset=offset, deltas=deltas)
+    shape = tuple(int(np.ceil(dim)) for dim in dimensions)
+    chunks = dask.array.core.normalize_chunks(orig.chunksize, shape)
+    # These are the defaults of scipy.ndimage.map_coordinates used by _resample_spline
+    return _map_coordinates_dask(_spline_coefficients_dask(orig, 3), coordinate_function, chunks,
+                                 order=3, cval=0.0, dtype=orig.dtype)
+
+
+def _spline_coordinates(*indices, offset, deltas):
+    """
+    Return the coordinates used by `_resample_spline` on the grid of ``indices``
+    (one array of indices per axis), calculated in the same way.
+    """
+    grid = np.meshgrid(*[np.asarray(i, dtype=np.float64) for i in indices],
+                       indexing='ij', sparse=True)
+    return np.stack(np.broadcast_arrays(*[(g + offset) * d - offset for g, d in zip(grid, deltas)]))
+
+
 def reshape_image_to_4d_superpixel(img, dimensions, offset):
     """
     Re-shape the two-dimensional input image into a four-dimensional array
@@ -177,7 +241,9 @@ def reshape_image_to_4d_superpixel(img, dimensions, offset):
     Parameters
     ----------
     img : `numpy.ndarray`
-        A two-dimensional `numpy.ndarray` of the form ``(y, x)``.
+        A two-dimensional `numpy.ndarray` of the form ``(y, x)``. Any leading
+        dimensions (e.g., a stack of images of the form ``(t, y, x)``) are kept
+        in front of the four superpixel dimensions.
     dimensions : array-like
         A two element array-like object containing integers that describe the
         superpixel summation in the ``(y, x)`` directions.
@@ -195,13 +261,14 @@ def reshape_image_to_4d_superpixel(img, dimensions, offset):
     dimensions = [int(dim) for dim in dimensions]
 
     # New dimensions of the final image
-    na = int(np.floor((img.shape[0] - offset[0]) / dimensions[0]))
-    nb = int(np.floor((img.shape[1] - offset[1]) / dimensions[1]))
+    na = int(np.floor((img.shape[-2] - offset[0]) / dimensions[0]))
+    nb = int(np.floor((img.shape[-1] - offset[1]) / dimensions[1]))
 
     # Reshape up to a higher dimensional array which is useful for higher
     # level operations
-    return (img[int(offset[0]):int(offset[0] + na * dimensions[0]),
-                int(offset[1]):int(offset[1] + nb * dimensions[1])]).reshape(na, dimensions[0], nb, dimensions[1])
+    return (img[..., int(offset[0]):int(offset[0] + na * dimensions[0]),
+                int(offset[1]):int(offset[1] + nb * dimensions[1])]).reshape(
+                    img.shape[:-2] + (na, dimensions[0], nb, dimensions[1]))
 
 
 class UnrecognizedInterpolationMethod(ValueError):
@@ -1,10 +1,11 @@
 
 import numpy as np
 import pytest
+import scipy.interpolate
 
 import astropy.units as u
 
-from sunpy.image.resample import reshape_image_to_4d_superpixel
+from sunpy.image.resample import resample, reshape_image_to_4d_superpixel
 from sunpy.util.exceptions import SunpyUserWarning
 
 
@@ -58,6 +59,27 @@ def test_resample_spline_with_nans_and_inf(nan_data_map,inf_data_map):
         resampled = inf_data_map.resample((64, 64) * u.pix, method='spline')
     assert np.all(np.isnan(resampled.data))
 
+@pytest.mark.parametrize('method', ['nearest', 'linear'])
+@pytest.mark.parametrize('center', [False, True])
+@pytest.mark.parametrize('minusone', [False, True])
+@pytest.mark.parametrize('dimensions', [(5, 23), (40, 8)])
+def test_resample_matches_interpn(method, center, minusone, dimensions):
+    # The separable implementation should match interpolating on the full grid
+    rng = np.random.default_rng(0)
+    orig = rng.random((17, 13))
+    orig[3, 4] = np.nan
+    result = resample(orig, dimensions, method=method, center=center, minusone=minusone)
+
+    offset = 0.5 * center
+    old_coords = [np.arange(n) + offset for n in orig.shape]
+    new_coords = [(np.arange(new) + offset) * (old - minusone) / (new - minusone)
+                  for old, new in zip(orig.shape, dimensions)]
+    expected = scipy.interpolate.interpn(old_coords, orig,
+                                         np.stack(np.meshgrid(*new_coords, indexing='ij'), axis=-1),
+                                         method=method, bounds_error=False, fill_value=None)
+    np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+
 def test_reshape(aia171_test_map, shape):
 
     def _n(a, b, c):
@@ -95,3 +117,5 @@ def test_reshape(aia171_test_map, shape):
     im = reshape_image_to_4d_superpixel(aia171_test_map.data, d, o)
     assert im.shape == (_n(shape[0], o[0], d[0]), d[0],
                         _n(shape[1], o[1], d[1]), d[1])
+    # The reshaping is a view of the input data
+    assert np.shares_memory(im, aia171_test_map.data)
@@ -4,6 +4,7 @@ from matplotlib.figure import Figure
 
 from astropy.coordinates.matrix_utilities import rotation_matrix
 
+import sunpy.image.transform
 from sunpy.data.test import get_test_filepath
 from sunpy.image.transform import _rotation_registry, affine_transform
 from sunpy.tests.helpers import figure_test, skip_opencv, skip_skimage
@@ -11,6 +12,9 @@ from sunpy.util import SunpyUserWarning
 
 _methods_to_marks = {"scikit-image": skip_skimage, "opencv": skip_opencv}
 _rotation_registry_params = [pytest.param(meth, marks=_methods_to_marks.get(meth, [])) for meth in _rotation_registry]
+# The 'scipy-tiled' method gives identical output to the 'scipy' method (see test_scipy_tiled),
+# so it is not plotted separately in the figure tests
+_figure_test_methods = [meth for meth in _rotation_registry if meth != 'scipy-tiled']
 
 # Tolerance for tests
 RTOL = 1.0e-10
@@ -277,12 +281,12 @@ def test_clipping(rot30):
     image = np.ones((20, 20))
     image[4:-4, 4:-4] = 2
 
-    num_methods = len(_rotation_registry.keys())
+    num_methods = len(_figure_test_methods)
 
     fig = Figure(figsize=(12, 2*num_methods))
     axs = fig.subplots(nrows=num_methods, ncols=5)
 
-    for i, method in enumerate(_rotation_registry.keys()):
+    for i, method in enumerate(_figure_test_methods):
         axs[i, 0].imshow(image, vmin=0, vmax=3)
         axs[i, 1].imshow(affine_transform(image, rot30, clip=False, method=method, missing=0),
                          vmin=0, vmax=3)
@@ -311,7 +315,7 @@ def test_nans(rot30):
     image_with_nans[4:-4, 4:-4] = 2
     image_with_nans[9:-9, 9:-9] = np.nan
 
-    num_methods = len(_rotation_registry.keys())
+    num_methods = len(_figure_test_methods)
 
     fig = Figure(figsize=(16, 2*num_methods))
     axs = fig.subplots(nrows=num_methods, ncols=7)
@@ -320,7 +324,7 @@ def test_nans(rot30):
 
     for j in range(6):
         axs[0, j+1].set_title(f'order={j}')
-    for i, method in enumerate(_rotation_registry.keys()):
+    for i, method in enumerate(_figure_test_methods):
         axs[i, 0].imshow(image_with_nans, vmin=-1.1, vmax=1.1)
         for j in range(6):
             if j not in _rotation_registry[method].allowed_orders:
@@ -351,3 +355,42 @@ def test_endian(method, order, rot30):
     rot_swapped = affine_transform(swapped, rot30, order=order, method=method, missing=0)
 
     assert compare_results(rot_native, rot_swapped)
+
+
+@pytest.mark.parametrize('order', range(6))
+@pytest.mark.parametrize('missing', [np.nan, 0])
+@pytest.mark.parametrize('scale', [0.6, 1.0, 1.3])
+def test_scipy_tiled(monkeypatch, original, rot30, order, missing, scale):
+    # Use small tiles so that the image is split into many tiles of different sizes
+    monkeypatch.setattr(sunpy.image.transform, '_TILE_SIZE', 37)
+    image = original.copy()
+    image[100:110, 50:60] = np.nan
+
+    kwargs = dict(order=order, scale=scale, missing=missing, image_center=(40.3, 70.8))
+    expected = affine_transform(image, rot30, method='scipy', **kwargs)
+    result = affine_transform(image, rot30, method='scipy-tiled', **kwargs)
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_scipy_tiled_int(monkeypatch, original, rot30):
+    monkeypatch.setattr(sunpy.image.transform, '_TILE_SIZE', 37)
+    image = original.astype(np.int32)
+    expected = affine_transform(image, rot30, order=3, missing=0, method='scipy')
+    result = affine_transform(image, rot30, order=3, missing=0, method='scipy-tiled')
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize('method', ['scipy', 'scipy-tiled'])
+@pytest.mark.parametrize('order', range(6))
+@pytest.mark.parametrize('missing', [np.nan, 0])
+def test_scipy_dask(original, rot30, method, order, missing):
+    dask_array = pytest.importorskip('dask.array')
+    image = original.copy()
+    image[100:110, 50:60] = np.nan
+
+    kwargs = dict(order=order, scale=0.8, missing=missing, image_center=(40.3, 70.8))
+    expected = affine_transform(image, rot30, method='scipy', **kwargs)
+    result = affine_transform(dask_array.from_array(image, chunks=(60, 45)), rot30, method=method, **kwargs)
+    assert isinstance(result, dask_array.Array)
+    np.testing.assert_array_equal(result.compute(), expected)
@@ -5,12 +5,20 @@ import numbers
 import sys
 import time
 from collections import namedtuple
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
 
 import numpy as np
 import scipy.ndimage
 from scipy.signal import convolve2d
 
+try:
+    import dask
+    import dask.array
+    DASK_INSTALLED = True
+except ImportError:
+    DASK_INSTALLED = False
+
 from sunpy import log
 from sunpy.util.exceptions import warn_user
 
@@ -62,6 +70,14 @@ def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
 
     Notes
     -----
+    If ``image`` is a `dask.array.Array` and ``method`` is ``'scipy'`` or
+    ``'scipy-tiled'``, the output is a `dask.array.Array` with the same chunks,
+    which gives exactly the same values as the ``'scipy'`` method when computed.
+    Each output chunk only reads the part of the input image that it needs. For
+    an ``order`` greater than 1, the spline coefficients are calculated along one
+    full axis of the image at a time, and, if the image contains NaNs, their
+    substitute value (the median of the image) is calculated from the whole image.
+
     For each NaN pixel in the input image, one or more pixels in the output image
     will be set to NaN, with the size of the pixel region affected depending on the
     interpolation order. All currently implemented rotation methods require a
@@ -92,6 +108,10 @@ def affine_transform(image, rmatrix, order=3, scale=1.0, image_center=None,
 
     method = _get_transform_method(method)
 
+    if DASK_INSTALLED and isinstance(image, dask.array.Array) and method in _DASK_ROTATION_METHODS:
+        _check_order(method, order, _rotation_registry[method].allowed_orders)
+        return _rotation_scipy_dask(image, rmatrix, shift, order, missing, clip)
+
     # Transform the image using the appropriate function
     rotated_image = _rotation_registry[method].function(image, rmatrix, shift, order, missing, clip)
 
@@ -106,6 +126,12 @@ def _get_transform_method(method):
     return method
 
 
+def _check_order(name, order, allowed_orders):
+    if order not in allowed_orders:
+        raise ValueError(f"{order} is one of the allowed orders for method '{name}': "
+                         f"{set(allowed_orders)}")
+
+
 def add_rotation_function(name, *, allowed_orders,
                           handles_clipping, handles_image_nans, handles_nan_missing):
     """
@@ -183,9 +209,7 @@ def add_rotation_function(name, *, allowed_orders,
     def decorator(rotation_function):
         @wraps(rotation_function)
         def wrapper(image, matrix, shift, order, missing, clip):
-            if order not in allowed_orders:
-                raise ValueError(f"{order} is one of the allowed orders for method '{name}': "
-                                 f"{set(allowed_orders)}")
+            _check_order(name, order, allowed_orders)
 
             clip_to_use = clip if handles_clipping else False
 
@@ -273,6 +297,9 @@ def add_rotation_function(name, *, allowed_orders,
 _rotation_method = namedtuple('_rotation_method', ['function', 'allowed_orders'])
 _rotation_registry = {}
 
+# The rotation methods that have a lazy implementation for dask arrays
+_DASK_ROTATION_METHODS = {'scipy', 'scipy-tiled'}
+
 
 @add_rotation_function("scipy", allowed_orders=range(6),
                        handles_clipping=False, handles_image_nans=False, handles_nan_missing=True)
@@ -290,6 +317,204 @@ def _rotation_scipy(image, matrix, shift, order, missing, clip):
     return rotated_image
 
 
+# The size in pixels of the square output tiles of the 'scipy-tiled' rotation method
+_TILE_SIZE = 512
+
+
+@add_rotation_function("scipy-tiled", allowed_orders=range(6),
+                       handles_clipping=False, handles_image_nans=False, handles_nan_missing=True)
+def _rotation_scipy_tiled(image, matrix, shift, order, missing, clip):
+    """
+    * Gives exactly the same output as the ``'scipy'`` method, but calculates the
+      output image in independent tiles of 512x512 pixels using a pool of threads
+    * Each tile interpolates with :func:`scipy.ndimage.map_coordinates` from only
+      the part of the input image that it needs, so no temporary arrays the size of
+      the whole image are created for an ``order`` of 0 or 1
+    * For an ``order`` greater than 1, the spline coefficients depend on every pixel
+      of the input image, so they are calculated once for the whole image using
+      :func:`scipy.ndimage.spline_filter`
+    """
+    # The same transposed frame as the 'scipy' method is used throughout
+    image_t = image.T
+    if order > 1:
+        coefficients = scipy.ndimage.spline_filter(image_t, order, output=np.float64, mode='constant')
+    else:
+        coefficients = image_t
+    coordinate_function = partial(_affine_coordinates, matrix=matrix, shift=shift)
+    rotated_image = np.empty(image_t.shape, dtype=image.dtype)
+
+    def rotate_tile(tile):
+        indices = [np.arange(s.start, s.stop) for s in tile]
+        coords = coordinate_function(*indices)
+        window = _interpolation_window(coords, coefficients.shape, order)
+        rotated_image[tile] = _interpolate_tile(coefficients[window], window, coords,
+                                                order, missing, image.dtype)
+
+    tiles = [(slice(i, min(i + _TILE_SIZE, image_t.shape[0])),
+              slice(j, min(j + _TILE_SIZE, image_t.shape[1])))
+             for i in range(0, image_t.shape[0], _TILE_SIZE)
+             for j in range(0, image_t.shape[1], _TILE_SIZE)]
+    with ThreadPoolExecutor() as executor:
+        # Consume the results so that any exception is raised here
+        list(executor.map(rotate_tile, tiles))
+
+    return rotated_image.T
+
+
+def _affine_coordinates(*indices, matrix, shift):
+    """
+    Return the input coordinates of the output pixels on the grid of ``indices``
+    (one array of indices per axis).
+
+    The coordinates are calculated in the same way as
+    :func:`scipy.ndimage.affine_transform` does internally, so that they are
+    bit-for-bit identical.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    shift = np.asarray(shift, dtype=np.float64)
+    grid = np.meshgrid(*[np.asarray(i, dtype=np.float64) for i in indices],
+                       indexing='ij', sparse=True)
+    coords = []
+    for row, offset in zip(matrix, shift):
+        # The shift is the first term of the sum, as it is in scipy
+        total = offset + grid[0] * row[0]
+        for g, m in zip(grid[1:], row[1:]):
+            total = total + g * m
+        coords.append(total)
+    return np.stack(np.broadcast_arrays(*coords))
+
+
+def _interpolation_window(coords, shape, order):
+    """
+    Return the slices of the input array that contain every pixel needed to
+    interpolate at ``coords`` with a spline of ``order``.
+
+    The window is kept non-empty even if all of the coordinates are beyond the input.
+    """
+    # The input pixels that a spline of this order needs around each coordinate
+    halo = order // 2 + 1
+    window = []
+    for c, n in zip(coords, shape):
+        lower = min(max(int(np.floor(np.min(c))) - halo, 0), n - 1)
+        upper = max(min(int(np.floor(np.max(c))) + halo + 2, n), lower + 1)
+        window.append(slice(lower, upper))
+    return tuple(window)
+
+
+def _interpolate_tile(coefficients, window, coords, order, cval, dtype):
+    """
+    Interpolate from ``coefficients``, which are the ``window`` of the full input
+    array, at ``coords``, which are in the pixel coordinates of the full input array.
+    """
+    # Subtracting the integer start of the window from the coordinates is exact
+    coords = coords - np.reshape([w.start for w in window], (-1,) + (1,) * (coords.ndim - 1))
+    return scipy.ndimage.map_coordinates(coefficients, coords, output=dtype, order=order,
+                                         mode='constant', cval=cval, prefilter=False)
+
+
+def _interpolate_dask_tile(coefficients, window, indices, coordinate_function, order, cval, dtype):
+    return _interpolate_tile(coefficients, window, coordinate_function(*indices), order, cval, dtype)
+
+
+def _spline_coefficients_dask(image, order):
+    """
+    Return the spline coefficients of a `dask.array.Array`, which are identical to
+    ``scipy.ndimage.spline_filter(image, order, output=np.float64, mode='constant')``.
+
+    The filter is applied along one full axis at a time, so each chunk only needs
+    to span one axis of the image.
+    """
+    coefficients = image
+    # ``output`` is bound here because it is also a keyword argument of dask's blockwise
+    spline_filter1d = partial(scipy.ndimage.spline_filter1d, output=np.float64)
+    for axis in range(image.ndim):
+        coefficients = coefficients.rechunk({axis: -1}).map_blocks(
+            spline_filter1d, order, axis=axis, mode='constant', dtype=np.float64
+        )
+    return coefficients.rechunk(image.chunks)
+
+
+def _map_coordinates_dask(coefficients, coordinate_function, chunks, order, cval, dtype):
+    """
+    Lazily interpolate from ``coefficients`` onto an output array with ``chunks``.
+
+    ``coordinate_function`` returns the input coordinates of the output pixels
+    on the grid of the indices passed to it (one array of indices per axis). It
+    must be monotonic along each axis, so that the input pixels needed by each
+    output chunk can be found from the corners of the chunk. Each output chunk
+    only depends on the window of ``coefficients`` that it needs.
+    """
+    starts = [np.cumsum((0,) + tuple(c)) for c in chunks]
+    blocks = np.empty(tuple(len(c) for c in chunks), dtype=object)
+    for block_index in np.ndindex(blocks.shape):
+        indices = [np.arange(s[i], s[i + 1]) for s, i in zip(starts, block_index)]
+        corners = coordinate_function(*[idx[[0, -1]] for idx in indices])
+        window = _interpolation_window(corners, coefficients.shape, order)
+        tile = dask.delayed(_interpolate_dask_tile, pure=True)(
+            coefficients[window], window, indices, coordinate_function, order, cval, dtype
+        )
+        blocks[block_index] = dask.array.from_delayed(tile, tuple(len(i) for i in indices),
+                                                      dtype=dtype)
+    return dask.array.block(blocks.tolist())
+
+
+def _rotation_scipy_dask(image, matrix, shift, order, missing, clip):
+    """
+    Lazily rotate a `dask.array.Array`, giving exactly the same values as the
+    ``'scipy'`` method including the handling provided by `add_rotation_function`.
+    """
+    # The same transposed frame as the 'scipy' method is used throughout
+    image_t = image.T
+    chunks = image_t.chunks
+    coordinate_function = partial(_affine_coordinates, matrix=matrix, shift=shift)
+    handles_nans = np.issubdtype(image.dtype, np.floating)
+
+    if handles_nans:
+        isnan = dask.array.isnan(image_t)
+        if order > 1:
+            substitute = dask.array.from_delayed(dask.delayed(np.nanmedian)(image_t),
+                                                 shape=(), dtype=image.dtype)
+        else:
+            # At these orders, every output pixel that depends on the substitute
+            # value is set to NaN afterwards, so the value does not matter
+            substitute = 0
+        # NaNs are only substituted (and infinities made finite) if there are NaNs
+        image_to_use = dask.array.where(isnan.any(),
+                                        dask.array.where(isnan, substitute,
+                                                         dask.array.nan_to_num(image_t)),
+                                        image_t)
+    else:
+        image_to_use = image_t
+
+    coefficients = _spline_coefficients_dask(image_to_use, order) if order > 1 else image_to_use
+    rotated_image = _map_coordinates_dask(coefficients, coordinate_function, chunks,
+                                          order, missing, image.dtype)
+
+    if handles_nans:
+        # Use a convolution to find all pixels that are appreciably affected by NaNs
+        # (see add_rotation_function for the sizes)
+        size = [1, 1, 5, 5, 7, 7][order]
+        expanded_nans = isnan.astype(float).map_overlap(convolve2d, depth=size // 2, boundary=0,
+                                                        in2=np.ones((size, size)), mode='same')
+        rotated_nans = _map_coordinates_dask(expanded_nans, coordinate_function, chunks,
+                                             min(order, 1), 0, expanded_nans.dtype)
+        rotated_image = dask.array.where(rotated_nans > 0, np.nan, rotated_image)
+
+    if clip:
+        # Clip the image to the input range in the same way as add_rotation_function
+        if np.isnan(missing):
+            lower = dask.array.nanmin(image_t)
+            upper = dask.array.nanmax(image_t)
+        else:
+            lower = np.fmin(np.maximum(missing, dask.array.nanmin(rotated_image)),
+                            dask.array.nanmin(image_t))
+            upper = np.fmax(np.minimum(missing, dask.array.nanmax(rotated_image)),
+                            dask.array.nanmax(image_t))
+        rotated_image = np.minimum(np.maximum(rotated_image, lower), upper).astype(image.dtype)
+
+    return rotated_image.T
+
+
 @add_rotation_function("scikit-image", allowed_orders=range(6),
                        handles_clipping=False, handles_image_nans=False, handles_nan_missing=False)
 def _rotation_skimage(image, matrix, shift, order, missing, clip):
@@ -30,6 +30,8 @@ import re
 import sys
 import traceback
 
+import numpy as np
+
 from astropy.io import fits
 
 from sunpy.io._header import FileHeader
@@ -39,7 +41,7 @@ from sunpy.util.io import HDPair
 __all__ = ['header_to_fits', 'read', 'get_header', 'write', 'extract_waveunit', 'format_comments_and_history']
 
 
-def read(filepath, hdus=None, memmap=None, **kwargs):
+def read(filepath, hdus=None, memmap=None, lazy=False, **kwargs):
     """
     Read a fits file.
 
@@ -49,6 +51,11 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
         The fits file to be read.
     hdus : `int` or iterable
         The HDU indexes to read from the file.
+    lazy : `bool`, optional
+        If `True`, only the headers are read and the data of each image HDU is
+        returned as a `dask.array.Array` which reads the data from the file
+        when it is computed. The data of any non-image HDUs is returned as
+        `None`. Requires ``dask`` to be installed. Defaults to `False`.
     **kwargs : `dict`, optional
         Passed to `astropy.io.fits.open`.
 
@@ -66,11 +73,14 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
     "comment" key in the returned FileHeader.
     """
     with fits.open(filepath, ignore_blank=True, memmap=memmap, **kwargs) as hdulist:
+        indices = list(range(len(hdulist)))
         if hdus is not None:
             if isinstance(hdus, int):
                 hdulist = hdulist[hdus]
+                indices = [indices[hdus]]
             elif isinstance(hdus, collections.abc.Iterable):
                 hdulist = [hdulist[i] for i in hdus]
+                indices = [indices[i] for i in hdus]
 
         hdulist = fits.hdu.HDUList(hdulist)
         for h in hdulist:
@@ -81,7 +91,11 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
 
         for i, (hdu, header) in enumerate(zip(hdulist, headers)):
             try:
-                pairs.append(HDPair(hdu.data, header))
+                if lazy:
+                    data = _lazy_hdu_data(filepath, indices[i], hdu, memmap=memmap, **kwargs)
+                else:
+                    data = hdu.data
+                pairs.append(HDPair(data, header))
             except (KeyError, ValueError) as e:
                 message = f"Error when reading HDU {i}. Skipping.\n"
                 for line in traceback.format_tb(sys.exc_info()[2]):
@@ -93,6 +107,69 @@ def read(filepath, hdus=None, memmap=None, **kwargs):
     return pairs
 
 
+def _image_dtype(hdu):
+    """
+    Return the dtype of the data of an image HDU, as it would be returned by
+    `astropy.io.fits`, without reading the data.
+
+    The dtype is always returned in the native byte order.
+    """
+    bitpix = hdu.header['BITPIX']
+    bscale = hdu.header.get('BSCALE', 1)
+    bzero = hdu.header.get('BZERO', 0)
+    if bitpix < 0 or (bscale == 1 and bzero == 0):
+        return np.dtype(fits.hdu.base.BITPIX2DTYPE[bitpix])
+    # This mirrors the handling of scaled integer data by astropy.io.fits
+    if bscale == 1:
+        if bitpix == 8 and bzero == -128:
+            return np.dtype('int8')
+        if bitpix in (16, 32, 64) and bzero == 1 << (bitpix - 1):
+            return np.dtype(f'uint{bitpix}')
+    return np.dtype('float64') if bitpix > 16 else np.dtype('float32')
+
+
+class _DeferredHDUData:
+    """
+    An array-like stand-in for the data of one image HDU in a file.
+
+    The file is only opened when the object is indexed, and only the requested
+    part of the data is read where the file can be memory mapped.
+    """
+    def __init__(self, filepath, index, shape, dtype, memmap=None, **kwargs):
+        self.filepath = filepath
+        self.index = index
+        self.shape = shape
+        self.dtype = dtype
+        self.ndim = len(shape)
+        # Memory map by default so that slices do not read the whole HDU
+        self.memmap = True if memmap is None else memmap
+        self.kwargs = kwargs
+
+    def __getitem__(self, item):
+        with fits.open(self.filepath, ignore_blank=True, memmap=self.memmap, **self.kwargs) as hdulist:
+            hdu = hdulist[self.index]
+            hdu.verify('silentfix')
+            # Copy so that the data remains valid once the file is closed
+            return np.array(hdu.data[item], dtype=self.dtype)
+
+
+def _lazy_hdu_data(filepath, index, hdu, memmap=None, **kwargs):
+    """
+    Create a `dask.array.Array` for the data of a HDU without reading it.
+
+    Returns `None` for HDUs which are not images.
+    """
+    if not hdu.is_image or not hdu.shape:
+        return None
+    import dask.array
+
+    shape = hdu.shape
+    dtype = _image_dtype(hdu)
+    deferred = _DeferredHDUData(os.fspath(filepath), index, shape, dtype, memmap=memmap, **kwargs)
+    return dask.array.from_array(deferred, chunks=-1, name=False,
+                                 meta=np.empty((0,) * len(shape), dtype=dtype))
+
+
 def get_header(afile):
     """
     Read a fits file and return just the headers for all HDU's.
@@ -34,6 +34,36 @@ def test_read_hdus(fname, hdus, length):
     assert len(pairs) == length
 
 
+@pytest.mark.parametrize('hdus', [None, 0, [0, 1]])
+def test_read_lazy(hdus):
+    pytest.importorskip('dask')
+    eager_pairs = _fits.read(TEST_RHESSI_IMAGE, hdus=hdus)
+    lazy_pairs = _fits.read(TEST_RHESSI_IMAGE, hdus=hdus, lazy=True)
+    assert len(lazy_pairs) == len(eager_pairs)
+    for (eager_data, eager_header), (lazy_data, lazy_header) in zip(eager_pairs, lazy_pairs):
+        assert dict(lazy_header) == dict(eager_header)
+        if eager_data.dtype.names is None:
+            assert lazy_data.shape == eager_data.shape
+            assert lazy_data.dtype == eager_data.dtype.newbyteorder('=')
+            np.testing.assert_array_equal(lazy_data.compute(), eager_data)
+        else:
+            # The data of table HDUs is not read
+            assert lazy_data is None
+
+
+def test_read_lazy_compressed(tmpdir):
+    pytest.importorskip('dask')
+    data, header = _fits.read(TEST_AIA_IMAGE)[0]
+    outfile = str(tmpdir / "test.fits")
+    _fits.write(outfile, data, header, hdu_type=fits.CompImageHDU)
+
+    eager_data = _fits.read(outfile)[1][0]
+    lazy_data = _fits.read(outfile, lazy=True)[1][0]
+    assert lazy_data.dtype == eager_data.dtype.newbyteorder('=')
+    np.testing.assert_array_equal(lazy_data.compute(), eager_data)
+    np.testing.assert_array_equal(lazy_data[10:20, 30:40].compute(), eager_data[10:20, 30:40])
+
+
 @pytest.mark.parametrize(
     ('fname', 'waveunit'),
     [(TEST_RHESSI_IMAGE, None),
@@ -1,7 +1,7 @@
 import os
 import pathlib
 from collections import OrderedDict
-from functools import singledispatchmethod
+from functools import partial, singledispatchmethod
 from urllib.request import Request
 
 import fsspec
@@ -26,7 +26,14 @@ from sunpy.util.datatype_factory_base import (
     ValidationFunctionError,
 )
 from sunpy.util.exceptions import NoMapsInFileError, warn_user
-from sunpy.util.io import expand_fsspec_open_file, is_uri, is_url, parse_path, possibly_a_path
+from sunpy.util.io import (
+    expand_fsspec_open_file,
+    expand_path_args,
+    is_uri,
+    is_url,
+    parse_path,
+    possibly_a_path,
+)
 from sunpy.util.metadata import MetaDict
 
 SUPPORTED_ARRAY_TYPES = (np.ndarray,)
@@ -34,8 +41,9 @@ try:
     import dask.array
 
     SUPPORTED_ARRAY_TYPES += (dask.array.Array,)
+    DASK_INSTALLED = True
 except ImportError:
-    pass
+    DASK_INSTALLED = False
 
 __all__ = ["Map", "MapFactory"]
 
@@ -71,6 +79,11 @@ class MapFactory(BasicRegistrationFactory):
     composite : `bool`, optional
         Return a `sunpy.map.CompositeMap` object comprised of all the parsed maps.
 
+    lazy : `bool`, optional
+        Only read the headers of FITS files, and back each map with a
+        `dask.array.Array` which reads the data from the file when it is computed.
+        Requires ``dask`` to be installed.
+
     Returns
     -------
     `sunpy.map.GenericMap`
@@ -97,9 +110,12 @@ class MapFactory(BasicRegistrationFactory):
     >>> mymap = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE)  # doctest: +REMOTE_DATA +IGNORE_WARNINGS
     """
 
-    def _read_file(self, fname, **kwargs):
+    def _read_file(self, fname, lazy=False, **kwargs):
         """
         Read in a file name and return the list of (data, meta) pairs in that file.
+
+        If ``lazy`` is `True`, the data of FITS files is not read, see
+        `sunpy.io._fits.read`. Other file types are always read in full.
         """
         # File gets read here. This needs to be generic enough to seamlessly
         # call a fits file or a jpeg2k file, etc
@@ -118,14 +134,17 @@ class MapFactory(BasicRegistrationFactory):
                     pairs = [value for value in af.tree.values() if isinstance(value, GenericMap)]
                     return pairs
             else:
+                if lazy and filetype == "fits":
+                    kwargs["lazy"] = True
+                elif lazy:
+                    log.debug(f"Lazy loading is not supported for {filetype} files, reading {fname} in full")
                 pairs = read_file(os.fspath(fname), filetype=filetype, **kwargs)
         except Exception as e:
             msg = f"Failed to read {fname}\n{e}"
             if kwargs.get("allow_errors"):
                 warn_user(msg)
                 return []
-            msg += "\n If you want to bypass these errors, pass `allow_errors=True`."
-            raise OSError(msg) from e
+            raise _FileReadError(msg) from e
 
         new_pairs = []
         for pair in pairs:
@@ -153,7 +172,8 @@ class MapFactory(BasicRegistrationFactory):
         else:
             return False
 
-    def _parse_args(self, *args, allow_errors=False, **kwargs):
+    def _parse_args(self, *args, allow_errors=False, lazy=False, workers=None, executor=None,
+                    **kwargs):
         """
         Parses an args list into data-header pairs.
 
@@ -224,12 +244,31 @@ class MapFactory(BasicRegistrationFactory):
             else:
                 parsed_args.append(arg)
 
+        if workers is not None or executor is not None:
+            # Expand directories and globs so that every file is read in its own task
+            parsed_args = expand_path_args(parsed_args)
+            # Errors are returned by the workers rather than turned into warnings
+            # there, as warnings in a worker process would not reach the caller
+            outcomes = self._map_concurrently(partial(_parse_arg_in_worker, self, allow_errors=False,
+                                                      lazy=lazy, **kwargs),
+                                              parsed_args, workers=workers, executor=executor)
+        else:
+            outcomes = [(None, None)] * len(parsed_args)
+
         # Parse the arguments
         # Note that this list can also contain GenericMaps if they are directly given to the factory
         data_header_pairs = []
-        for arg in parsed_args:
+        for arg, (pairs, error) in zip(parsed_args, outcomes):
             try:
-                data_header_pairs += self._parse_arg(arg, allow_errors=allow_errors, **kwargs)
+                if error is not None:
+                    raise error
+                if pairs is None:
+                    pairs = self._parse_arg(arg, allow_errors=allow_errors, lazy=lazy, **kwargs)
+                data_header_pairs += pairs
+            except _FileReadError as e:
+                if not allow_errors:
+                    raise
+                warn_user(e.args[0])
             except NoMapsInFileError as e:
                 if not allow_errors:
                     raise
@@ -278,7 +317,8 @@ class MapFactory(BasicRegistrationFactory):
         # use fsspec for everything, but for now we parse the URI through
         return self._read_file(arg.full_name, **kwargs)
 
-    def __call__(self, *args, composite=False, sequence=False, allow_errors=False, **kwargs):
+    def __call__(self, *args, composite=False, sequence=False, allow_errors=False, lazy=False,
+                 workers=None, executor=None, **kwargs):
         """Method for running the factory. Takes arbitrary arguments and
         keyword arguments and passes them to a sequence of pre-registered types
         to determine which is the correct Map-type to build.
@@ -298,13 +338,30 @@ class MapFactory(BasicRegistrationFactory):
         allow_errors : `bool`, optional
             If set, bypass data-header pairs or files which cause an exception and warn instead.
             Defaults to `False`.
+        lazy : `bool`, optional
+            If set, only the headers of FITS files are read and the data of each map
+            is a `dask.array.Array` that is read from the file when it is computed.
+            Requires ``dask`` to be installed.
+            Defaults to `False`.
+        workers : `int`, optional
+            If given, files are read concurrently using a thread pool with this
+            many threads. The order of the returned maps does not depend on the
+            order in which the files finish reading.
+        executor : `concurrent.futures.Executor`, optional
+            An executor to read the files concurrently with, instead of creating
+            a thread pool. This can be a `~concurrent.futures.ProcessPoolExecutor`,
+            which does not share the Python interpreter lock, in which case all
+            inputs and keyword arguments must be picklable.
 
         Notes
         -----
         Extra keyword arguments are passed through to `sunpy.io._file_tools.read_file` such as
         ``memmap`` for FITS files.
         """
-        data_header_pairs = self._parse_args(*args, allow_errors=allow_errors, **kwargs)
+        if lazy and not DASK_INSTALLED:
+            raise ImportError("Creating maps with lazy=True requires dask to be installed.")
+        data_header_pairs = self._parse_args(*args, allow_errors=allow_errors, lazy=lazy,
+                                             workers=workers, executor=executor, **kwargs)
         new_maps = list()
 
         # Loop over each registered type and check to see if WidgetType
@@ -369,6 +426,21 @@ class MapFactory(BasicRegistrationFactory):
         return WidgetType(data, meta, **kwargs)
 
 
+def _parse_arg_in_worker(factory, arg, **kwargs):
+    # A module level function, so that it can be pickled and sent to a process pool
+    return factory._parse_arg(arg, **kwargs)
+
+
+class _FileReadError(OSError):
+    """
+    Exception to raise when a file can not be read, which is a warning instead
+    if ``allow_errors`` is set.
+    """
+
+    def __str__(self):
+        return f"{self.args[0]}\n If you want to bypass these errors, pass `allow_errors=True`."
+
+
 class InvalidMapInput(ValueError):
     """Exception to raise when input variable is not a Map instance and does
     not point to a valid Map input file."""
@@ -141,11 +141,11 @@ class GenericMap(NDData):
     +-------------------+------------------------------------+
     | Method            | Preserve laziness with Dask Arrays |
     +===================+====================================+
-    | `reproject_to`    | No                                 |
+    | `reproject_to`    | Yes                                |
     +-------------------+------------------------------------+
-    | `resample`        | No                                 |
+    | `resample`        | Yes                                |
     +-------------------+------------------------------------+
-    | `rotate`          | No                                 |
+    | `rotate`          | Yes, for the scipy methods         |
     +-------------------+------------------------------------+
     | `max`             | Yes                                |
     +-------------------+------------------------------------+
@@ -604,7 +604,43 @@ class GenericMap(NDData):
 
     @property
     def _meta_hash(self):
-        return self.meta.item_hash()
+        # The revision changes on every mutation of the MetaDict, so this is
+        # much cheaper than hashing all of the items on every access
+        return self.meta.revision
+
+    @property
+    def _pixel_grid_hash(self):
+        # The world coordinates of the pixels also depend on the shape of the data
+        return self._meta_hash, self.data.shape
+
+    @property
+    @cached_property_based_on('_pixel_grid_hash')
+    def _all_coordinates(self):
+        """
+        The world coordinates of the center of every pixel.
+
+        This is cached until the metadata or the shape of the data changes, so
+        it must not be modified in place.
+        """
+        y, x = np.indices(self.data.shape)
+        return self.wcs.pixel_to_world(x, y)
+
+    @property
+    @cached_property_based_on('_pixel_grid_hash')
+    def _edge_coordinates(self):
+        """
+        The world coordinates of the center of every pixel on the edges of the
+        map, in the order top, bottom, left, right (see `~sunpy.map.map_edges`).
+
+        This is cached until the metadata or the shape of the data changes, so
+        it must not be modified in place.
+        """
+        ny, nx = self.data.shape
+        x = np.arange(nx)
+        y = np.arange(ny)
+        edge_x = np.concatenate([x, x, np.zeros(ny), np.full(ny, nx - 1)])
+        edge_y = np.concatenate([np.full(nx, ny - 1), np.zeros(nx), y, y])
+        return self.wcs.pixel_to_world(edge_x, edge_y)
 
     @property
     @cached_property_based_on('_meta_hash')
@@ -685,6 +721,7 @@ class GenericMap(NDData):
         return w2
 
     @property
+    @cached_property_based_on('_meta_hash')
     def coordinate_frame(self):
         """
         An `astropy.coordinates.BaseCoordinateFrame` instance created from the coordinate
@@ -1430,6 +1467,7 @@ class GenericMap(NDData):
                          (self.meta.get('crpix2', (naxis2 + 1) / 2.) - 1) * u.pixel)
 
     @property
+    @cached_property_based_on('_meta_hash')
     def scale(self):
         """
         Image scale along the x and y axes in units/pixel
@@ -1477,6 +1515,15 @@ class GenericMap(NDData):
         It general it does not have to be a pure rotation matrix, and can encode
         other transformations e.g., skews for non-orthogonal coordinate systems.
         """
+        return self._rotation_matrix.copy()
+
+    @property
+    @cached_property_based_on('_meta_hash')
+    def _rotation_matrix(self):
+        """
+        The rotation matrix, which is cached until the metadata changes, so it
+        must not be modified in place.
+        """
         if any(key in self.meta for key in ['PC1_1', 'PC1_2', 'PC2_1', 'PC2_2']):
             return np.array(
                 [
@@ -1694,7 +1741,7 @@ class GenericMap(NDData):
         as IDL''s congrid routine, which apparently originally came from a
         VAX/VMS routine of the same name.
 
-        This method **does not** preserve dask arrays.
+        This method **does** preserve dask arrays.
 
         Parameters
         ----------
@@ -1703,8 +1750,8 @@ class GenericMap(NDData):
             axis and the second argument corresponds to the 'y' axis.
         method : str
             Method to use for resampling interpolation.
-                * ``'nearest'`` and ``'linear'`` - Use n x 1-D interpolations using
-                  `scipy.interpolate.interp1d`.
+                * ``'nearest'`` and ``'linear'`` - Use n x 1-D interpolations, one
+                  axis at a time.
                 * ``'spline'`` - Uses piecewise polynomials (splines) for mapping the input
                   array to new coordinates by interpolation using
                   `scipy.ndimage.map_coordinates`.
@@ -1725,11 +1772,22 @@ class GenericMap(NDData):
         # Note: "center" defaults to True in this function because data
         #   coordinates in a Map are at pixel centers
 
-        # Make a copy of the original data and perform resample
-        new_data = sunpy_image_resample(self.data.copy().T, dimensions,
+        # Perform resample; the data is not modified so does not need to be copied
+        new_data = sunpy_image_resample(self.data.T, dimensions,
                                         method, center=True)
         new_data = new_data.T
 
+        new_meta = self._resample_meta(dimensions, new_data.shape)
+
+        # Create new map instance
+        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
+        return new_map
+
+    def _resample_meta(self, dimensions, new_shape):
+        """
+        Return a copy of the metadata updated for resampling to ``dimensions``,
+        giving data of shape ``new_shape``.
+        """
         scale_factor_x = float(self.dimensions[0] / dimensions[0])
         scale_factor_y = float(self.dimensions[1] / dimensions[1])
 
@@ -1747,12 +1805,9 @@ class GenericMap(NDData):
 
         new_meta['crpix1'] = (self.reference_pixel.x.to_value(u.pix) + 0.5) / scale_factor_x + 0.5
         new_meta['crpix2'] = (self.reference_pixel.y.to_value(u.pix) + 0.5) / scale_factor_y + 0.5
-        new_meta['naxis1'] = new_data.shape[1]
-        new_meta['naxis2'] = new_data.shape[0]
-
-        # Create new map instance
-        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
-        return new_map
+        new_meta['naxis1'] = new_shape[1]
+        new_meta['naxis2'] = new_shape[0]
+        return new_meta
 
     @add_common_docstring(rotation_function_names=_rotation_function_names)
     @u.quantity_input
@@ -1766,7 +1821,8 @@ class GenericMap(NDData):
         rotated by the rotation information in the metadata, which should derotate
         the map so that the pixel axes are aligned with world-coordinate axes.
 
-        This method **does not** preserve dask arrays.
+        This method **does** preserve dask arrays for the ``'scipy'`` and
+        ``'scipy-tiled'`` methods, and **does not** for the other methods.
 
         Parameters
         ----------
@@ -1837,13 +1893,6 @@ class GenericMap(NDData):
 
         method = _get_transform_method(method)
 
-        # The FITS-WCS transform is by definition defined around the
-        # reference coordinate in the header.
-        lon, lat = self._get_lon_lat(self.reference_coordinate.frame)
-        rotation_center = u.Quantity([lon, lat])
-
-        # Copy meta data
-        new_meta = self.meta.copy()
         if angle is not None:
             # Calculate the parameters for the affine_transform
             c = np.cos(np.deg2rad(angle))
@@ -1855,70 +1904,132 @@ class GenericMap(NDData):
         # actually be a pure rotation matrix, we calculate the inverse in a general manner.
         inv_rmatrix = np.linalg.inv(rmatrix)
 
+        padding, pixel_center, new_reference_pixel = self._rotate_geometry(rmatrix, scale, recenter)
+        new_data = self._rotate_array(self.data, inv_rmatrix, padding, pixel_center,
+                                      order=order, scale=scale, recenter=recenter,
+                                      missing=missing, method=method, clip=clip)
+        new_meta = self._rotate_meta(rmatrix, inv_rmatrix, scale, padding, new_reference_pixel)
+
+        # Create new map with the modification
+        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
+
+        return new_map
+
+    def _rotate_geometry(self, rmatrix, scale, recenter):
+        """
+        Calculate the padding and the centers needed to rotate the data by ``rmatrix``.
+
+        The returned values only depend on the shape of the data and the reference
+        pixel, so they can be shared by all maps for which those are the same.
+
+        Returns
+        -------
+        padding : `tuple`
+            The ``(pad_x, pad_y, unpad_x, unpad_y)`` number of pixels to add to
+            each edge of the data before the rotation and to remove after it.
+        pixel_center : `numpy.ndarray`
+            The pixel about which the padded data is rotated.
+        new_reference_pixel : `numpy.ndarray`
+            The reference pixel in the rotated padded data.
+        """
         # Calculate the shape in pixels to contain all of the image data
-        corners = itertools.product([-0.5, self.data.shape[1]-0.5],
-                                    [-0.5, self.data.shape[0]-0.5])
+        ny, nx = self.data.shape
+        corners = itertools.product([-0.5, nx-0.5], [-0.5, ny-0.5])
         rot_corners = np.vstack([rmatrix @ c for c in corners]) * scale
         extent = np.max(rot_corners, axis=0) - np.min(rot_corners, axis=0)
 
         # Calculate the needed padding or unpadding
-        diff = np.asarray(np.ceil((extent - np.flipud(self.data.shape)) / 2), dtype=int)
+        diff = np.asarray(np.ceil((extent - np.array([nx, ny])) / 2), dtype=int)
         pad_x = np.max((diff[0], 0))
         pad_y = np.max((diff[1], 0))
         unpad_x = -np.min((diff[0], 0))
         unpad_y = -np.min((diff[1], 0))
 
+        # All of the following pixel calculations use a pixel origin of 0
+        pixel_array_center = (np.array([nx + 2*pad_x, ny + 2*pad_y]) - 1) / 2.0
+        pixel_rotation_center = u.Quantity(self.reference_pixel).value + [pad_x, pad_y]
+
+        if recenter:
+            pixel_center = pixel_rotation_center
+            new_reference_pixel = pixel_array_center
+        else:
+            pixel_center = pixel_array_center
+            # Calculate new pixel coordinates for the rotation center
+            new_reference_pixel = pixel_center + np.dot(rmatrix * scale,
+                                                        pixel_rotation_center - pixel_center)
+            new_reference_pixel = np.array(new_reference_pixel).ravel()
+
+        return (pad_x, pad_y, unpad_x, unpad_y), pixel_center, new_reference_pixel
+
+    @staticmethod
+    def _rotate_array(data, inv_rmatrix, padding, pixel_center, *, order, scale, recenter,
+                      missing, method, clip):
+        """
+        Pad, rotate and unpad ``data`` using the output of `_rotate_geometry`.
+
+        Any leading dimensions of ``data`` are treated as a stack of images which
+        are each rotated in the same way.
+        """
+        pad_x, pad_y, unpad_x, unpad_y = padding
+
         # Raise an informative error message if trying to pad an integer array with NaNs
-        if (pad_x > 0 or pad_y > 0) and issubclass(self.data.dtype.type, numbers.Integral) and (missing % 1 != 0):
+        if (pad_x > 0 or pad_y > 0) and issubclass(data.dtype.type, numbers.Integral) and (missing % 1 != 0):
             raise ValueError("The underlying data is integers, but the fill value for missing "
                              "pixels cannot be cast to an integer, which is the case for the "
                              "default fill value of NaN. Set the `missing` keyword to an "
                              "appropriate integer value for the data set.")
 
-        new_data = np.pad(self.data,
-                          ((pad_y, pad_y), (pad_x, pad_x)),
+        leading = ((0, 0),) * (data.ndim - 2)
+        new_data = np.pad(data,
+                          leading + ((pad_y, pad_y), (pad_x, pad_x)),
                           mode='constant',
                           constant_values=(missing, missing))
 
-        # All of the following pixel calculations use a pixel origin of 0
-        pixel_array_center = (np.flipud(new_data.shape) - 1) / 2.0
-        pixel_rotation_center = u.Quantity(self.reference_pixel).value + [pad_x, pad_y]
-
-        if recenter:
-            pixel_center = pixel_rotation_center
-        else:
-            pixel_center = pixel_array_center
-
         # Apply the rotation to the image data
-        new_data = affine_transform(new_data,
+        stack = new_data.reshape((-1,) + new_data.shape[-2:])
+        rotated = [affine_transform(image,
                                     np.asarray(inv_rmatrix),
                                     order=order, scale=scale,
                                     image_center=pixel_center,
                                     recenter=recenter, missing=missing,
                                     method=method, clip=clip)
+                   for image in stack]
+        new_data = rotated[0] if data.ndim == 2 else np.stack(rotated).reshape(new_data.shape)
 
-        if recenter:
-            new_reference_pixel = pixel_array_center
-        else:
-            # Calculate new pixel coordinates for the rotation center
-            new_reference_pixel = pixel_center + np.dot(rmatrix * scale,
-                                                        pixel_rotation_center - pixel_center)
-            new_reference_pixel = np.array(new_reference_pixel).ravel()
+        # Unpad the array if necessary
+        if unpad_x > 0:
+            new_data = new_data[..., unpad_x:-unpad_x]
+        if unpad_y > 0:
+            new_data = new_data[..., unpad_y:-unpad_y, :]
+        return new_data
+
+    def _rotate_meta(self, rmatrix, inv_rmatrix, scale, padding, new_reference_pixel):
+        """
+        Return a copy of the metadata updated for a rotation using the output of
+        `_rotate_geometry`.
+        """
+        pad_x, pad_y, unpad_x, unpad_y = padding
+
+        # The FITS-WCS transform is by definition defined around the
+        # reference coordinate in the header.
+        lon, lat = self._get_lon_lat(self.reference_coordinate.frame)
+        rotation_center = u.Quantity([lon, lat])
+
+        # Copy meta data
+        new_meta = self.meta.copy()
 
         # Define the new reference_pixel
         new_meta['crval1'] = rotation_center[0].value
         new_meta['crval2'] = rotation_center[1].value
         new_meta['crpix1'] = new_reference_pixel[0] + 1  # FITS pixel origin is 1
         new_meta['crpix2'] = new_reference_pixel[1] + 1  # FITS pixel origin is 1
-        new_meta['NAXIS1'] = new_data.shape[1]
-        new_meta['NAXIS2'] = new_data.shape[0]
+        new_meta['NAXIS1'] = self.data.shape[1] + 2*pad_x
+        new_meta['NAXIS2'] = self.data.shape[0] + 2*pad_y
 
-        # Unpad the array if necessary
+        # Account for the unpadding of the array
         if unpad_x > 0:
-            new_data = new_data[:, unpad_x:-unpad_x]
             new_meta['crpix1'] -= unpad_x
         if unpad_y > 0:
-            new_data = new_data[unpad_y:-unpad_y, :]
             new_meta['crpix2'] -= unpad_y
 
         # Calculate the new rotation matrix to store in the header by
@@ -1945,10 +2056,7 @@ class GenericMap(NDData):
         new_meta.pop('CD2_1', None)
         new_meta.pop('CD2_2', None)
 
-        # Create new map with the modification
-        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
-
-        return new_map
+        return new_meta
 
     @u.quantity_input
     def submap(self, bottom_left, *, top_right=None, width: (u.deg, u.pix) = None, height: (u.deg, u.pix) = None):
@@ -2073,6 +2181,30 @@ class GenericMap(NDData):
         Reference Coord:     [3.22309951 1.38578135] arcsec
         ...
         """
+        pixel_corners = self._submap_pixel_corners(bottom_left, top_right, width, height)
+        bottom, top, left, right = self._submap_bounds(pixel_corners)
+
+        arr_slice = np.s_[bottom:top, left:right]
+        # Get ndarray representation of submap
+        new_data = self.data[arr_slice].copy()
+
+        new_meta = self._submap_meta(bottom, left, new_data.shape)
+
+        # Create new map instance
+        if self.mask is not None:
+            new_mask = self.mask[arr_slice].copy()
+            # Create new map with the modification
+            new_map = self._new_instance(new_data, new_meta, self.plot_settings, mask=new_mask)
+            return new_map
+        # Create new map with the modification
+        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
+        return new_map
+
+    def _submap_pixel_corners(self, bottom_left, top_right, width, height):
+        """
+        Validate the inputs to `submap` and return the corners of the rectangle
+        in pixel coordinates of this map.
+        """
         # Check that we have been given a valid combination of inputs
         # [False, False, False] is valid if bottom_left contains the two corner coords
         if ([arg is not None for arg in (top_right, width, height)]
@@ -2092,7 +2224,13 @@ class GenericMap(NDData):
         )
         if np.any(np.isnan(pixel_corners)):
             raise ValueError(msg)
+        return pixel_corners
 
+    def _submap_bounds(self, pixel_corners):
+        """
+        Return the ``(bottom, top, left, right)`` array indices of the smallest
+        array that contains all of ``pixel_corners``, clipped to the data.
+        """
         # The pixel corners result is in Cartesian order, so the first index is
         # columns and the second is rows.
         bottom = np.min(pixel_corners[1]).to_value(u.pix)
@@ -2116,28 +2254,21 @@ class GenericMap(NDData):
         top = int(np.clip(top, 0, self.data.shape[0]))
         left = int(np.clip(left, 0, self.data.shape[1]))
         right = int(np.clip(right, 0, self.data.shape[1]))
+        return bottom, top, left, right
 
-        arr_slice = np.s_[bottom:top, left:right]
-        # Get ndarray representation of submap
-        new_data = self.data[arr_slice].copy()
-
+    def _submap_meta(self, bottom, left, new_shape):
+        """
+        Return a copy of the metadata updated for a cutout whose first pixel is
+        at the array indices ``(bottom, left)``, giving data of shape ``new_shape``.
+        """
         # Make a copy of the header with updated centering information
         new_meta = self.meta.copy()
         # Add one to go from zero-based to one-based indexing
         new_meta['crpix1'] = self.reference_pixel.x.to_value(u.pix) + 1 - left
         new_meta['crpix2'] = self.reference_pixel.y.to_value(u.pix) + 1 - bottom
-        new_meta['naxis1'] = new_data.shape[1]
-        new_meta['naxis2'] = new_data.shape[0]
-
-        # Create new map instance
-        if self.mask is not None:
-            new_mask = self.mask[arr_slice].copy()
-            # Create new map with the modification
-            new_map = self._new_instance(new_data, new_meta, self.plot_settings, mask=new_mask)
-            return new_map
-        # Create new map with the modification
-        new_map = self._new_instance(new_data, new_meta, self.plot_settings)
-        return new_map
+        new_meta['naxis1'] = new_shape[1]
+        new_meta['naxis2'] = new_shape[0]
+        return new_meta
 
     @seconddispatch
     def _parse_submap_input(self, bottom_left, top_right, width, height):
@@ -2247,12 +2378,13 @@ class GenericMap(NDData):
         dimensions = [int(dim) for dim in dimensions.to_value(u.pix)]
         offset = [int(off) for off in offset.to_value(u.pix)]
 
-        # Make a copy of the original data, perform reshaping, and apply the
-        # function.
+        # Reshape the original data and apply the function. The reshaping only
+        # creates a view, so no copy of the data (which may be memory-mapped)
+        # is made before it is reduced by the function.
         if self.mask is not None:
-            data = np.ma.array(self.data.copy(), mask=self.mask)
+            data = np.ma.array(self.data, mask=self.mask, copy=False)
         else:
-            data = self.data.copy()
+            data = self.data
 
         reshaped_data = reshape_image_to_4d_superpixel(data, [dimensions[1], dimensions[0]], [offset[1], offset[0]])
         new_array = func(func(reshaped_data, axis=3), axis=1)
@@ -2273,6 +2405,24 @@ class GenericMap(NDData):
         else:
             new_mask = None
 
+        new_meta = self._superpixel_meta(dimensions, offset, new_array.shape)
+
+        # Create new map instance
+        if self.mask is not None:
+            new_data = np.ma.getdata(new_array)
+        else:
+            new_data = new_array
+
+        # Create new map with the modified data
+        new_map = self._new_instance(new_data, new_meta, self.plot_settings, mask=new_mask)
+        return new_map
+
+    def _superpixel_meta(self, dimensions, offset, new_shape):
+        """
+        Return a copy of the metadata updated for superpixels of ``dimensions``
+        starting at ``offset`` (both integer pixels in Cartesian order), giving
+        data of shape ``new_shape``.
+        """
         # Update image scale and number of pixels
 
         # create copy of new meta data
@@ -2291,18 +2441,9 @@ class GenericMap(NDData):
                                0.5 - offset[0]) / dimensions[0]) + 0.5
         new_meta['crpix2'] = ((self.reference_pixel.y.to_value(u.pix) +
                                0.5 - offset[1]) / dimensions[1]) + 0.5
-        new_meta['naxis1'] = new_array.shape[1]
-        new_meta['naxis2'] = new_array.shape[0]
-
-        # Create new map instance
-        if self.mask is not None:
-            new_data = np.ma.getdata(new_array)
-        else:
-            new_data = new_array
-
-        # Create new map with the modified data
-        new_map = self._new_instance(new_data, new_meta, self.plot_settings, mask=new_mask)
-        return new_map
+        new_meta['naxis1'] = new_shape[1]
+        new_meta['naxis2'] = new_shape[0]
+        return new_meta
 
 # #### Visualization #### #
 
@@ -3050,7 +3191,8 @@ class GenericMap(NDData):
 
         Additional keyword arguments are passed through to the reprojection function.
 
-        This method **does not** preserve dask arrays.
+        This method **does** preserve dask arrays, by default reprojecting in
+        blocks with ``return_type='dask'``.
 
         Parameters
         ----------
@@ -3130,6 +3272,11 @@ class GenericMap(NDData):
         if target_wcs.array_shape is not None:
             reproject_args.setdefault('shape_out', target_wcs.array_shape)
 
+        # Reproject dask arrays lazily block by block
+        if DASK_INSTALLED and isinstance(self.data, DaskArray):
+            reproject_args.setdefault('return_type', 'dask')
+            reproject_args.setdefault('block_size', 'auto')
+
         # Reproject the array
         output_array = func(self, target_wcs, return_footprint=return_footprint, **reproject_args)
         if return_footprint:
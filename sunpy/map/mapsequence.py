@@ -1,5 +1,6 @@
 """A MapSequence object"""
 
+import copy
 import html
 import textwrap
 import webbrowser
@@ -9,8 +10,19 @@ from tempfile import NamedTemporaryFile
 import matplotlib.animation
 import numpy as np
 
+try:
+    import dask.array
+    DASK_INSTALLED = True
+except ImportError:
+    DASK_INSTALLED = False
+
+import astropy.units as u
 from astropy.visualization import ImageNormalize
 
+from sunpy import log
+from sunpy.image.resample import _resample_axis, reshape_image_to_4d_superpixel
+from sunpy.image.resample import resample as sunpy_image_resample
+from sunpy.image.transform import _get_transform_method
 from sunpy.map import GenericMap
 from sunpy.map.maputils import _clip_interval, _handle_norm
 from sunpy.util import expand_list
@@ -34,6 +46,15 @@ class MapSequence:
         Method by which the MapSequence should be sorted along the z-axis.
         Defaults to sorting by: "date" and is the only supported sorting strategy.
         Passing `None` will disable sorting.
+    stack : `bool` or array-like, optional
+        If `True`, the data of all the maps are stored in one array of shape
+        ``(N_t, N_y, N_x)``, and each map in the sequence holds a view of its frame
+        of that array, so that `~sunpy.map.MapSequence.data` can be returned
+        without copying the data. If any of the maps hold a `dask.array.Array`,
+        the stacked array is also a `dask.array.Array`. An array of the right
+        shape (e.g., a `numpy.memmap`) can be given to store the data in instead.
+        All maps must have the same shape. The input maps are not modified.
+        Defaults to `False`.
 
     Attributes
     ----------
@@ -55,7 +76,7 @@ class MapSequence:
     >>> mapsequence = sunpy.map.Map('images/*.fits', sequence=True)   # doctest: +SKIP
     """
 
-    def __init__(self, *args, sortby='date'):
+    def __init__(self, *args, sortby='date', stack=False):
         """Creates a new Map instance"""
 
         self.maps = expand_list(args)
@@ -70,6 +91,46 @@ class MapSequence:
                 raise ValueError(f"sortby must be one of the following: {list(self._sort_methods.keys())}")
             self.maps.sort(key=self._sort_methods[sortby])
 
+        self._stacked_data = None
+        if stack is not False:
+            self._stack(None if stack is True else stack)
+
+    def _stack(self, out):
+        """
+        Store the data of all the maps in the array ``out`` and replace the maps
+        with copies that hold views of their frames.
+        """
+        if not self.all_same_shape:
+            raise ValueError('Not all maps have the same shape.')
+        shape = (len(self.maps),) + self.maps[0].data.shape
+        if out is None:
+            if DASK_INSTALLED and any(isinstance(m.data, dask.array.Array) for m in self.maps):
+                out = dask.array.stack([m.data for m in self.maps])
+            else:
+                out = np.empty(shape, dtype=np.result_type(*[m.data.dtype for m in self.maps]))
+        elif out.shape != shape:
+            raise ValueError(f'The array to stack the data in must have shape {shape}, not {out.shape}.')
+        if not (DASK_INSTALLED and isinstance(out, dask.array.Array)):
+            for i, m in enumerate(self.maps):
+                out[i] = m.data
+
+        # Each map gets its own header, so that the input maps are not modified
+        self.maps = [m._new_instance(out[i], m.meta.copy(), copy.deepcopy(m.plot_settings), mask=m.mask)
+                     for i, m in enumerate(self.maps)]
+        self._set_stacked_data(out)
+
+    def _set_stacked_data(self, stacked_data):
+        self._stacked_data = stacked_data
+        self._stacked_frames = [m.data for m in self.maps]
+
+    @property
+    def _is_stacked(self):
+        """
+        True if the data of every map is still a frame of the stacked array.
+        """
+        return (self._stacked_data is not None
+                and len(self.maps) == len(self._stacked_frames)
+                and all(m.data is frame for m, frame in zip(self.maps, self._stacked_frames)))
 
     @property
     def _sort_methods(self):
@@ -84,8 +145,12 @@ class MapSequence:
 
         if isinstance(self.maps[key], GenericMap):
             return self.maps[key]
-        else:
-            return MapSequence(self.maps[key])
+        if self._is_stacked:
+            # Keep the order of the maps so that they match the frames of the stacked data
+            new_sequence = MapSequence(self.maps[key], sortby=None)
+            new_sequence._set_stacked_data(self._stacked_data[key])
+            return new_sequence
+        return MapSequence(self.maps[key])
 
     def __len__(self):
         """Return the number of maps in a mapsequence."""
@@ -432,7 +497,12 @@ class MapSequence:
         shape of each individual map and ``N_t`` is the number of maps.
 
         .. note:: If all maps do not have the same shape, a `ValueError` is raised.
+
+        If the sequence was created with ``stack=True``, this is a view of the
+        stacked data, and no data is copied.
         """
+        if self._is_stacked:
+            return np.moveaxis(self._stacked_data, 0, -1)
         if not self.all_same_shape:
             raise ValueError('Not all maps have the same shape.')
         data = np.asarray([m.data for m in self.maps])
@@ -449,7 +519,9 @@ class MapSequence:
         """
         if not np.any([m.mask is not None for m in self.maps]):
             return None
-        mask = np.zeros_like(self.data, dtype=bool)
+        if not self.all_same_shape:
+            raise ValueError('Not all maps have the same shape.')
+        mask = np.zeros(self.maps[0].data.shape + (len(self.maps),), dtype=bool)
         for i, m in enumerate(self):
             if m.mask is not None:
                 mask[..., i] = m.mask
@@ -462,6 +534,297 @@ class MapSequence:
         """
         return [m.meta for m in self.maps]
 
+    def _frames(self):
+        """
+        Return the data of all the maps as one array of shape ``(N_t, N_y, N_x)``.
+
+        This is the stacked data if the sequence is stacked, otherwise the data is copied.
+        """
+        if self._is_stacked:
+            return self._stacked_data
+        if not self.all_same_shape:
+            raise ValueError('Not all maps have the same shape.')
+        if DASK_INSTALLED and any(isinstance(m.data, dask.array.Array) for m in self.maps):
+            return dask.array.stack([m.data for m in self.maps])
+        return np.stack([m.data for m in self.maps])
+
+    def _new_stacked_sequence(self, new_data, new_metas, new_masks=None):
+        """
+        Return a new stacked sequence whose maps hold the frames of ``new_data``.
+        """
+        if new_masks is None:
+            new_masks = [None] * len(self.maps)
+        new_maps = [m._new_instance(new_data[i], meta, m.plot_settings, mask=mask)
+                    for i, (m, meta, mask) in enumerate(zip(self.maps, new_metas, new_masks))]
+        new_sequence = MapSequence(new_maps, sortby=None)
+        new_sequence._set_stacked_data(new_data)
+        return new_sequence
+
+    @u.quantity_input
+    def superpixel(self, dimensions: u.pixel, offset: u.pixel = (0, 0)*u.pixel, func=np.sum,
+                   conservative_mask: bool = False):
+        """
+        Returns a new sequence of maps consisting of superpixels formed by
+        applying ``func`` to the data of every map.
+
+        This gives the same maps as calling `sunpy.map.GenericMap.superpixel` on
+        each map, but ``func`` is applied to the data of all the maps at once.
+        All maps must have the same shape, and the returned sequence is stacked.
+
+        Parameters
+        ----------
+        dimensions : tuple
+            One superpixel in the new maps is equal to (dimension[0],
+            dimension[1]) pixels of the original maps.
+        offset : tuple
+            Offset from (0,0) in original map pixels used to calculate where
+            the data used to make the resulting superpixel maps starts.
+        func
+            Function applied to the original data. It must support the axis
+            keyword with the meaning of a numpy axis keyword.
+            Defaults to `~numpy.sum`.
+        conservative_mask : bool, optional
+            If `True`, a superpixel is masked if any of its constituent pixels are masked.
+            If `False`, a superpixel is masked only if all of its constituent pixels are masked.
+            Default is `False`.
+
+        Returns
+        -------
+        `~sunpy.map.MapSequence`
+
+        See Also
+        --------
+        sunpy.map.GenericMap.superpixel
+        """
+        if (offset.value[0] < 0) or (offset.value[1] < 0):
+            raise ValueError("Offset is strictly non-negative.")
+
+        dimensions = [int(dim) for dim in dimensions.to_value(u.pix)]
+        offset = [int(off) for off in offset.to_value(u.pix)]
+        array_dimensions = [dimensions[1], dimensions[0]]
+        array_offset = [offset[1], offset[0]]
+
+        data = self._frames()
+        has_mask = [m.mask is not None for m in self.maps]
+        if any(has_mask):
+            mask = np.moveaxis(self.mask, -1, 0)
+            data = np.ma.array(data, mask=mask)
+
+        reshaped_data = reshape_image_to_4d_superpixel(data, array_dimensions, array_offset)
+        new_array = func(func(reshaped_data, axis=-1), axis=-2)
+
+        new_masks = None
+        if any(has_mask):
+            if conservative_mask ^ (func in [np.sum, np.prod]):
+                log.info(
+                    f"Using conservative_mask={conservative_mask} for function {func.__name__}, "
+                    "which may not be ideal. Recommended: conservative_mask=True for sum/prod, "
+                    "False for mean/median/std/min/max."
+                    )
+            if conservative_mask:
+                reshaped_mask = reshape_image_to_4d_superpixel(mask, array_dimensions, array_offset)
+                new_mask = np.any(reshaped_mask, axis=(-1, -3))
+            else:
+                new_mask = np.ma.getmaskarray(new_array)
+            new_masks = [new_mask[i] if has else None for i, has in enumerate(has_mask)]
+            new_array = np.ma.getdata(new_array)
+
+        new_metas = [m._superpixel_meta(dimensions, offset, new_array.shape[1:]) for m in self.maps]
+        return self._new_stacked_sequence(new_array, new_metas, new_masks)
+
+    @u.quantity_input
+    def resample(self, dimensions: u.pixel, method='linear'):
+        """
+        Resample every map to new dimension sizes.
+
+        This gives the same maps as calling `sunpy.map.GenericMap.resample` on
+        each map. All maps must have the same shape, and the returned sequence
+        is stacked.
+
+        Parameters
+        ----------
+        dimensions : `~astropy.units.Quantity`
+            Output pixel dimensions. The first argument corresponds to the 'x'
+            axis and the second argument corresponds to the 'y' axis.
+        method : str
+            Method to use for resampling interpolation.
+            See `sunpy.map.GenericMap.resample` for the available methods.
+
+        Returns
+        -------
+        `~sunpy.map.MapSequence`
+
+        See Also
+        --------
+        sunpy.map.GenericMap.resample
+        """
+        data = self._frames()
+        if method in ['nearest', 'linear']:
+            # The interpolation is separable, so the whole stack can be resampled
+            # one axis at a time, in the same order as for a single map
+            new_data = data
+            if new_data.dtype not in [np.float64, np.float32]:
+                new_data = new_data.astype(np.float64)
+            new_x, new_y = dimensions.to_value(u.pix)
+            new_data = _resample_axis(new_data, 2, new_x, method, 0.5, 0)
+            new_data = _resample_axis(new_data, 1, new_y, method, 0.5, 0)
+        else:
+            new_data = np.stack([sunpy_image_resample(frame.T, dimensions,
+                                                      method, center=True).T
+                                 for frame in data])
+        new_metas = [m._resample_meta(dimensions, new_data.shape[1:]) for m in self.maps]
+        return self._new_stacked_sequence(new_data, new_metas)
+
+    @u.quantity_input
+    def rotate(self, angle: u.deg = None, rmatrix=None, order=3, scale=1.0,
+               recenter=False, missing=np.nan, *, method='scipy', clip=True):
+        """
+        Returns a new sequence of rotated and rescaled maps.
+
+        This gives the same maps as calling `sunpy.map.GenericMap.rotate` on
+        each map. The padding and rotation center are calculated only once for
+        all maps that have the same shape, reference pixel and rotation. If
+        these are the same for all the maps, the data is padded and unpadded as
+        one array and the returned sequence is stacked.
+
+        Parameters
+        ----------
+        angle : `~astropy.units.Quantity`
+            The angle (degrees) to rotate counterclockwise.
+        rmatrix : array-like
+            2x2 linear transformation rotation matrix.
+        order : int
+            Interpolation order to be used.
+            Default: 3
+        scale : float
+            A scale factor for the images, default is no scaling
+        recenter : bool
+            If `True`, position the reference coordinate at the center of the new maps
+            Default: `False`
+        missing : float
+            The value to use for pixels in the output maps that are beyond the extent
+            of the input maps.
+            Default: `numpy.nan`
+        method : str, optional
+            Rotation function to use. Defaults to ``'scipy'``.
+        clip : `bool`, optional
+            If `True`, clips the pixel values of the output images to the range of the
+            input images (including the value of ``missing``, if used).
+            Defaults to `True`.
+
+        Returns
+        -------
+        `~sunpy.map.MapSequence`
+
+        See Also
+        --------
+        sunpy.map.GenericMap.rotate
+        """
+        if angle is not None and rmatrix is not None:
+            raise ValueError("You cannot specify both an angle and a rotation matrix.")
+        if order not in range(6):
+            raise ValueError("Order must be between 0 and 5.")
+
+        method = _get_transform_method(method)
+
+        if angle is not None:
+            c = np.cos(np.deg2rad(angle))
+            s = np.sin(np.deg2rad(angle))
+            rmatrix = np.array([[c, -s],
+                                [s, c]])
+
+        # Group the maps that will be rotated in the same way
+        groups = {}
+        for i, m in enumerate(self.maps):
+            # Be aware that m.rotation_matrix may not actually be a pure rotation matrix
+            map_rmatrix = np.asarray(m.rotation_matrix if rmatrix is None else rmatrix)
+            key = (m.data.shape, map_rmatrix.tobytes(),
+                   u.Quantity(m.reference_pixel).to_value(u.pix).tobytes())
+            if key not in groups:
+                inv_rmatrix = np.linalg.inv(map_rmatrix)
+                geometry = m._rotate_geometry(map_rmatrix, scale, recenter)
+                groups[key] = (map_rmatrix, inv_rmatrix, geometry, [])
+            groups[key][3].append(i)
+
+        kwargs = dict(order=order, scale=scale, recenter=recenter,
+                      missing=missing, method=method, clip=clip)
+
+        if len(groups) == 1:
+            map_rmatrix, inv_rmatrix, (padding, pixel_center, new_reference_pixel), _ = groups.popitem()[1]
+            new_data = GenericMap._rotate_array(self._frames(), inv_rmatrix,
+                                                padding, pixel_center, **kwargs)
+            new_metas = [m._rotate_meta(map_rmatrix, inv_rmatrix, scale, padding, new_reference_pixel)
+                         for m in self.maps]
+            return self._new_stacked_sequence(new_data, new_metas)
+
+        new_maps = [None] * len(self.maps)
+        for map_rmatrix, inv_rmatrix, (padding, pixel_center, new_reference_pixel), indices in groups.values():
+            for i in indices:
+                m = self.maps[i]
+                new_data = GenericMap._rotate_array(m.data, inv_rmatrix,
+                                                    padding, pixel_center, **kwargs)
+                new_meta = m._rotate_meta(map_rmatrix, inv_rmatrix, scale, padding, new_reference_pixel)
+                new_maps[i] = m._new_instance(new_data, new_meta, m.plot_settings)
+        return MapSequence(new_maps, sortby=None)
+
+    @u.quantity_input
+    def submap(self, bottom_left, *, top_right=None, width: (u.deg, u.pix) = None,
+               height: (u.deg, u.pix) = None):
+        """
+        Returns a new sequence of submaps defined by a rectangle.
+
+        This gives the same maps as calling `sunpy.map.GenericMap.submap` on
+        each map. If the rectangle is defined in pixels, it is converted to
+        array indices only once. If the cutout is the same for every map, the
+        data of all the maps is cut out as one array and the returned sequence
+        is stacked.
+
+        Parameters
+        ----------
+        bottom_left : `astropy.units.Quantity` or `~astropy.coordinates.SkyCoord`
+            The bottom-left coordinate of the rectangle.
+        top_right : `astropy.units.Quantity` or `~astropy.coordinates.SkyCoord`, optional
+            The top-right coordinate of the rectangle.
+        width, height : `astropy.units.Quantity`, optional
+            The width and height of the rectangle.
+
+        Returns
+        -------
+        `~sunpy.map.MapSequence`
+
+        See Also
+        --------
+        sunpy.map.GenericMap.submap
+        """
+        if isinstance(bottom_left, u.Quantity) and self.all_same_shape:
+            # Pixel rectangles do not depend on the coordinate system of each map
+            m = self.maps[0]
+            bounds = [m._submap_bounds(m._submap_pixel_corners(bottom_left, top_right, width, height))]
+            bounds *= len(self.maps)
+        else:
+            bounds = [m._submap_bounds(m._submap_pixel_corners(bottom_left, top_right, width, height))
+                      for m in self.maps]
+
+        if all(b == bounds[0] for b in bounds) and self.all_same_shape:
+            bottom, top, left, right = bounds[0]
+            arr_slice = np.s_[:, bottom:top, left:right]
+            new_data = self._frames()[arr_slice].copy()
+            new_masks = None
+            if any(m.mask is not None for m in self.maps):
+                new_masks = [None if m.mask is None else m.mask[arr_slice[1:]].copy()
+                             for m in self.maps]
+            new_metas = [m._submap_meta(bottom, left, new_data.shape[1:]) for m in self.maps]
+            return self._new_stacked_sequence(new_data, new_metas, new_masks)
+
+        new_maps = []
+        for m, (bottom, top, left, right) in zip(self.maps, bounds):
+            arr_slice = np.s_[bottom:top, left:right]
+            new_data = m.data[arr_slice].copy()
+            new_mask = None if m.mask is None else m.mask[arr_slice].copy()
+            new_meta = m._submap_meta(bottom, left, new_data.shape)
+            new_maps.append(m._new_instance(new_data, new_meta, m.plot_settings, mask=new_mask))
+        return MapSequence(new_maps, sortby=None)
+
     def save(self, filepath, filetype='auto', **kwargs):
         """
         Saves the sequence as one map for FITS file.
@@ -2,7 +2,6 @@
 This submodule provides utility functions to act on `sunpy.map.GenericMap` instances.
 """
 import numbers
-from itertools import product
 
 import numpy as np
 
@@ -19,7 +18,8 @@ __all__ = ['all_pixel_indices_from_map', 'all_coordinates_from_map',
            'contains_limb', 'coordinate_is_on_solar_disk',
            'on_disk_bounding_coordinates',
            'contains_coordinate', 'contains_solar_center',
-           'pixelate_coord_path']
+           'pixelate_coord_path',
+           'pixel_to_helioprojective_values', 'pixel_to_heliographic_values']
 
 
 def _clip_interval(data, clip_interval):
@@ -85,9 +85,14 @@ def all_coordinates_from_map(smap):
     `~astropy.coordinates.SkyCoord`
         An two-dimensional array of sky coordinates in the coordinate
         system "coordinate_system".
+
+    Notes
+    -----
+    The coordinates are cached on the map until its metadata changes, so
+    repeated calls for the same map only have to copy them. Each call returns
+    a new copy, which can be modified without affecting the map.
     """
-    x, y = all_pixel_indices_from_map(smap)
-    return smap.wcs.pixel_to_world(x.value, y.value)
+    return smap._all_coordinates.copy()
 
 
 def all_corner_coords_from_map(smap):
@@ -99,6 +104,148 @@ def all_corner_coords_from_map(smap):
     return smap.wcs.pixel_to_world(x - 0.5, y - 0.5)
 
 
+def _verify_helioprojective_tan(smap):
+    """
+    Raises an error if the map is not in helioprojective coordinates with the
+    TAN projection and no distortions.
+    """
+    _verify_coordinate_helioprojective(smap.coordinate_frame)
+    if tuple(smap.coordinate_system) != ('HPLN-TAN', 'HPLT-TAN') or smap._pv_values:
+        raise ValueError("This function only supports helioprojective maps using the TAN "
+                         "projection without distortions, but the map has CTYPE "
+                         f"{tuple(smap.coordinate_system)}. Use the map's pixel_to_world() instead.")
+
+
+def _pixel_values(smap, x, y):
+    """
+    Returns the pixel coordinates as plain arrays, or index arrays that broadcast
+    to the shape of the map if neither is given.
+    """
+    if x is None and y is None:
+        y, x = np.indices(smap.data.shape, sparse=True)
+        return x, y
+    if x is None or y is None:
+        raise ValueError("Either both x and y must be given, or neither.")
+    return u.Quantity(x, u.pix).to_value(u.pix), u.Quantity(y, u.pix).to_value(u.pix)
+
+
+def pixel_to_helioprojective_values(smap, x=None, y=None):
+    """
+    Returns the helioprojective coordinates of pixels as plain arrays, without
+    creating a `~astropy.coordinates.SkyCoord`.
+
+    This evaluates the gnomonic (TAN) projection directly from the
+    reference pixel, scale, rotation matrix and reference coordinate of the
+    map, which is much faster than `~sunpy.map.GenericMap.pixel_to_world` for
+    large numbers of pixels. It gives the same values, to within floating-point
+    precision, but only supports maps in helioprojective coordinates using the
+    TAN projection without distortions.
+
+    Parameters
+    ----------
+    smap : `~sunpy.map.GenericMap`
+        A map in helioprojective Cartesian coordinates using the TAN projection.
+    x, y : `~astropy.units.Quantity` or array-like, optional
+        The zero-based pixel coordinates, which are assumed to be in pixels if they
+        do not have units. If neither is given, the centers of all of the pixels
+        in the map are used.
+
+    Returns
+    -------
+    Tx, Ty : `~astropy.units.Quantity`
+        The helioprojective longitude and latitude of the pixels in arcseconds,
+        with ``Tx`` wrapped to the range [-180, 180) degrees.
+    """
+    _verify_helioprojective_tan(smap)
+    x, y = _pixel_values(smap, x, y)
+
+    # Intermediate world coordinates (FITS WCS Paper I) in radians
+    pc = smap.rotation_matrix
+    dx = x - smap.reference_pixel[0].to_value(u.pix)
+    dy = y - smap.reference_pixel[1].to_value(u.pix)
+    ix = smap.scale[0].to_value(u.rad / u.pix) * (pc[0, 0] * dx + pc[0, 1] * dy)
+    iy = smap.scale[1].to_value(u.rad / u.pix) * (pc[1, 0] * dx + pc[1, 1] * dy)
+
+    # The TAN deprojection and the rotation to the reference coordinate
+    # (FITS WCS Paper II) combine into the inverse gnomonic projection
+    lon0 = smap._reference_longitude.to_value(u.rad)
+    lat0 = smap._reference_latitude.to_value(u.rad)
+    denominator = np.cos(lat0) - iy * np.sin(lat0)
+    lon = lon0 + np.arctan2(ix, denominator)
+    lat = np.arctan2(np.sin(lat0) + iy * np.cos(lat0), np.hypot(ix, denominator))
+
+    lon = (lon + np.pi) % (2 * np.pi) - np.pi
+    return (lon * u.rad).to(u.arcsec), (lat * u.rad).to(u.arcsec)
+
+
+def pixel_to_heliographic_values(smap, x=None, y=None):
+    """
+    Returns the Stonyhurst heliographic coordinates of pixels on the solar
+    surface, and the cosine of their heliocentric angle, as plain arrays.
+
+    The pixels are assumed to be on a spherical Sun with the radius
+    `~sunpy.map.GenericMap.rsun_meters`, in the same way as transforming the
+    output of `~sunpy.map.GenericMap.pixel_to_world` to
+    `~sunpy.coordinates.HeliographicStonyhurst`, but without creating any
+    `~astropy.coordinates.SkyCoord`. See `pixel_to_helioprojective_values` for
+    the maps that are supported.
+
+    Parameters
+    ----------
+    smap : `~sunpy.map.GenericMap`
+        A map in helioprojective Cartesian coordinates using the TAN projection.
+    x, y : `~astropy.units.Quantity` or array-like, optional
+        The zero-based pixel coordinates, which are assumed to be in pixels if they
+        do not have units. If neither is given, the centers of all of the pixels
+        in the map are used.
+
+    Returns
+    -------
+    lon, lat : `~astropy.units.Quantity`
+        The Stonyhurst heliographic longitude and latitude of the pixels in degrees,
+        with ``lon`` wrapped to the range [-180, 180) degrees. These are NaN for
+        pixels that are off disk.
+    mu : `~numpy.ndarray`
+        The cosine of the angle between the local vertical and the line of sight
+        to the observer, which is NaN for pixels that are off disk.
+    """
+    Tx, Ty = pixel_to_helioprojective_values(smap, x, y)
+    observer = smap.observer_coordinate
+    if observer is None:
+        raise ValueError("The map does not have an observer location, which is needed "
+                         "to calculate heliographic coordinates.")
+    tx = Tx.to_value(u.rad)
+    ty = Ty.to_value(u.rad)
+    dsun = observer.radius.to_value(u.m)
+    rsun = smap.rsun_meters.to_value(u.m)
+
+    # Distance to the solar surface along the line of sight, using the law of
+    # cosines as in Helioprojective.make_3d
+    cos_alpha = np.cos(ty) * np.cos(tx)
+    b = -2 * dsun * cos_alpha
+    c = dsun**2 - rsun**2
+    with np.errstate(invalid='ignore'):
+        distance = (-b - np.sqrt(b**2 - 4 * c)) / 2
+
+    # Heliocentric Cartesian coordinates, with z towards the observer
+    hcc_x = distance * np.cos(ty) * np.sin(tx)
+    hcc_y = distance * np.sin(ty)
+    hcc_z = dsun - distance * cos_alpha
+
+    b0 = observer.lat.to_value(u.rad)
+    l0 = observer.lon.to_value(u.rad)
+    # Rotate about the x axis by the observer latitude to get heliographic Cartesian coordinates
+    hg_z = hcc_y * np.cos(b0) + hcc_z * np.sin(b0)
+    hg_x = hcc_z * np.cos(b0) - hcc_y * np.sin(b0)
+    lat = np.arctan2(hg_z, np.hypot(hcc_x, hg_x))
+    lon = l0 + np.arctan2(hcc_x, hg_x)
+    lon = (lon + np.pi) % (2 * np.pi) - np.pi
+
+    # The surface normal is along the position vector, and the observer is on the z axis
+    mu = (hcc_z * dsun - rsun**2) / (rsun * distance)
+    return (lon * u.rad).to(u.deg), (lat * u.rad).to(u.deg), mu
+
+
 def map_edges(smap):
     """
     Returns the pixel locations of the edges of an input map.
@@ -118,10 +265,12 @@ def map_edges(smap):
     """
     # Calculate all the edge pixels
     nx, ny = smap.dimensions.x.value, smap.dimensions.y.value
-    top = list(product(np.arange(nx), [ny - 1])) * u.pix
-    bottom = list(product(np.arange(nx), [0])) * u.pix
-    left_hand_side = list(product([0], np.arange(ny))) * u.pix
-    right_hand_side = list(product([nx - 1], np.arange(ny))) * u.pix
+    x = np.arange(nx)
+    y = np.arange(ny)
+    top = np.stack([x, np.full_like(x, ny - 1)], axis=-1) * u.pix
+    bottom = np.stack([x, np.zeros_like(x)], axis=-1) * u.pix
+    left_hand_side = np.stack([np.zeros_like(y), y], axis=-1) * u.pix
+    right_hand_side = np.stack([np.full_like(y, nx - 1), y], axis=-1) * u.pix
     return top, bottom, left_hand_side, right_hand_side
 
 
@@ -195,14 +344,9 @@ def sample_at_coords(smap, coordinates):
 
 
 def _edge_coordinates(smap):
-    # Calculate all the edge pixels
-    edges = map_edges(smap)
-    # We need to strip the units from edges before handing it to np.concatenate,
-    # as the .unit attribute is not propagated in np.concatenate for numpy<1.17
-    # When sunpy depends on numpy>=1.17 this unit replacing code can be removed
-    edge_pixels = np.concatenate(edges).value
-    # Calculate the edge of the world
-    return smap.wcs.pixel_to_world(edge_pixels[:, 0], edge_pixels[:, 1])
+    # The world coordinates of the edge pixels are cached on the map, so the
+    # disk and limb checks below can be combined without recomputing them
+    return smap._edge_coordinates
 
 
 def contains_full_disk(smap):
@@ -400,8 +544,12 @@ def on_disk_bounding_coordinates(smap):
     if is_all_off_disk(smap):
         raise ValueError("The entire map is off disk.")
 
-    # Get all the coordinates from the input map
-    coordinates = all_coordinates_from_map(smap)
+    # If the edges are all on disk, then so is the rest of the map, and the
+    # extreme coordinates lie on the edges, so there is no need for the full grid
+    if is_all_on_disk(smap):
+        coordinates = _edge_coordinates(smap)
+    else:
+        coordinates = smap._all_coordinates
 
     # Find which coordinates are on the disk
     on_disk = coordinate_is_on_solar_disk(coordinates)
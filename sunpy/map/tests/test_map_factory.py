@@ -1,6 +1,7 @@
 import os
 import pathlib
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -264,6 +265,65 @@ def test_dask_array():
     assert isinstance(pair_map, sunpy.map.GenericMap)
 
 
+def test_lazy():
+    pytest.importorskip('dask')
+    eager_map = sunpy.map.Map(AIA_171_IMAGE)
+    lazy_map = sunpy.map.Map(AIA_171_IMAGE, lazy=True)
+    assert isinstance(lazy_map, type(eager_map))
+    assert lazy_map.date == eager_map.date
+    assert lazy_map.wavelength == eager_map.wavelength
+    assert lazy_map.observer_coordinate == eager_map.observer_coordinate
+    assert lazy_map.data.shape == eager_map.data.shape
+    np.testing.assert_array_equal(lazy_map.data.compute(), eager_map.data)
+
+
+def test_lazy_sequence(eit_fits_directory):
+    pytest.importorskip('dask')
+    eager_seq = sunpy.map.Map(eit_fits_directory, sequence=True)
+    lazy_seq = sunpy.map.Map(eit_fits_directory, sequence=True, lazy=True)
+    assert len(lazy_seq) == len(eager_seq)
+    for lazy_map, eager_map in zip(lazy_seq, eager_seq):
+        assert lazy_map.date == eager_map.date
+        np.testing.assert_array_equal(lazy_map.data.compute(), eager_map.data)
+
+
+@pytest.mark.parametrize('kwargs', [{'workers': 2}, {'executor': ThreadPoolExecutor(max_workers=3)}])
+def test_concurrent_read(eit_fits_directory, kwargs):
+    serial_maps = sunpy.map.Map(eit_fits_directory, AIA_171_IMAGE, AIA_MAP)
+    concurrent_maps = sunpy.map.Map(eit_fits_directory, AIA_171_IMAGE, AIA_MAP, **kwargs)
+    assert len(concurrent_maps) == len(serial_maps)
+    for concurrent_map, serial_map in zip(concurrent_maps, serial_maps):
+        assert concurrent_map.date == serial_map.date
+        assert concurrent_map.meta == serial_map.meta
+
+
+@pytest.mark.thread_unsafe(reason="mocks a function")
+def test_concurrent_read_with_one_broken(mocker):
+    files = [AIA_171_IMAGE, get_test_filepath('not_actually_fits.fits'), AIA_171_IMAGE]
+    detect_filetype = mocker.patch("sunpy.map.map_factory.detect_filetype",
+                                   wraps=sunpy.map.map_factory.detect_filetype)
+    with pytest.warns(SunpyUserWarning, match='Failed to read'):
+        amap = sunpy.map.Map(files, allow_errors=True, workers=2)
+    assert len(amap) == 2
+    # The broken file is not read again after failing in a worker
+    assert detect_filetype.call_count == 3
+
+    with pytest.raises(OSError, match='(?s)Failed to read.*allow_errors=True'):
+        sunpy.map.Map(files, workers=2)
+
+
+def test_concurrent_read_with_one_broken_process_pool():
+    files = [AIA_171_IMAGE, get_test_filepath('not_actually_fits.fits')]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        # The warning is given in this process, not in the worker process
+        with pytest.warns(SunpyUserWarning, match='Failed to read'):
+            amap = sunpy.map.Map(files, allow_errors=True, executor=executor)
+        assert isinstance(amap, sunpy.map.GenericMap)
+
+        with pytest.raises(OSError, match='(?s)Failed to read.*allow_errors=True'):
+            sunpy.map.Map(files, executor=executor)
+
+
 @pytest.mark.remote_data
 def test_url_pattern():
     # A URL
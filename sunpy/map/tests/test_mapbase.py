@@ -204,6 +204,25 @@ def test_obs_coord_cache(aia171_test_map):
     assert new_coord.radius != coord2.radius
 
 
+def test_meta_derived_properties_cache(aia171_test_map):
+    aia171_test_map = deepcopy(aia171_test_map)  # for thread safety
+
+    for prop in ['wcs', 'coordinate_frame', 'scale', '_rotation_matrix']:
+        assert getattr(aia171_test_map, prop) is getattr(aia171_test_map, prop)
+
+    # The public rotation matrix is a copy, so modifying it does not change the cache
+    rotation_matrix = aia171_test_map.rotation_matrix
+    rotation_matrix[0, 1] = 10
+    assert aia171_test_map.rotation_matrix[0, 1] != 10
+
+    wcs = aia171_test_map.wcs
+    aia171_test_map.meta['cdelt1'] *= 2
+    # Accessing a different cached property first must not leave the wcs stale
+    assert_quantity_allclose(aia171_test_map.scale[0], 2 * wcs.wcs.cdelt[0] * u.deg / u.pix)
+    assert aia171_test_map.wcs is not wcs
+    assert u.allclose(aia171_test_map.wcs.wcs.cdelt[0], 2 * wcs.wcs.cdelt[0])
+
+
 def test_header_immutability(aia171_test_map):
     # Check that accessing the wcs of a map doesn't modify the meta data
     assert 'KEYCOMMENTS' in aia171_test_map.meta
@@ -1048,6 +1067,21 @@ def test_superpixel_masked_conservative_mask_true(aia171_test_map_with_mask):
     assert np.array_equal(superpix_map.mask, expected_mask)
 
 
+def test_superpixel_memmap(aia171_test_map, tmp_path):
+    data = np.memmap(tmp_path / 'data.dat', dtype=aia171_test_map.data.dtype, mode='w+',
+                     shape=aia171_test_map.data.shape)
+    data[:] = aia171_test_map.data
+    data.flush()
+    data = np.memmap(tmp_path / 'data.dat', dtype=aia171_test_map.data.dtype, mode='r',
+                     shape=aia171_test_map.data.shape)
+    memmap_map = aia171_test_map._new_instance(data, aia171_test_map.meta)
+    # A read-only memory map is reduced without needing a writeable copy
+    superpix_map = memmap_map.superpixel((4, 2) * u.pix, offset=(1, 1) * u.pix)
+    expected = aia171_test_map.superpixel((4, 2) * u.pix, offset=(1, 1) * u.pix)
+    assert_quantity_allclose(superpix_map.data, expected.data)
+    assert superpix_map.meta == expected.meta
+
+
 def test_superpixel_units(generic_map):
     new_dims = (2, 2) * u.pix
     super1 = generic_map.superpixel(new_dims)
@@ -1797,7 +1831,8 @@ def test_draw_carrington_map(carrington_map):
     return fig
 
 
-@pytest.mark.parametrize('method', _rotation_registry.keys())
+# The 'scipy-tiled' method gives identical output to the 'scipy' method
+@pytest.mark.parametrize('method', [meth for meth in _rotation_registry if meth != 'scipy-tiled'])
 @figure_test
 def test_derotating_nonpurerotation_pcij(aia171_test_map, method):
     # The following map has a a PCij matrix that is not a pure rotation
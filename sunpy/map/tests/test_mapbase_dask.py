@@ -41,9 +41,12 @@ with pytest.warns(VerifyWarning, match="Invalid 'BLANK' keyword in header."):  #
     ("max", {}),
     ("mean", {}),
     ("min", {}),
-    pytest.param("reproject_to", {"wcs": aia_wcs}, marks=pytest.mark.xfail(reason="reproject is not dask aware")),
-    pytest.param("resample", {"dimensions": (100, 100)*u.pix}, marks=pytest.mark.xfail()),
-    pytest.param("rotate", {}, marks=pytest.mark.xfail(reason="nanmedian is not implemented in Dask")),
+    ("reproject_to", {"target_wcs": aia_wcs}),
+    ("resample", {"dimensions": (100, 100)*u.pix}),
+    ("resample", {"dimensions": (100, 100)*u.pix, "method": "nearest"}),
+    ("resample", {"dimensions": (100, 100)*u.pix, "method": "spline"}),
+    ("rotate", {}),
+    ("rotate", {"angle": 30*u.deg, "order": 1, "missing": 0}),
     ("std", {}),
     ("superpixel", {"dimensions": (10, 10)*u.pix}),
     ("submap", {"bottom_left": (100, 100)*u.pixel, "width": 10*u.pixel, "height": 10*u.pixel}),
@@ -59,7 +62,33 @@ def test_method_preserves_dask_array(aia171_test_map, aia171_test_dask_map, func
     result_is_map = isinstance(res, sunpy.map.GenericMap)
     if result_is_map:
         assert isinstance(res_dask.data, type(aia171_test_dask_map.data))
-        assert np.allclose(res_dask.data.compute(), res.data, atol=0.0, rtol=0.0)
+        assert np.allclose(res_dask.data.compute(), res.data, atol=0.0, rtol=0.0, equal_nan=True)
     else:
         assert isinstance(res_dask, type(aia171_test_dask_map.data))
         assert np.allclose(res_dask.compute(), res, atol=0.0, rtol=0.0)
+
+
+@pytest.mark.parametrize('order', range(6))
+def test_rotate_dask_chunks(aia171_test_map, order):
+    dask_array = pytest.importorskip('dask.array')
+    data = aia171_test_map.data.copy()
+    data[40:45, 60:70] = np.nan
+    nan_map = aia171_test_map._new_instance(data, aia171_test_map.meta)
+    dask_map = nan_map._new_instance(dask_array.from_array(data, chunks=(50, 40)), nan_map.meta)
+
+    res_dask = dask_map.rotate(20*u.deg, order=order, recenter=True)
+    res = nan_map.rotate(20*u.deg, order=order, recenter=True)
+    assert isinstance(res_dask.data, dask_array.Array)
+    np.testing.assert_array_equal(res_dask.data.compute(), res.data)
+    assert res_dask.meta == res.meta
+
+
+@pytest.mark.parametrize('method', ['nearest', 'linear', 'spline'])
+def test_resample_dask_chunks(aia171_test_map, method):
+    dask_array = pytest.importorskip('dask.array')
+    dask_map = aia171_test_map._new_instance(dask_array.from_array(aia171_test_map.data, chunks=(50, 40)),
+                                             aia171_test_map.meta)
+    res_dask = dask_map.resample((90, 70)*u.pix, method=method)
+    res = aia171_test_map.resample((90, 70)*u.pix, method=method)
+    assert isinstance(res_dask.data, dask_array.Array)
+    np.testing.assert_array_equal(res_dask.data.compute(), res.data)
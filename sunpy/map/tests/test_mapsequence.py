@@ -86,6 +86,125 @@ def test_as_array_some_masks(mapsequence_all_the_same_some_have_masks):
     assert np.all(np.logical_not(mask[0:2, 0:3, 2]))
 
 
+def test_stacked(aia171_test_map, aia171_test_map_with_mask):
+    maps = [aia171_test_map, aia171_test_map_with_mask, aia171_test_map]
+    unstacked = sunpy.map.MapSequence(maps)
+    stacked = sunpy.map.MapSequence(maps, stack=True)
+    assert stacked._is_stacked
+
+    data = stacked.data
+    np.testing.assert_array_equal(data, unstacked.data)
+    np.testing.assert_array_equal(stacked.mask, unstacked.mask)
+    # The data is a view of the stacked array, and each map holds a view of its frame
+    assert np.shares_memory(data, stacked.data)
+    for i, m in enumerate(stacked):
+        assert np.shares_memory(m.data, data[..., i])
+    # The input maps are not modified
+    for m in maps:
+        assert not np.shares_memory(m.data, data)
+    stacked[0].meta['telescop'] = 'changed'
+    stacked[0].plot_settings['cmap'] = 'gray'
+    assert aia171_test_map.meta['telescop'] != 'changed'
+    assert aia171_test_map.plot_settings['cmap'] != 'gray'
+
+    sliced = stacked[1:]
+    assert sliced._is_stacked
+    assert np.shares_memory(sliced.data, data)
+    np.testing.assert_array_equal(sliced.data, data[..., 1:])
+
+    # Replacing a map falls back to stacking the data on access
+    stacked.maps[0] = aia171_test_map
+    assert not stacked._is_stacked
+    assert not np.shares_memory(stacked.data, data)
+    np.testing.assert_array_equal(stacked.data, unstacked.data)
+
+
+def test_stacked_out(aia171_test_map, tmp_path):
+    out = np.memmap(tmp_path / 'stack.dat', dtype=aia171_test_map.data.dtype, mode='w+',
+                    shape=(2, *aia171_test_map.data.shape))
+    stacked = sunpy.map.MapSequence([aia171_test_map, aia171_test_map], stack=out)
+    assert np.shares_memory(stacked.data, out)
+    np.testing.assert_array_equal(out[1], aia171_test_map.data)
+
+    with pytest.raises(ValueError, match='must have shape'):
+        sunpy.map.MapSequence([aia171_test_map], stack=out)
+
+
+def test_stacked_different_shapes(mapsequence_different):
+    with pytest.raises(ValueError, match='Not all maps have the same shape.'):
+        sunpy.map.MapSequence(mapsequence_different.maps, stack=True)
+
+
+def test_stacked_dask(aia171_test_map):
+    dask_array = pytest.importorskip('dask.array')
+    dask_map = aia171_test_map._new_instance(dask_array.from_array(aia171_test_map.data),
+                                             aia171_test_map.meta)
+    stacked = sunpy.map.MapSequence([dask_map, aia171_test_map], stack=True)
+    assert isinstance(stacked.data, dask_array.Array)
+    assert stacked.data.shape == (128, 128, 2)
+    np.testing.assert_array_equal(stacked.data.compute()[..., 0], aia171_test_map.data)
+
+
+def assert_sequence_matches_maps(sequence, maps):
+    assert len(sequence) == len(maps)
+    for seq_map, m in zip(sequence, maps):
+        assert type(seq_map) is type(m)
+        np.testing.assert_allclose(seq_map.data, m.data, equal_nan=True)
+        assert seq_map.meta == m.meta
+        if m.mask is None:
+            assert seq_map.mask is None
+        else:
+            np.testing.assert_array_equal(seq_map.mask, m.mask)
+
+
+@pytest.mark.parametrize('conservative_mask', [False, True])
+def test_batch_superpixel(mapsequence_all_the_same_some_have_masks, conservative_mask):
+    sequence = mapsequence_all_the_same_some_have_masks
+    kwargs = dict(dimensions=(4, 2)*u.pix, offset=(1, 3)*u.pix, func=np.mean,
+                  conservative_mask=conservative_mask)
+    result = sequence.superpixel(**kwargs)
+    assert result._is_stacked
+    assert_sequence_matches_maps(result, [m.superpixel(**kwargs) for m in sequence])
+
+
+@pytest.mark.parametrize('method', ['nearest', 'linear', 'spline'])
+def test_batch_resample(mapsequence_all_the_same, method):
+    result = mapsequence_all_the_same.resample((40, 50)*u.pix, method=method)
+    assert result._is_stacked
+    assert_sequence_matches_maps(
+        result, [m.resample((40, 50)*u.pix, method=method) for m in mapsequence_all_the_same])
+
+
+def test_batch_rotate(aia171_test_map):
+    sequence = sunpy.map.MapSequence([aia171_test_map, aia171_test_map], stack=True)
+    result = sequence.rotate(30*u.deg, order=1, recenter=True)
+    assert result._is_stacked
+    assert_sequence_matches_maps(result, [m.rotate(30*u.deg, order=1, recenter=True)
+                                          for m in sequence])
+
+
+def test_batch_rotate_different_rotations(aia171_test_map):
+    rotated_map = aia171_test_map._new_instance(aia171_test_map.data, aia171_test_map.meta.copy())
+    rotated_map.meta['crota2'] = 10
+    sequence = sunpy.map.MapSequence([aia171_test_map, rotated_map], sortby=None)
+    result = sequence.rotate(order=1)
+    assert not result._is_stacked
+    assert_sequence_matches_maps(result, [m.rotate(order=1) for m in sequence])
+
+
+def test_batch_submap(mapsequence_all_the_same_some_have_masks):
+    sequence = mapsequence_all_the_same_some_have_masks
+    result = sequence.submap([10, 20]*u.pix, top_right=[50, 40]*u.pix)
+    assert result._is_stacked
+    assert_sequence_matches_maps(result, [m.submap([10, 20]*u.pix, top_right=[50, 40]*u.pix)
+                                          for m in sequence])
+
+    bottom_left = sequence[0].pixel_to_world(10*u.pix, 20*u.pix)
+    result = sequence.submap(bottom_left, width=100*u.arcsec, height=80*u.arcsec)
+    assert_sequence_matches_maps(result, [m.submap(bottom_left, width=100*u.arcsec, height=80*u.arcsec)
+                                          for m in sequence])
+
+
 def test_all_meta(mapsequence_all_the_same):
     meta = mapsequence_all_the_same.meta
     assert len(meta) == 2
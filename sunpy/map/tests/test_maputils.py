@@ -25,6 +25,8 @@ from sunpy.map.maputils import (
     is_all_on_disk,
     map_edges,
     on_disk_bounding_coordinates,
+    pixel_to_heliographic_values,
+    pixel_to_helioprojective_values,
     pixelate_coord_path,
     sample_at_coords,
     solar_angular_radius,
@@ -106,6 +108,82 @@ def test_all_coordinates_from_map(sub_smap):
     assert_quantity_allclose(ypix, sub_smap.dimensions[1] - 1*u.pix)
 
 
+def test_all_coordinates_from_map_cached(sub_smap):
+    coordinates = all_coordinates_from_map(sub_smap)
+    cached = sub_smap._all_coordinates
+    assert sub_smap._all_coordinates is cached
+
+    # The returned coordinates are a copy, so modifying them leaves the cache alone
+    assert coordinates is not cached
+    coordinates[0, 0] = coordinates[1, 1]
+    assert_quantity_allclose(all_coordinates_from_map(sub_smap).Tx[0, 0], cached.Tx[0, 0])
+    assert cached.Tx[0, 0] != cached.Tx[1, 1]
+
+    # Changing the metadata invalidates the cache
+    sub_smap.meta['crpix1'] += 1
+    new_coordinates = all_coordinates_from_map(sub_smap)
+    assert sub_smap._all_coordinates is not cached
+    x, y = all_pixel_indices_from_map(sub_smap)
+    expected = sub_smap.wcs.pixel_to_world(x.value, y.value)
+    assert_quantity_allclose(new_coordinates.Tx, expected.Tx)
+    assert_quantity_allclose(new_coordinates.Ty, expected.Ty)
+
+
+@pytest.fixture(params=[0, 30], ids=['unrotated', 'rotated'])
+def general_tan_map(request, aia171_test_map):
+    smap = aia171_test_map.rotate(request.param*u.deg)
+    smap.meta['crval1'] = 500
+    smap.meta['crval2'] = -300
+    return smap
+
+
+def test_pixel_to_helioprojective_values(general_tan_map):
+    Tx, Ty = pixel_to_helioprojective_values(general_tan_map)
+    expected = all_coordinates_from_map(general_tan_map)
+    assert Tx.shape == Ty.shape == general_tan_map.data.shape
+    assert_quantity_allclose(Tx, expected.Tx, atol=1e-6*u.arcsec)
+    assert_quantity_allclose(Ty, expected.Ty, atol=1e-6*u.arcsec)
+
+    x = [-0.5, 10.2, 50] * u.pix
+    y = [3, 100.7, -20]
+    Tx, Ty = pixel_to_helioprojective_values(general_tan_map, x, y)
+    expected = general_tan_map.wcs.pixel_to_world(x.value, y)
+    assert_quantity_allclose(Tx, expected.Tx, atol=1e-6*u.arcsec)
+    assert_quantity_allclose(Ty, expected.Ty, atol=1e-6*u.arcsec)
+
+
+def test_pixel_to_heliographic_values(general_tan_map):
+    lon, lat, mu = pixel_to_heliographic_values(general_tan_map)
+    hgs = HeliographicStonyhurst(obstime=general_tan_map.reference_date)
+    expected = all_coordinates_from_map(general_tan_map).transform_to(hgs)
+    assert np.any(np.isnan(lon))
+    assert np.all(np.isnan(lon) == np.isnan(expected.lon))
+    assert_quantity_allclose(lon, expected.lon, atol=1e-8*u.deg)
+    assert_quantity_allclose(lat, expected.lat, atol=1e-8*u.deg)
+
+    surface = expected.cartesian.xyz
+    to_observer = general_tan_map.observer_coordinate.cartesian.xyz[:, np.newaxis, np.newaxis] - surface
+    expected_mu = (np.sum(surface * to_observer, axis=0)
+                   / np.linalg.norm(surface, axis=0) / np.linalg.norm(to_observer, axis=0))
+    np.testing.assert_allclose(mu, expected_mu.to_value(u.one), atol=1e-8)
+    assert np.nanmin(mu) >= 0
+    assert np.nanmax(mu) <= 1
+
+
+def test_pixel_to_values_unsupported(aia171_test_map, non_helioprojective_map):
+    with pytest.raises(ValueError, match="must be in the Helioprojective frame"):
+        pixel_to_helioprojective_values(non_helioprojective_map)
+
+    arc_map = aia171_test_map._new_instance(aia171_test_map.data, aia171_test_map.meta.copy())
+    arc_map.meta['ctype1'] = 'HPLN-ARC'
+    arc_map.meta['ctype2'] = 'HPLT-ARC'
+    with pytest.raises(ValueError, match="TAN projection"):
+        pixel_to_heliographic_values(arc_map)
+
+    with pytest.raises(ValueError, match="both x and y"):
+        pixel_to_helioprojective_values(aia171_test_map, x=[1, 2]*u.pix)
+
+
 def test_all_corner_coordinates_from_map(sub_smap):
     coordinates = all_corner_coords_from_map(sub_smap)
     shape = sub_smap.data.shape
@@ -208,6 +286,16 @@ def test_on_disk_bounding_coordinates(aia171_test_map):
     np.testing.assert_almost_equal(tr.Ty.to(u.arcsec).value, 971.63586861, decimal=1)
 
 
+def test_on_disk_bounding_coordinates_all_on_disk(all_on_disk_map):
+    # The map is entirely on disk, so the bounding box is found from the edges
+    bl, tr = on_disk_bounding_coordinates(all_on_disk_map)
+    coordinates = all_coordinates_from_map(all_on_disk_map)
+    assert_quantity_allclose(bl.Tx, coordinates.Tx.min())
+    assert_quantity_allclose(bl.Ty, coordinates.Ty.min())
+    assert_quantity_allclose(tr.Tx, coordinates.Tx.max())
+    assert_quantity_allclose(tr.Ty, coordinates.Ty.max())
+
+
 def test_data_at_coordinates(aia171_test_map, aia_test_arc):
     data = sample_at_coords(aia171_test_map, aia_test_arc.coordinates())
     pixels = np.asarray(np.rint(
@@ -181,6 +181,7 @@ class QueryResponseTable(QTable):
     display_keys = TableAttribute(default=slice(None))
     hide_keys = TableAttribute()
     errors = TableAttribute(default=[])
+    search_time = TableAttribute()
 
     size_column = None
 
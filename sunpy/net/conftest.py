@@ -0,0 +1,36 @@
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+
+@pytest.fixture
+def local_http_server():
+    """
+    Starts local HTTP servers which are shut down at the end of the test.
+
+    This returns a function which takes a request handler class, and
+    optionally a directory for it to serve files from, and returns the URL of
+    a server using that handler. The handler does not log requests.
+    """
+    servers = []
+
+    def serve(handler, directory=None):
+        class QuietHandler(handler):
+            def log_message(self, *args):
+                pass
+
+        if directory is not None:
+            QuietHandler = partial(QuietHandler, directory=directory)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), QuietHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        servers.append((server, thread))
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield serve
+    for server, thread in servers:
+        server.shutdown()
+        server.server_close()
+        thread.join()
@@ -7,9 +7,16 @@ This module provides the `Fido
 `parfive.Results` class that is returned by
 `Fido.fetch <sunpy.net.fido_factory.UnifiedDownloaderFactory.fetch>`.
 """
+import asyncio
+import contextlib
 import os
+import queue
 import re
+import threading
+import time
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from textwrap import dedent
 
@@ -17,16 +24,17 @@ import numpy as np
 import parfive
 from packaging.version import Version
 
+import astropy.units as u
 from astropy.table import Table
 
-from sunpy import config
+from sunpy import config, log
 from sunpy.net import attr, vso
 from sunpy.net.base_client import BaseClient, QueryResponseColumn, QueryResponseRow, QueryResponseTable
 from sunpy.util.datatype_factory_base import BasicRegistrationFactory, NoMatchError
-from sunpy.util.parfive_helpers import Downloader, Results
+from sunpy.util.parfive_helpers import Downloader, Results, _StreamingDownloader
 from sunpy.util.util import get_width
 
-__all__ = ['Fido', 'UnifiedResponse', 'UnifiedDownloaderFactory']
+__all__ = ['Fido', 'UnifiedResponse', 'UnifiedDownloaderFactory', 'FetchIterator']
 
 parfive_version = Version(parfive.__version__)
 
@@ -301,19 +309,20 @@ class UnifiedResponse(Sequence):
 
 query_walker = attr.AttrWalker()
 """
-We construct an `AttrWalker` which calls `_make_query_to_client` for each
+We construct an `AttrWalker` which calls `_client_searches` for each
 logical component of the query, i.e. any block which are ANDed together.
+The searches of all the components are then run together by ``search``.
 """
 
 
 @query_walker.add_creator(attr.DataAttr)
 def _create_data(walker, query, factory):
-    return factory._make_query_to_client(query)
+    return factory._client_searches(query)
 
 
 @query_walker.add_creator(attr.AttrAnd)
 def _create_and(walker, query, factory):
-    return factory._make_query_to_client(*query.attrs)
+    return factory._client_searches(*query.attrs)
 
 
 @query_walker.add_creator(attr.AttrOr)
@@ -325,6 +334,140 @@ def _create_or(walker, query, factory):
     return qblocks
 
 
+class _ClientSearch:
+    """
+    The search of one client for one block of a query, which records how long it takes.
+
+    If a query cache is given, the response is read from it when possible, and
+    otherwise stored in it.
+    """
+
+    def __init__(self, client, query, cache=None):
+        self.client = client
+        self.query = query
+        self.cache = cache
+
+    def run(self):
+        start = time.perf_counter()
+        res = None if self.cache is None else self.cache.get(self.client, self.query)
+        if res is not None:
+            res.search_time = (time.perf_counter() - start) * u.s
+            log.debug(f"The {self.client.__class__.__name__} response was read from the cache")
+            return res
+        try:
+            res = self.client.search(*self.query)
+        except Exception as err:
+            res = QueryResponseTable([], client=self.client, errors=err)
+        else:
+            if self.cache is not None:
+                self.cache.store(self.client, self.query, res)
+        res.search_time = (time.perf_counter() - start) * u.s
+        log.debug(f"The {self.client.__class__.__name__} search took {res.search_time:.2f}")
+        return res
+
+    def timed_out(self, timeout):
+        err = TimeoutError(f"The {self.client.__class__.__name__} search did not finish "
+                           f"within {timeout} seconds.")
+        res = QueryResponseTable([], client=self.client, errors=err)
+        res.search_time = timeout * u.s
+        log.debug(str(err))
+        return res
+
+
+class FetchIterator:
+    """
+    The object returned by `Fido.fetch_iter <sunpy.net.fido_factory.UnifiedDownloaderFactory.fetch_iter>`.
+
+    Iterating over this object, with either a ``for`` loop or an ``async for``
+    loop, downloads the files and yields the path of each file as soon as it has
+    been downloaded. It can only be iterated over once.
+
+    A ``for`` loop runs the downloads in a separate thread. If the loop is
+    stopped early, the downloads that have not finished are cancelled.
+
+    Attributes
+    ----------
+    results : `parfive.Results`
+        The paths of the files that have been downloaded so far, and the errors of
+        any downloads that have failed (in ``results.errors``). Once the iteration
+        has finished this is the same as the return value of
+        `Fido.fetch <sunpy.net.fido_factory.UnifiedDownloaderFactory.fetch>`, and
+        can be passed to it to retry the failed downloads.
+    """
+
+    def __init__(self, enqueue, downloader):
+        self._enqueue = enqueue
+        self._downloader = downloader
+        self._started = False
+        self.results = Results()
+
+    @property
+    def errors(self):
+        """
+        The errors of any downloads that have failed so far.
+        """
+        return self.results.errors
+
+    def _start(self):
+        if self._started:
+            raise RuntimeError("The downloads can only be iterated over once.")
+        self._started = True
+
+    async def _download(self):
+        # The clients can make blocking requests (e.g., to stage the data) when queueing files
+        reslist = await asyncio.get_running_loop().run_in_executor(None, self._enqueue)
+        UnifiedDownloaderFactory._combine_results(self.results, reslist)
+        for path in list(self.results):
+            yield path
+        async for result in self._downloader.run_download_iter():
+            self.results.data += result.data
+            self.results._errors += result.errors
+            for path in result:
+                yield path
+
+    def __aiter__(self):
+        self._start()
+        return self._download()
+
+    def __iter__(self):
+        self._start()
+        items = queue.Queue()
+        done = object()
+        runner = asyncio.Runner()
+
+        async def produce():
+            try:
+                async for path in self._download():
+                    items.put(path)
+            except Exception as e:
+                items.put(e)
+            finally:
+                items.put(done)
+
+        def run():
+            with runner, contextlib.suppress(asyncio.CancelledError):
+                runner.run(produce())
+
+        # The event loop is created here so that the downloads can be cancelled at any time
+        loop = runner.get_loop()
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        try:
+            while (item := items.get()) is not done:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if thread.is_alive():
+                loop.call_soon_threadsafe(_cancel_all_tasks, loop)
+            thread.join()
+
+
+def _cancel_all_tasks(loop):
+    for task in asyncio.all_tasks(loop):
+        task.cancel()
+
+
 class UnifiedDownloaderFactory(BasicRegistrationFactory):
     """
     Fido is a unified data search and retrieval tool.
@@ -335,12 +478,18 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
 
     For details of using `~sunpy.net.Fido` see :ref:`sunpy-tutorial-acquiring-data-index`.
 
+    The responses of searches are stored on disk and reused if a
+    `~sunpy.net.query_cache.QueryCache` is assigned to ``query_cache``.
     """
+    # Opt-in, as a cached response does not show data which has been added since
+    query_cache = None
 
-    def search(self, *query):
+    def search(self, *query, timeout=None):
         """
         Query for data in form of multiple parameters.
 
+        The searches of the different clients are run at the same time.
+
         Examples
         --------
         Query for LYRA timeseries data for the time range ('2012/3/4','2012/3/6')
@@ -370,11 +519,22 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
             requested data. The query is specified using attributes from the
             VSO and the JSOC. The query can mix attributes from the VSO and
             the JSOC.
+        timeout : `float`, optional
+            The maximum time in seconds to wait for the search of each client.
+            The response of a client that does not finish in time is empty, and
+            has a `TimeoutError` in its ``errors``. Defaults to no limit.
 
         Returns
         -------
         `sunpy.net.fido_factory.UnifiedResponse`
-            Container of responses returned by clients servicing query.
+            Container of responses returned by clients servicing query. The time
+            taken by the search of each client is in the ``search_time`` attribute
+            of its response.
+
+        See Also
+        --------
+        sunpy.net.query_cache.QueryCache
+            To store the responses on disk and reuse them for the same query.
 
         Notes
         -----
@@ -384,7 +544,7 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
         parts individually.
         """
         query = attr.and_(*query)
-        results = query_walker.create(query, self)
+        results = self._run_searches(query_walker.create(query, self), timeout)
 
         # If we have searched the VSO but no results were returned, but another
         # client generated results, we drop the empty VSO results for tidiness.
@@ -438,35 +598,15 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
         >>> filepaths = Fido.fetch(filepaths)  # doctest: +SKIP
 
         """
-        if path is None:
-            path = Path(config.get('downloads', 'download_dir')) / '{file}'
-        elif isinstance(path, str | os.PathLike) and '{file}' not in str(path):
-            path = Path(path) / '{file}'
-        else:
-            path = Path(path)
-        path = path.expanduser()
-
-        # Ensure we have write permissions to the path
-        exists = list(filter(lambda p: p.exists(), Path(path).resolve().parents))
-        if not os.access(exists[0], os.W_OK):
-            raise PermissionError('You do not have permission to write'
-                                  f' to the directory {exists[0]}.')
+        path = self._fetch_path(path)
 
         if "wait" in kwargs:
             raise ValueError("wait is not a valid keyword argument to Fido.fetch.")
 
-        # Avoid more than one connection for JSOC only requests.
-        from sunpy.net.jsoc import JSOCClient
-
         max_splits = kwargs.get('max_splits', 5)
-        is_jsoc_only = False
-        for query_result in query_results:
-            if isinstance(query_result, UnifiedResponse):
-                is_jsoc_only = all([isinstance(result.client, JSOCClient) for result in query_result])
-            elif isinstance(query_result, QueryResponseTable):
-                is_jsoc_only = all([isinstance(result.table.client, JSOCClient) for result in query_result])
         if downloader is None:
-            if is_jsoc_only:
+            # Avoid more than one connection for JSOC only requests.
+            if self._is_jsoc_only(query_results):
                 max_conn = 1
                 max_splits = 1
             downloader = Downloader(max_conn=max_conn, progress=progress, overwrite=overwrite, max_splits=max_splits)
@@ -485,6 +625,119 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
         elif any(retries):
             raise TypeError("If any arguments to fetch are `parfive.Results` objects, all arguments must be.")
 
+        reslist = self._enqueue_query_results(query_results, path, downloader, **kwargs)
+
+        results = downloader.download()
+        # Combine the results objects from all the clients into one Results object.
+        self._combine_results(results, reslist)
+
+        return results
+
+    def fetch_iter(self, *query_results, path=None, max_conn=5, progress=True,
+                   overwrite=False, **kwargs):
+        """
+        Download the records represented by `~sunpy.net.base_client.QueryResponseTable` or
+        `~sunpy.net.fido_factory.UnifiedResponse` objects, yielding the path of each
+        file as soon as it has been downloaded.
+
+        This is a streaming version of
+        `Fido.fetch <sunpy.net.fido_factory.UnifiedDownloaderFactory.fetch>`, which
+        allows the files to be used while the rest are still downloading. Nothing is
+        downloaded until the returned object is iterated over, which can be done with
+        either a ``for`` loop or an ``async for`` loop.
+
+        Parameters
+        ----------
+        *query_results : `sunpy.net.fido_factory.UnifiedResponse` or `~sunpy.net.base_client.QueryResponseTable`
+            Container returned by query method, or multiple.
+        path : `str`
+            The directory to retrieve the files into. See
+            `Fido.fetch <sunpy.net.fido_factory.UnifiedDownloaderFactory.fetch>`.
+        max_conn : `int`, optional
+            The number of files to download at once.
+        progress : `bool`, optional
+            If `True` show a progress bar showing how many of the total files
+            have been downloaded.
+        overwrite : `bool` or `str`, optional
+            Determine how to handle downloading if a file already exists with the
+            same name. See `Fido.fetch <sunpy.net.fido_factory.UnifiedDownloaderFactory.fetch>`.
+
+        Returns
+        -------
+        `sunpy.net.fido_factory.FetchIterator`
+            An iterable of the paths of the downloaded files, in the order that they finish.
+            Any downloads that fail are recorded in its ``errors`` attribute.
+
+        Examples
+        --------
+        >>> import sunpy.map
+        >>> from sunpy.net.attrs import Time, Instrument
+        >>> unifresp = Fido.search(Time('2012/3/4','2012/3/5'), Instrument('EIT'))  # doctest: +REMOTE_DATA
+        >>> downloads = Fido.fetch_iter(unifresp)  # doctest: +SKIP
+        >>> for filepath in downloads:  # doctest: +SKIP
+        ...     eit_map = sunpy.map.Map(filepath)
+
+        Any downloads that failed can be retried by passing the
+        `~sunpy.net.fido_factory.FetchIterator.results` to ``fetch``.
+
+        >>> filepaths = Fido.fetch(downloads.results)  # doctest: +SKIP
+        """
+        path = self._fetch_path(path)
+
+        if "wait" in kwargs:
+            raise ValueError("wait is not a valid keyword argument to Fido.fetch_iter.")
+        if any(isinstance(arg, Results) for arg in query_results):
+            raise TypeError("Failed downloads can only be retried with Fido.fetch.")
+
+        max_splits = kwargs.get('max_splits', 5)
+        # Avoid more than one connection for JSOC only requests.
+        if self._is_jsoc_only(query_results):
+            max_conn = 1
+            max_splits = 1
+        downloader = _StreamingDownloader(max_conn=max_conn, progress=progress,
+                                          overwrite=overwrite, max_splits=max_splits)
+        return FetchIterator(partial(self._enqueue_query_results, query_results, path,
+                                     downloader, **kwargs),
+                             downloader)
+
+    @staticmethod
+    def _fetch_path(path):
+        """
+        Return the path template to download files to, checking that it can be written to.
+        """
+        if path is None:
+            path = Path(config.get('downloads', 'download_dir')) / '{file}'
+        elif isinstance(path, str | os.PathLike) and '{file}' not in str(path):
+            path = Path(path) / '{file}'
+        else:
+            path = Path(path)
+        path = path.expanduser()
+
+        # Ensure we have write permissions to the path
+        exists = list(filter(lambda p: p.exists(), Path(path).resolve().parents))
+        if not os.access(exists[0], os.W_OK):
+            raise PermissionError('You do not have permission to write'
+                                  f' to the directory {exists[0]}.')
+        return path
+
+    @staticmethod
+    def _is_jsoc_only(query_results):
+        from sunpy.net.jsoc import JSOCClient
+
+        is_jsoc_only = False
+        for query_result in query_results:
+            if isinstance(query_result, UnifiedResponse):
+                is_jsoc_only = all([isinstance(result.client, JSOCClient) for result in query_result])
+            elif isinstance(query_result, QueryResponseTable):
+                is_jsoc_only = all([isinstance(result.table.client, JSOCClient) for result in query_result])
+        return is_jsoc_only
+
+    @staticmethod
+    def _enqueue_query_results(query_results, path, downloader, **kwargs):
+        """
+        Queue the files of the query results on the downloader, returning any
+        `parfive.Results` that the clients return.
+        """
         reslist = []
         for query_result in query_results:
             if isinstance(query_result, QueryResponseRow):
@@ -502,9 +755,10 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
                                             wait=False, **kwargs)
                 if result not in (NotImplemented, None):
                     reslist.append(result)
+        return reslist
 
-        results = downloader.download()
-        # Combine the results objects from all the clients into one Results object.
+    @staticmethod
+    def _combine_results(results, reslist):
         for result in reslist:
             if not isinstance(result, Results):
                 raise TypeError(
@@ -513,8 +767,6 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
             results.data += result.data
             results._errors += result.errors
 
-        return results
-
     def __call__(self, *args, **kwargs):
         raise TypeError(f"'{self.__class__.__name__}' object is not callable")
 
@@ -532,12 +784,12 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
 
         return candidate_widget_types
 
-    def _make_query_to_client(self, *query):
+    def _client_searches(self, *query):
         """
-        Given a query, look up the client and perform the query.
+        Given a query, look up the clients and return the searches to make.
 
-        This method is called by ``search`` and the results are fed into a
-        `~sunpy.net.UnifiedResponse` object.
+        This method is called by ``search`` and the results of the searches are
+        fed into a `~sunpy.net.UnifiedResponse` object.
 
         Parameters
         ----------
@@ -545,20 +797,34 @@ class UnifiedDownloaderFactory(BasicRegistrationFactory):
 
         Returns
         -------
-        results : `list`
-        client : `object`
-            Instance of client class
+        `list` of ``_ClientSearch``
         """
         candidate_widget_types = self._check_registered_widgets(*query)
-        results = []
-        for client in candidate_widget_types:
-            tmpclient = client()
-            try:
-                res = tmpclient.search(*query)
-            except Exception as err:
-                res = QueryResponseTable([], client=tmpclient, errors=err)
-            results.append(res)
+        return [_ClientSearch(client(), query, self.query_cache) for client in candidate_widget_types]
 
+    @staticmethod
+    def _run_searches(searches, timeout=None):
+        """
+        Run the client searches at the same time, and return their results in the same order.
+        """
+        if len(searches) <= 1 and timeout is None:
+            return [search.run() for search in searches]
+
+        # Every search has its own thread so that the timeout applies to each of them from the start
+        executor = ThreadPoolExecutor(max_workers=len(searches), thread_name_prefix="sunpy-fido-search")
+        try:
+            futures = [executor.submit(search.run) for search in searches]
+            deadline = None if timeout is None else time.monotonic() + timeout
+            results = []
+            for search, future in zip(searches, futures):
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                try:
+                    results.append(future.result(timeout=remaining))
+                except TimeoutError:
+                    results.append(search.timed_out(timeout))
+        finally:
+            # A search that has timed out is left to finish in the background
+            executor.shutdown(wait=False)
         return results
 
     def __repr__(self):
@@ -5,7 +5,12 @@ import codecs
 import inspect
 import json
 import urllib
-from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+
+import requests
+from requests.adapters import HTTPAdapter
 
 import astropy.table
 from astropy.table import Row
@@ -16,13 +21,13 @@ from sunpy.net import attr
 from sunpy.net.base_client import BaseClient, QueryResponseTable
 from sunpy.net.hek import attrs
 from sunpy.net.hek.utils import (
-    _freeze,
+    _ColumnBuilder,
     _map_chain_code_columns_to_coordinates,
     _map_columns_to_quantities,
     _map_columns_to_times,
     _map_event_coord_columns_to_coordinates,
+    _unique_rows,
 )
-from sunpy.util import dict_keys_same, unique
 from sunpy.util.xml import xml_to_dict
 
 __all__ = ['HEKClient', 'HEKTable', 'HEKRow']
@@ -55,6 +60,17 @@ class HEKClient(BaseClient):
         If you want the raw HEK output, you can access it via the ``raw`` attribute of the
         `~sunpy.net.hek.HEKTable` object returned by the search method.
 
+    Parameters
+    ----------
+    url : `str`, optional
+        The URL of the HEK search service.
+    max_conn : `int`, optional
+        The maximum number of connections to the HEK, which is the number of
+        pages of results that are downloaded at the same time. A query with
+        OR'd parameters, such as ``(a.hek.FRM.Name == "A") | (a.hek.FRM.Name == "B")``,
+        is made as one search for each of them, which also share these
+        connections. Defaults to 4.
+
     References
     ----------
     * `Heliophysics Knowledge Base Feature/Event Types definitions <https://www.lmsal.com/hek/VOEvent_Spec.html>`__
@@ -71,38 +87,57 @@ class HEKClient(BaseClient):
     # Default to full disk.
     attrs.walker.apply(attrs.SpatialRegion(), {}, default)
 
-    def __init__(self, url=DEFAULT_URL):
+    def __init__(self, url=DEFAULT_URL, max_conn=4):
         self.url = url
+        self.max_conn = max_conn
 
-    def _download(self, data):
+    def _session(self):
+        """
+        A session which keeps up to ``max_conn`` connections to the HEK open.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.max_conn, pool_block=True)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _get_page(self, session, data, page):
+        """ Download one page of results. """
+        url = self.url + urllib.parse.urlencode({**data, 'page': page})
+        log.debug(f'Opening {url}')
+        response = session.get(url)
+        response.raise_for_status()
+        try:
+            result = codecs.decode(response.content, encoding='utf-8', errors='replace')
+            return json.loads(result)
+        except Exception as e:
+            raise OSError("Failed to load return from the HEKClient.") from e
+
+    def _download(self, data, session=None):
         """ Download all data, even if paginated. """
-        page = 1
-        results = []
         new_data = data.copy()
         # Override the default name of the operatorX, where X is a number.
         for key in data.keys():
             if "operator" in key:
                 new_data[f"op{key.split('operator')[-1]}"] = new_data.pop(key)
-        while True:
-            new_data['page'] = page
-            url = self.url + urllib.parse.urlencode(new_data)
-            log.debug(f'Opening {url}')
-            fd = urllib.request.urlopen(url)
-            try:
-                result = codecs.decode(fd.read(), encoding='utf-8', errors='replace')
-                result = json.loads(result)
-            except Exception as e:
-                raise OSError("Failed to load return from the HEKClient.") from e
-            finally:
-                fd.close()
-            results.extend(result['result'])
+        columns = _ColumnBuilder()
+        with nullcontext(session) if session is not None else self._session() as session:
+            result = self._get_page(session, new_data, 1)
+            columns.add_rows(result['result'])
             if not result['overmax']:
-                if len(results) > 0:
-                    return astropy.table.Table(dict_keys_same(results))
-                else:
-                    return astropy.table.Table()
-            page += 1
-
+                return columns.to_table()
+            # The HEK does not say how many pages there are, so the next
+            # max_conn pages are downloaded at a time until the last one
+            page = 2
+            with ThreadPoolExecutor(max_workers=self.max_conn) as executor:
+                while result['overmax']:
+                    pages = range(page, page + self.max_conn)
+                    for result in executor.map(partial(self._get_page, session, new_data), pages):
+                        columns.add_rows(result['result'])
+                        if not result['overmax']:
+                            break
+                    page += self.max_conn
+        return columns.to_table()
 
     def search(self, *args, **kwargs):
         """
@@ -137,12 +172,17 @@ class HEKClient(BaseClient):
             ndata.append(new)
         if len(ndata) == 1:
             return HEKTable._from_search(self._download(ndata[0]), client=self)
-        else:
-            return HEKTable._from_search(self._merge(self._download(data) for data in ndata), client=self)
+        with self._session() as session, ThreadPoolExecutor(max_workers=self.max_conn) as executor:
+            responses = list(executor.map(partial(self._download, session=session), ndata))
+        return HEKTable._from_search(self._merge(responses), client=self)
 
     def _merge(self, responses):
         """ Merge responses, removing duplicates. """
-        return astropy.table.vstack(list(unique(chain.from_iterable(responses), _freeze)))
+        responses = [response for response in responses if len(response) > 0]
+        if not responses:
+            return astropy.table.Table()
+        table = astropy.table.vstack(responses)
+        return table[_unique_rows(table)]
 
     def fetch(self, *args, **kwargs):
         """
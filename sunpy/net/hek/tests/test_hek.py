@@ -1,4 +1,8 @@
 
+import json
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
+
 import numpy as np
 import pytest
 
@@ -360,3 +364,74 @@ def test_raw_hek_result_preserved(hek_result):
             assert np.issubdtype(column_dtype, np.float64) | np.issubdtype(column_dtype, np.object_)
         elif unit_attr.get('is_unit_prop', False):
             assert np.issubdtype(column_dtype, np.str_)
+
+
+@pytest.fixture
+def hek_server(local_http_server):
+    # Pages of two flares from the "A" method, and one page from the "B" method
+    # with a flare which is also found by the "A" method
+    def row(kb_archivid, frm):
+        return {'kb_archivid': kb_archivid, 'frm_name': frm, 'event_starttime': '2011-08-09T01:00:00',
+                'event_coord1': 0, 'event_coord2': 0, 'event_coord3': None,
+                'event_coordunit': 'deg', 'event_coordsys': 'UTC-HGS-TOPO'}
+
+    def rows(page, frm):
+        if frm == 'B':
+            return [row('ivo://A_1_0', 'A'), row('ivo://B_1_0', 'B')]
+        rows = [row(f'ivo://A_{page}_{i}', 'A') for i in range(2)]
+        if page == 3:
+            rows[1]['extra'] = 'value'
+        return rows
+
+    npages = {'A': 5, 'B': 1}
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            params = {key: value[0] for key, value in parse_qs(urlsplit(self.path).query).items()}
+            frm = params.get('value0', params.get('value1', 'A'))
+            page = int(params['page'])
+            requests.append((frm, page))
+            result = rows(page, frm) if page <= npages[frm] else []
+            body = json.dumps({'result': result, 'overmax': page < npages[frm]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return f"{local_http_server(Handler)}/her?", requests
+
+
+@pytest.mark.parametrize('max_conn', [1, 3])
+def test_download_pages(hek_server, max_conn):
+    url, requests = hek_server
+    client = hek.HEKClient(url=url, max_conn=max_conn)
+    result = client.search(attrs.Time('2011/08/09', '2011/08/10'), attrs.hek.FL,
+                           attrs.hek.FRM.Name == 'A')
+    assert list(result['kb_archivid']) == [f'ivo://A_{page}_{i}' for page in range(1, 6) for i in range(2)]
+    # A column which only some of the rows have
+    assert list(result['extra']) == [None] * 5 + ['value'] + [None] * 4
+    # The pages after the last one are only downloaded when several pages are downloaded at a time
+    pages = sorted(page for _, page in requests)
+    assert pages[:5] == [1, 2, 3, 4, 5]
+    assert len(pages) == 5 + (-(5 - 1) % max_conn)
+
+
+def test_search_merges_queries(hek_server):
+    url, requests = hek_server
+    client = hek.HEKClient(url=url)
+    result = client.search(attrs.Time('2011/08/09', '2011/08/10'), attrs.hek.FL,
+                           (attrs.hek.FRM.Name == 'A') | (attrs.hek.FRM.Name == 'B'))
+    # The flare found by both methods is only included once
+    assert len(result) == 11
+    assert sorted(result['kb_archivid']) == sorted({f'ivo://A_{page}_{i}' for page in range(1, 6)
+                                                    for i in range(2)} | {'ivo://B_1_0'})
+    assert {frm for frm, _ in requests} == {'A', 'B'}
+
+
+def test_merge_empty():
+    client = hek.HEKClient()
+    assert len(client._merge([Table(), Table()])) == 0
+    table = Table({'kb_archivid': ['a', 'b', 'a'], 'value': [1, 2, 3]})
+    assert list(client._merge([table, Table()])['value']) == [1, 2]
@@ -8,7 +8,7 @@ from packaging.version import Version
 import astropy
 from astropy import units as u
 from astropy.coordinates import ICRS, SkyCoord
-from astropy.table import Column, MaskedColumn
+from astropy.table import Column, MaskedColumn, Table
 from astropy.utils.data import get_pkg_data_filename
 from astropy.utils.masked import Masked
 
@@ -18,11 +18,13 @@ from sunpy.extern import parse
 from sunpy.time import parse_time
 
 __all__ = [
+    '_ColumnBuilder',
     '_freeze',
     '_map_columns_to_times',
     '_map_columns_to_quantities',
     '_map_event_coord_columns_to_coordinates',
     '_map_chain_code_columns_to_coordinates',
+    '_unique_rows',
 ]
 
 
@@ -38,6 +40,52 @@ def _freeze(obj):
     return obj
 
 
+class _ColumnBuilder:
+    """
+    Builds the columns of a table from the rows of pages of HEK results as
+    they are downloaded, so that the rows are not all kept as dicts.
+
+    Columns which are missing from some rows are filled with `None`.
+    """
+
+    def __init__(self):
+        self.columns = {}
+        self.nrows = 0
+
+    def add_rows(self, rows):
+        for row in rows:
+            for key in row:
+                if key not in self.columns:
+                    self.columns[key] = [None] * self.nrows
+            for key, column in self.columns.items():
+                column.append(row.get(key))
+            self.nrows += 1
+
+    def to_table(self):
+        if self.nrows == 0:
+            return Table()
+        return Table(self.columns)
+
+
+def _unique_rows(table, key_columns=('kb_archivid',)):
+    """
+    The indices of the first row of each event in a table of HEK results.
+
+    The events are identified by the values of the key columns, or by the
+    values of all of the columns if the table does not have all of the key columns.
+    """
+    if not all(name in table.colnames for name in key_columns):
+        key_columns = table.colnames
+    seen = set()
+    indices = []
+    for i, key in enumerate(zip(*(table[name].tolist() for name in key_columns))):
+        key = tuple(_freeze(value) for value in key)
+        if key not in seen:
+            seen.add(key)
+            indices.append(i)
+    return indices
+
+
 def _get_unit_attributes():
     """
     Returns the attributes from the HEK that are used to parse the values in the HEK table.
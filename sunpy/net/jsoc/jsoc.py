@@ -1,8 +1,11 @@
+import asyncio
 import copy
 import json
 import os
+import threading
 import time
 import urllib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import drms
@@ -20,7 +23,7 @@ from sunpy.net.attr import and_
 from sunpy.net.base_client import BaseClient, QueryResponseTable, convert_row_to_table
 from sunpy.net.jsoc.attrs import walker
 from sunpy.util.exceptions import warn_user
-from sunpy.util.parfive_helpers import Downloader, Results
+from sunpy.util.parfive_helpers import Downloader, Results, _StreamingDownloader
 
 __all__ = ['JSOCClient', 'JSOCResponse']
 
@@ -34,6 +37,79 @@ class NotExportedError(Exception):
     pass
 
 
+class _ExportManifest:
+    """
+    A file recording the export requests of a fetch, and the files that have
+    been downloaded, so that an interrupted fetch can be resumed.
+
+    The first line of the file is a JSON object with the query and the IDs of
+    the export requests, and each following line is a JSON object with the URL
+    and the path of a downloaded file. Lines are only ever appended, so that
+    recording each file is cheap and a fetch which is interrupted while writing
+    loses at most the last line.
+    """
+
+    def __init__(self, path, query_args):
+        self.path = Path(path).expanduser()
+        self.query = json.dumps(query_args, sort_keys=True, default=str)
+        self.request_ids = []
+        self._downloaded = {}
+        self._lock = threading.Lock()
+        if self.path.is_file():
+            self._read()
+
+    def _read(self):
+        with open(self.path) as f:
+            lines = f.read().splitlines()
+        if not lines:
+            return
+        header = json.loads(lines[0])
+        if header['query'] != self.query:
+            raise ValueError(f"The manifest {self.path} was written by a fetch of a different search.")
+        self.request_ids = header['requests']
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # The last line may be incomplete if the fetch was interrupted
+                continue
+            self._downloaded[entry['url']] = entry['path']
+
+    def set_requests(self, request_ids):
+        """
+        Record the IDs of the export requests, rewriting the manifest but keeping
+        the record of the files that have been downloaded.
+        """
+        with self._lock:
+            self.request_ids = list(request_ids)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            with open(temp_path, 'w') as f:
+                f.write(json.dumps({'query': self.query, 'requests': self.request_ids}) + '\n')
+                for url, path in self._downloaded.items():
+                    f.write(json.dumps({'url': url, 'path': path}) + '\n')
+            os.replace(temp_path, self.path)
+
+    def set_downloaded(self, url, path):
+        """
+        Record that the file at a URL has been downloaded to a path.
+        """
+        with self._lock:
+            self._downloaded[url] = str(path)
+            with open(self.path, 'a') as f:
+                f.write(json.dumps({'url': url, 'path': str(path)}) + '\n')
+
+    def downloaded_path(self, url):
+        """
+        The path that the file at a URL was downloaded to, or `None` if it has
+        not been downloaded or has since been removed.
+        """
+        path = self._downloaded.get(url)
+        if path is not None and Path(path).is_file():
+            return path
+        return None
+
+
 class JSOCResponse(QueryResponseTable):
     query_args = astropy.table.TableAttribute()
     requests = astropy.table.TableAttribute()
@@ -340,37 +416,38 @@ class JSOCClient(BaseClient):
             Request status can be accessed by requests.status
         """
 
-        requests = []
         self.query_args = jsoc_response.query_args
+        requests = [self._request_block(block, method) for block in jsoc_response.query_args]
+        return requests[0] if len(requests) == 1 else requests
+
+    def _request_block(self, block, method='url'):
+        """
+        Request that JSOC stages the data for one block of the query arguments.
+        """
         supported_protocols = sorted(['fits', 'as-is'])
         supported_methods = sorted(['url-tar', 'url', 'url-quick'])
-        for block in jsoc_response.query_args:
-
-            ds = self._make_recordset(**block)
-            cd = drms.Client(email=block.get('notify', ''))
-            protocol = block.get('protocol', 'fits')
-            cutout = block.get('cutout')
-
-            if protocol not in supported_protocols:
-                error_message = f"Protocols other than {','.join(supported_protocols)} are not supported."
-                raise TypeError(error_message)
-            if method not in supported_methods:
-                error_message = f"Methods other than {','.join(supported_methods)}  are not supported."
-                raise TypeError(error_message)
-            process = {'im_patch': cutout} if cutout is not None else None
 
-            if method != 'url-tar':
-                method = 'url' if protocol == 'fits' else 'url_quick'
-            r = cd.export(ds, method=method, protocol=protocol, process=process)
+        ds = self._make_recordset(**block)
+        cd = drms.Client(email=block.get('notify', ''))
+        protocol = block.get('protocol', 'fits')
+        cutout = block.get('cutout')
 
-            requests.append(r)
+        if protocol not in supported_protocols:
+            error_message = f"Protocols other than {','.join(supported_protocols)} are not supported."
+            raise TypeError(error_message)
+        if method not in supported_methods:
+            error_message = f"Methods other than {','.join(supported_methods)}  are not supported."
+            raise TypeError(error_message)
+        process = {'im_patch': cutout} if cutout is not None else None
 
-        return requests[0] if len(requests) == 1 else requests
+        if method != 'url-tar':
+            method = 'url' if protocol == 'fits' else 'url_quick'
+        return cd.export(ds, method=method, protocol=protocol, process=process)
 
     @convert_row_to_table
     def fetch(self, jsoc_response, path=None, progress=True, overwrite=False,
               downloader=None, wait=True, sleep=10,
-              max_conn=default_max_conn, timeout=None, retries=5, **kwargs):
+              max_conn=default_max_conn, timeout=None, retries=5, manifest=None, **kwargs):
         """
         Make the request for the data in a JSOC response and wait for it to be
         staged and then download the data.
@@ -412,12 +489,30 @@ class JSOCClient(BaseClient):
         retries : `int`, optional
             Number of retries in case the export request was not found on the
             server.  See `~drms.ExportRequest.wait` for more information.
+        manifest : `str` or `pathlib.Path`, optional
+            A file to record the export requests and the downloaded files in.
+            If given, all of the export requests are checked at the same time,
+            and the files of each request are downloaded as soon as it is staged
+            rather than once all of the requests are staged. If the file already
+            exists, because an earlier fetch of the same search was interrupted,
+            its export requests are used instead of making new ones, and the files
+            that were downloaded are not downloaded again. Any of its export
+            requests that failed, for example because they expired, are made
+            again. ``downloader`` can not be used with a manifest.
 
         Returns
         -------
         results : a `parfive.Results` instance
-            A `parfive.Results` object.
+            A `parfive.Results` object. If a manifest is given, the export
+            requests that did not succeed are recorded in ``results.errors``
+            with the request ID as the URL, and the files of the other requests
+            are still downloaded.
 
+        Examples
+        --------
+        A large fetch can be resumed by calling it again with the same manifest::
+
+            >>> res = client.fetch(response, path='./hmi', manifest='./hmi/manifest.jsonl')  # doctest: +SKIP
         """
         if len(jsoc_response) == 0:
             return parfive.Results()
@@ -433,6 +528,13 @@ class JSOCClient(BaseClient):
                       "All the files present in the original response will "
                       "be downloaded when passed to fetch().")
 
+        if manifest is not None:
+            if downloader is not None:
+                raise ValueError("A downloader can not be used with a manifest.")
+            return self._fetch_pipelined(jsoc_response, manifest, path=path, progress=progress,
+                                         overwrite=overwrite, sleep=sleep, max_conn=max_conn,
+                                         timeout=timeout, retries=retries)
+
         # Make staging request to JSOC
         responses = self.request_data(jsoc_response)
 
@@ -509,32 +611,10 @@ class JSOCClient(BaseClient):
             raise NotExportedError("Can not download as not all the requests "
                                    "have been exported for download yet.")
 
-        # Ensure path has a {file} in it
-        if path is None:
-            default_dir = config.get("downloads", "download_dir")
-            path = os.path.join(default_dir, '{file}')
-        elif isinstance(path, Path):
-            path = str(path)
-
-        if isinstance(path, str) and '{file}' not in path:
-            path = os.path.join(path, '{file}')
-
+        path = self._download_path(path)
         paths = []
         for request in requests:
-            if request.method == 'url-tar':
-                fname = path.format(file=Path(request.tarfile).name)
-                paths.append(os.path.expanduser(fname))
-            else:
-                for filename in request.data['filename']:
-                    # Ensure we don't duplicate the file extension
-                    ext = os.path.splitext(filename)[1]
-                    if path.endswith(ext):
-                        fname = path.strip(ext)
-                    else:
-                        fname = path
-                    fname = fname.format(file=filename)
-                    fname = os.path.expanduser(fname)
-                    paths.append(fname)
+            paths.extend(self._request_paths(request, path))
 
         dl_set = True
         if not downloader:
@@ -546,12 +626,7 @@ class JSOCClient(BaseClient):
         urls = []
         for request in requests:
             if request.status == 0:
-                if request.protocol == 'as-is' or request.method == 'url-tar':
-                    urls.extend(list(request.urls.url))
-                else:
-                    for _, data in request.data.iterrows():
-                        url_dir = request.request_url + '/'
-                        urls.append(urllib.parse.urljoin(url_dir, data['filename']))
+                urls.extend(self._request_urls(request))
 
         if urls:
             if progress:
@@ -565,6 +640,144 @@ class JSOCClient(BaseClient):
         results = downloader.download()
         return results
 
+    def _fetch_pipelined(self, jsoc_response, manifest, path, progress, overwrite, sleep,
+                         max_conn, timeout, retries):
+        """
+        Check all of the export requests at the same time, and download the
+        files of each request as soon as it is staged, recording the progress
+        in a manifest.
+        """
+        manifest = _ExportManifest(manifest, jsoc_response.query_args)
+        if manifest.request_ids:
+            log.info(f"Resuming the JSOC export requests {', '.join(manifest.request_ids)}.")
+            c = drms.Client()
+            requests = [c.export_from_id(request_id) for request_id in manifest.request_ids]
+            # Requests are made one per block of the query arguments, so only
+            # the blocks whose requests failed need to be requested again
+            failed = [i for i, request in enumerate(requests) if request.has_failed(skip_update=True)]
+            if failed:
+                log.info("Making new JSOC export requests in place of "
+                         f"{', '.join(requests[i].id for i in failed)}.")
+                for i in failed:
+                    requests[i] = self._request_block(jsoc_response.query_args[i])
+                manifest.set_requests([request.id for request in requests])
+                time.sleep(sleep/2.)
+        else:
+            requests = self.request_data(jsoc_response)
+            if not np.iterable(requests):
+                requests = [requests]
+            manifest.set_requests([request.id for request in requests])
+            time.sleep(sleep/2.)
+        jsoc_response.requests = list(requests)
+
+        path = self._download_path(path)
+        results = Results()
+        # The downloads are made one request at a time, as JSOC asks for only one connection
+        with ThreadPoolExecutor(max_workers=len(requests)) as poll_executor, \
+                ThreadPoolExecutor(max_workers=1) as download_executor:
+            polls = {poll_executor.submit(request.wait, sleep=sleep, timeout=timeout,
+                                          retries_notfound=retries): request
+                     for request in requests}
+            downloads = []
+            for poll in as_completed(polls):
+                request = polls[poll]
+                try:
+                    poll.result()
+                except drms.DrmsExportError as e:
+                    results.add_error(None, request.id, NotExportedError(
+                        f"The JSOC export request {request.id} failed: {e}"))
+                    continue
+                if not request.has_succeeded():
+                    results.add_error(None, request.id, NotExportedError(
+                        f"The JSOC export request {request.id} was not staged before the timeout."))
+                    continue
+                downloads.append(download_executor.submit(
+                    self._download_request, request, path, manifest,
+                    progress=progress, overwrite=overwrite, max_conn=max_conn))
+            for download in downloads:
+                result = download.result()
+                results.data += result.data
+                results._errors += result.errors
+
+        return results
+
+    def _download_request(self, request, path, manifest, progress, overwrite, max_conn):
+        """
+        Download the files of a staged export request that the manifest does
+        not record as downloaded, recording each file as soon as it is downloaded.
+        """
+        results = Results()
+        downloader = _StreamingDownloader(max_conn=max_conn, progress=progress,
+                                          overwrite=overwrite, max_splits=1)
+        for url, filename in zip(self._request_urls(request), self._request_paths(request, path)):
+            downloaded_path = manifest.downloaded_path(url)
+            if downloaded_path is None:
+                downloader.enqueue_file(url, filename=filename, max_splits=1)
+            else:
+                results.append(path=downloaded_path, url=url)
+        if not downloader.queued_files:
+            return results
+
+        async def download():
+            async for result in downloader.run_download_iter():
+                for file_path, url in zip(result, result.urls):
+                    manifest.set_downloaded(url, file_path)
+                results.data += result.data
+                results._errors += result.errors
+
+        if progress:
+            log.info(f"{len(downloader.queued_files)} URLs of the JSOC export request {request.id} "
+                     "found for download.")
+        # This runs in its own thread, so there is never an event loop running already
+        asyncio.run(download())
+        return results
+
+    @staticmethod
+    def _download_path(path):
+        """
+        The path template to download files to, which always has a ``{file}`` in it.
+        """
+        if path is None:
+            default_dir = config.get("downloads", "download_dir")
+            path = os.path.join(default_dir, '{file}')
+        elif isinstance(path, Path):
+            path = str(path)
+
+        if isinstance(path, str) and '{file}' not in path:
+            path = os.path.join(path, '{file}')
+        return path
+
+    @staticmethod
+    def _request_paths(request, path):
+        """
+        The paths to download the files of an export request to.
+        """
+        if request.method == 'url-tar':
+            fname = path.format(file=Path(request.tarfile).name)
+            return [os.path.expanduser(fname)]
+        paths = []
+        for filename in request.data['filename']:
+            # Ensure we don't duplicate the file extension
+            ext = os.path.splitext(filename)[1]
+            if path.endswith(ext):
+                fname = path.strip(ext)
+            else:
+                fname = path
+            fname = fname.format(file=filename)
+            fname = os.path.expanduser(fname)
+            paths.append(fname)
+        return paths
+
+    @staticmethod
+    def _request_urls(request):
+        """
+        The URLs of the files of a staged export request.
+        """
+        if request.protocol == 'as-is' or request.method == 'url-tar':
+            return list(request.urls.url)
+        url_dir = request.request_url + '/'
+        return [urllib.parse.urljoin(url_dir, data['filename']) for _, data in request.data.iterrows()]
+
     def _make_recordset(self, series, start_time='', end_time='', wavelength='',
                         segment='', primekey={}, keyword={}, **kwargs):
         """
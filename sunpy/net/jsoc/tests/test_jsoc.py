@@ -1,6 +1,11 @@
+import json
 import re
 import tempfile
+import threading
+from http.server import SimpleHTTPRequestHandler
 
+import drms
+import pandas as pd
 import pytest
 from parfive import Results
 
@@ -12,6 +17,7 @@ from astropy.coordinates import SkyCoord
 import sunpy.map
 import sunpy.net.attrs as a
 from sunpy.net.jsoc import JSOCClient, JSOCResponse
+from sunpy.net.jsoc.jsoc import NotExportedError
 from sunpy.util.exceptions import SunpyUserWarning
 
 # Ensure all JSOC tests are run on the same parallel worker
@@ -398,3 +404,168 @@ def test_segments_query(client):
     assert seg_res["Bp"][0].startswith("/SUM")
     assert seg_res["magnetogram"][0].endswith("magnetogram.fits")
     assert seg_res["Bp"][0].endswith("Bp.fits")
+
+
+class MockExportRequest:
+    """
+    An export request of a mocked JSOC server, which is staged once ``ready`` is
+    set, or fails if ``failed`` is set.
+    """
+    method = 'url'
+    protocol = 'fits'
+
+    def __init__(self, request_id, request_url, filenames, ready=None):
+        self.id = request_id
+        self.request_url = request_url
+        self.data = pd.DataFrame({'filename': filenames})
+        self.ready = ready or threading.Event()
+        if ready is None:
+            self.ready.set()
+        self.failed = False
+        self.status = 1
+
+    def wait(self, *, sleep=5, timeout=None, retries_notfound=5):
+        if self.failed:
+            self.status = 4
+            raise drms.DrmsExportError("Request expired [status=4]")
+        self.ready.wait(timeout=10)
+        self.status = 0 if self.ready.is_set() else 1
+        return self.status == 0
+
+    def has_succeeded(self):
+        return self.status == 0
+
+    def has_failed(self, *, skip_update=False):
+        return self.status not in (0, 1, 2, 6)
+
+
+@pytest.fixture
+def jsoc_server(tmp_path, local_http_server):
+    served = tmp_path / 'served'
+    for request_id in ['JSOC_1', 'JSOC_2']:
+        (served / request_id).mkdir(parents=True)
+        for i in range(2):
+            (served / request_id / f'{request_id}_{i}.fits').write_text(request_id)
+
+    requests = []
+    # The server fails the first time that these files are requested
+    failing = set()
+    # Called with the path of each file that is served
+    served_callbacks = []
+
+    class Handler(SimpleHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            requests.append(self.path)
+            if self.path in failing:
+                failing.discard(self.path)
+                self.send_error(500)
+                return
+            super().do_GET()
+            for callback in served_callbacks:
+                callback(self.path)
+
+    url = local_http_server(Handler, directory=served)
+    export_requests = {request_id: MockExportRequest(request_id, f'{url}/{request_id}',
+                                                     [f'{request_id}_{i}.fits' for i in range(2)])
+                       for request_id in ['JSOC_1', 'JSOC_2']}
+    return export_requests, requests, failing, served_callbacks
+
+
+@pytest.mark.thread_unsafe(reason="mocks a method")
+def test_fetch_manifest_pipelined(mocker, client, jsoc_response_double, jsoc_server, tmp_path):
+    export_requests, requests, _, served_callbacks = jsoc_server
+    # The second request is only staged once a file of the first request has been
+    # downloaded, so the fetch only finishes if it downloads while it waits
+    export_requests['JSOC_2'].ready = threading.Event()
+    served_callbacks.append(lambda path: path.startswith('/JSOC_1/') and export_requests['JSOC_2'].ready.set())
+    mocker.patch("sunpy.net.jsoc.jsoc.JSOCClient.request_data", return_value=list(export_requests.values()))
+
+    manifest = tmp_path / 'manifest.jsonl'
+    files = client.fetch(jsoc_response_double, path=tmp_path / 'download', manifest=manifest,
+                         progress=False, sleep=0)
+
+    assert not files.errors
+    assert sorted(requests) == ['/JSOC_1/JSOC_1_0.fits', '/JSOC_1/JSOC_1_1.fits',
+                                '/JSOC_2/JSOC_2_0.fits', '/JSOC_2/JSOC_2_1.fits']
+    assert sorted(files) == sorted(str(tmp_path / 'download' / path.split('/')[-1]) for path in requests)
+    assert jsoc_response_double.requests == list(export_requests.values())
+    lines = manifest.read_text().splitlines()
+    assert json.loads(lines[0])['requests'] == ['JSOC_1', 'JSOC_2']
+    assert len(lines) == 5
+
+
+@pytest.mark.thread_unsafe(reason="mocks a method")
+def test_fetch_manifest_resume(mocker, client, jsoc_response_double, jsoc_server, tmp_path):
+    export_requests, requests, failing, _ = jsoc_server
+    failing.add('/JSOC_2/JSOC_2_1.fits')
+    request_data = mocker.patch("sunpy.net.jsoc.jsoc.JSOCClient.request_data",
+                                return_value=list(export_requests.values()))
+    manifest = tmp_path / 'manifest.jsonl'
+    files = client.fetch(jsoc_response_double, path=tmp_path, manifest=manifest, progress=False, sleep=0)
+    assert len(files) == 3
+    assert len(files.errors) == 1
+
+    # The fetch is resumed from the same export requests, and only the failed file is downloaded
+    request_data.reset_mock()
+    export_from_id = mocker.patch("drms.Client.export_from_id", side_effect=export_requests.get)
+    requests.clear()
+    files = client.fetch(jsoc_response_double, path=tmp_path, manifest=manifest, progress=False, sleep=0)
+    request_data.assert_not_called()
+    assert [call.args[0] for call in export_from_id.call_args_list] == ['JSOC_1', 'JSOC_2']
+    assert requests == ['/JSOC_2/JSOC_2_1.fits']
+    assert len(files) == 4
+    assert not files.errors
+
+
+@pytest.mark.thread_unsafe(reason="mocks a method")
+def test_fetch_manifest_not_exported(mocker, client, jsoc_response_double, jsoc_server, tmp_path):
+    export_requests, requests, _, _ = jsoc_server
+    export_requests['JSOC_1'].wait = lambda **kwargs: False
+    mocker.patch("sunpy.net.jsoc.jsoc.JSOCClient.request_data", return_value=list(export_requests.values()))
+    files = client.fetch(jsoc_response_double, path=tmp_path, manifest=tmp_path / 'manifest.jsonl',
+                         progress=False, sleep=0)
+    assert sorted(requests) == ['/JSOC_2/JSOC_2_0.fits', '/JSOC_2/JSOC_2_1.fits']
+    assert len(files) == 2
+    assert len(files.errors) == 1
+    assert files.errors[0].url == 'JSOC_1'
+    assert isinstance(files.errors[0].exception, NotExportedError)
+
+
+@pytest.mark.thread_unsafe(reason="mocks a method")
+def test_fetch_manifest_failed_request_made_again(mocker, client, jsoc_response_double, jsoc_server,
+                                                  tmp_path):
+    export_requests, requests, _, _ = jsoc_server
+    export_requests['JSOC_1'].failed = True
+    mocker.patch("sunpy.net.jsoc.jsoc.JSOCClient.request_data", return_value=list(export_requests.values()))
+    manifest = tmp_path / 'manifest.jsonl'
+    files = client.fetch(jsoc_response_double, path=tmp_path, manifest=manifest, progress=False, sleep=0)
+    assert len(files) == 2
+    assert [error.url for error in files.errors] == ['JSOC_1']
+    assert "JSOC_1 failed" in str(files.errors[0].exception)
+
+    # Only the failed request is made again when the fetch is resumed, and the
+    # files that were already downloaded are kept in the manifest
+    new_request = MockExportRequest('JSOC_3', export_requests['JSOC_1'].request_url,
+                                    list(export_requests['JSOC_1'].data['filename']))
+    request_block = mocker.patch("sunpy.net.jsoc.jsoc.JSOCClient._request_block", return_value=new_request)
+    mocker.patch("drms.Client.export_from_id", side_effect=export_requests.get)
+    requests.clear()
+    files = client.fetch(jsoc_response_double, path=tmp_path, manifest=manifest, progress=False, sleep=0)
+    request_block.assert_called_once_with(jsoc_response_double.query_args[0])
+    assert sorted(requests) == ['/JSOC_1/JSOC_1_0.fits', '/JSOC_1/JSOC_1_1.fits']
+    assert len(files) == 4
+    assert not files.errors
+    lines = manifest.read_text().splitlines()
+    assert json.loads(lines[0])['requests'] == ['JSOC_3', 'JSOC_2']
+    assert len(lines) == 5
+
+
+def test_fetch_manifest_errors(client, jsoc_response_double, tmp_path):
+    manifest = tmp_path / 'manifest.jsonl'
+    manifest.write_text(json.dumps({'query': 'another search', 'requests': ['JSOC_1']}) + '\n')
+    with pytest.raises(ValueError, match="different search"):
+        client.fetch(jsoc_response_double, manifest=manifest, sleep=0)
+    with pytest.raises(ValueError, match="downloader can not be used"):
+        client.fetch(jsoc_response_double, manifest=manifest, downloader=object(), sleep=0)
@@ -0,0 +1,252 @@
+"""
+This module provides `~sunpy.net.query_cache.QueryCache`, an on-disk cache of
+the responses of the clients searched by
+`Fido.search <sunpy.net.fido_factory.UnifiedDownloaderFactory.search>`.
+"""
+import hashlib
+import os
+import pickle
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+import astropy.units as u
+from astropy.time import Time, TimeDelta
+
+import sunpy
+from sunpy import log
+from sunpy.data.data_manager.storage import SqliteStorage
+from sunpy.net import _attrs, attr
+from sunpy.util.config import CACHE_DIR
+
+__all__ = ['QueryCache']
+
+
+class _QueryStorage(SqliteStorage):
+    """
+    Sqlite storage of the details of the cached responses.
+    """
+    COLUMN_NAMES = [
+        'query_hash',
+        'file_path',
+        'client',
+        'time',
+        'expiry',
+        'last_used',
+        'size',
+    ]
+    INDEXED_COLUMNS = [
+        'query_hash',
+    ]
+
+    def delete_all(self):
+        with self.connection(commit=True) as conn:
+            conn.execute(f'DELETE FROM {self._table_name}')
+
+
+def _value_key(value):
+    """
+    A string for the value of an attr which is the same in every session.
+    """
+    if isinstance(value, Time):
+        # The same as `sunpy.net.attrs.Time.__hash__`
+        return f"Time({value.scale}, {np.asarray(value.jd1).tolist()!r}, {np.asarray(value.jd2).tolist()!r})"
+    if isinstance(value, u.Quantity):
+        return f"Quantity({np.asarray(value.value).tolist()!r}, {value.unit.to_string()!r})"
+    if isinstance(value, attr.Attr):
+        return _attr_key(value)
+    if isinstance(value, list | tuple):
+        return f"{type(value).__name__}({', '.join(_value_key(v) for v in value)})"
+    return repr(value)
+
+
+def _attr_key(query_attr):
+    """
+    A string for an attr, built from its type and ``vars`` like `sunpy.net.attr.Attr.__eq__`.
+    """
+    cls = type(query_attr)
+    items = sorted(f"{name}={_value_key(value)}" for name, value in vars(query_attr).items())
+    return f"{cls.__module__}.{cls.__qualname__}({', '.join(items)})"
+
+
+class QueryCache:
+    """
+    An on-disk cache of the responses of the clients searched by
+    `Fido.search <sunpy.net.fido_factory.UnifiedDownloaderFactory.search>`.
+
+    The cache is not used unless it is assigned to ``Fido.query_cache``:
+
+    .. code-block:: python
+
+        >>> from sunpy.net import Fido
+        >>> from sunpy.net.query_cache import QueryCache
+        >>> Fido.query_cache = QueryCache()  # doctest: +SKIP
+
+    A response is stored for each client and each block of the query that the
+    client searches. The key of a response is built from the client class and
+    the attrs of the block, in the same way that attrs are compared, so the
+    order of the attrs does not matter.
+
+    Parameters
+    ----------
+    cache_dir : `str` or `pathlib.Path`, optional
+        Directory where the responses are stored. Defaults to a ``fido_search``
+        directory in the sunpy cache directory.
+    expiry : `astropy.units.Quantity` or `None`, optional
+        The interval after which a response is searched for again. If `None`,
+        responses do not expire. Defaults to 1 hour.
+    client_expiry : `dict`, optional
+        The expiry of the responses of specific clients, with the client classes
+        as the keys. Clients that are not in it use ``expiry``.
+    max_size : `astropy.units.Quantity` or `None`, optional
+        The maximum total size of the stored responses. When it is exceeded, the
+        least recently used responses are removed. If `None`, the size is not
+        limited. Defaults to 100 MB.
+
+    Notes
+    -----
+    A response to a search for a time range which ended at least an expiry
+    interval before the search is not expected to change, so it does not expire.
+    It is only removed to keep the cache below ``max_size``.
+
+    Responses with errors are not stored.
+    """
+
+    def __init__(self, cache_dir=None, expiry=1*u.hour, client_expiry=None, max_size=100*u.MB):
+        self._cache_dir = Path(cache_dir if cache_dir is not None else Path(CACHE_DIR) / 'fido_search')
+        self._storage = _QueryStorage(self._cache_dir / 'query_cache.db')
+        self._expiry = expiry
+        self._client_expiry = client_expiry or {}
+        self._max_size = max_size if max_size is None else max_size.to_value(u.byte)
+
+    @staticmethod
+    def _key(client, query):
+        """
+        The hash of the client class and the attrs of a block of a query.
+        """
+        cls = type(client)
+        key = [f"{cls.__module__}.{cls.__qualname__}", sunpy.__version__]
+        key += sorted(_attr_key(query_attr) for query_attr in query)
+        return hashlib.sha256('\n'.join(key).encode()).hexdigest()
+
+    def _entry_expiry(self, client, query):
+        """
+        The time at which a response stored now expires, or `None` if it does not expire.
+        """
+        expiry = self._client_expiry.get(type(client), self._expiry)
+        if expiry is None:
+            return None
+        expiry = TimeDelta(expiry)
+        ends = [query_attr.end for query_attr in query if isinstance(query_attr, _attrs.Time)]
+        if ends and all(end < Time.now() - expiry for end in ends):
+            return None
+        return datetime.now() + expiry.to_datetime()
+
+    def get(self, client, query):
+        """
+        Returns the stored response of a client to a block of a query.
+
+        Parameters
+        ----------
+        client : `sunpy.net.base_client.BaseClient`
+            The client that searches the query.
+        query : `tuple` of `sunpy.net.attr.Attr`
+            The attrs of the block of the query.
+
+        Returns
+        -------
+        `sunpy.net.base_client.QueryResponseTable` or `None`
+            The response, or `None` if it is not in the cache or has expired.
+        """
+        query_hash = self._key(client, query)
+        details = self._storage.find_by_key('query_hash', query_hash)
+        if details is None:
+            return None
+        if details['expiry'] and datetime.fromisoformat(details['expiry']) <= datetime.now():
+            self._delete(details)
+            return None
+        try:
+            with open(details['file_path'], 'rb') as f:
+                response = pickle.load(f)
+        except Exception as e:
+            log.debug(f"Could not read the cached response {details['file_path']}: {e!r}")
+            self._delete(details)
+            return None
+        self._storage.update_by_key('query_hash', query_hash,
+                                    {'last_used': datetime.now().isoformat()})
+        response.client = client
+        return response
+
+    def store(self, client, query, response):
+        """
+        Stores the response of a client to a block of a query.
+
+        Parameters
+        ----------
+        client : `sunpy.net.base_client.BaseClient`
+            The client that searched the query.
+        query : `tuple` of `sunpy.net.attr.Attr`
+            The attrs of the block of the query.
+        response : `sunpy.net.base_client.QueryResponseTable`
+            The response of the client.
+        """
+        if response.errors:
+            return
+        # The client is given back by get, and the search time would be wrong for a cached response
+        stored = response.copy(copy_data=False)
+        attributes = {key: value for key, value in response.meta.get('__attributes__', {}).items()
+                      if key not in ('client', 'search_time')}
+        stored.meta = {**response.meta, '__attributes__': attributes}
+        try:
+            data = pickle.dumps(stored)
+        except Exception as e:
+            log.debug(f"Could not cache the {client.__class__.__name__} response: {e!r}")
+            return
+
+        query_hash = self._key(client, query)
+        file_path = self._cache_dir / f"{query_hash}.pickle"
+        # Write to a temporary file first so that a response is never read half-written
+        temp_path = file_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(data)
+        temp_path.replace(file_path)
+
+        now = datetime.now().isoformat()
+        expiry = self._entry_expiry(client, query)
+        self._storage.delete_by_key('query_hash', query_hash)
+        self._storage.store({
+            'query_hash': query_hash,
+            'file_path': str(file_path),
+            'client': client.__class__.__name__,
+            'time': now,
+            'expiry': '' if expiry is None else expiry.isoformat(),
+            'last_used': now,
+            'size': len(data),
+        })
+        self._evict()
+
+    def clear(self):
+        """
+        Removes all of the stored responses.
+        """
+        for details in self._storage.find_all():
+            Path(details['file_path']).unlink(missing_ok=True)
+        self._storage.delete_all()
+
+    def _delete(self, details):
+        Path(details['file_path']).unlink(missing_ok=True)
+        self._storage.delete_by_key('query_hash', details['query_hash'])
+
+    def _evict(self):
+        """
+        Removes the least recently used responses until the cache is below its maximum size.
+        """
+        if self._max_size is None:
+            return
+        total = 0
+        for details in sorted(self._storage.find_all(), key=lambda details: details['last_used'],
+                              reverse=True):
+            total += int(details['size'])
+            if total > self._max_size:
+                self._delete(details)
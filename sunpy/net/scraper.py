@@ -3,14 +3,17 @@ This module provides a web scraper.
 """
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from ftplib import FTP
-from time import sleep
+from html.parser import HTMLParser
+from time import monotonic, sleep
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlsplit
-from urllib.request import urlopen
 
-from bs4 import BeautifulSoup
+import requests
+from bs4 import UnicodeDammit
 
 from astropy.time import Time
 
@@ -45,6 +48,59 @@ PARSE_TIME_CONVERSIONS = {
     "{week_number:2d}": "%W",
 }
 
+
+def _get_directory(session, url):
+    """
+    Returns the content of a page, raising the same errors as `~urllib.request.urlopen`.
+    """
+    try:
+        response = session.get(url)
+    except requests.RequestException as e:
+        raise URLError(e) from e
+    if response.status_code >= 400:
+        raise HTTPError(url, response.status_code, response.reason, response.headers, None)
+    return response.content
+
+
+class _LinkParser(HTMLParser):
+    """
+    Collects the ``href`` of each ``<a>`` tag of a page.
+
+    This gives the same links as finding the ``<a>`` tags with `bs4.BeautifulSoup`
+    and its ``"html.parser"``, without building the tree of the whole page.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            if href:
+                self.links.append(href)
+
+
+class _RetryAfter:
+    """
+    The time until which the requests to a server wait, after it has asked
+    for them to back off.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._until = 0
+
+    def delay(self, seconds):
+        with self._lock:
+            self._until = max(self._until, monotonic() + seconds)
+
+    def wait(self):
+        remaining = self._until - monotonic()
+        if remaining > 0:
+            sleep(remaining)
+
+
 class Scraper:
     """
     A scraper to scrap web data archives based on dates.
@@ -275,64 +331,100 @@ class Scraper:
         self.pattern, self.datetime_pattern = pattern, datetime_pattern
         return filepaths
 
-    def _httpfilelist(self, timerange):
+    def _httpfilelist(self, timerange, max_conn=5):
         """
         Goes over http archives hosted on the web, to return list of files in the given timerange.
+
+        Up to ``max_conn`` directories are read at the same time, and the
+        connections to the server are kept open to be reused for the next
+        directories.
         """
         directories = self.range(timerange)
-        filesurls = list()
-        retry_counts = {}
-        while directories:
-            directory = directories.pop(0)
+        retry_after = _RetryAfter()
+        with requests.Session() as session:
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_conn)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if len(directories) <= 1 or max_conn <= 1:
+                filelists = [self._httpdirectory(session, directory, timerange, retry_after)
+                             for directory in directories]
+            else:
+                with ThreadPoolExecutor(max_workers=min(max_conn, len(directories)),
+                                        thread_name_prefix="sunpy-scraper") as executor:
+                    futures = [executor.submit(self._httpdirectory, session, directory, timerange, retry_after)
+                               for directory in directories]
+                    try:
+                        filelists = [future.result() for future in futures]
+                    except Exception:
+                        # Do not read any more directories once one has failed
+                        for future in futures:
+                            future.cancel()
+                        raise
+        # The files are in the same order as the directories, whichever finished first
+        return [url for filelist in filelists for url in filelist]
+
+    def _httpdirectory(self, session, directory, timerange, retry_after):
+        """
+        Returns the files in the given timerange that are linked to from one http directory.
+        """
+        retry_count = 0
+        while True:
+            retry_after.wait()
             try:
-                opn = urlopen(directory)
-                try:
-                    soup = BeautifulSoup(opn, "html.parser")
-                    for link in soup.find_all("a"):
-                        href = link.get("href")
-                        if href is not None:
-                            if href[0] == '/':
-                                fullpath = self.domain + href[1:]
-                            else:
-                                fullpath = directory + href
-                            if self._url_follows_pattern(fullpath):
-                                if self._check_timerange(fullpath, timerange):
-                                    filesurls.append(fullpath)
-                finally:
-                    opn.close()
+                content = _get_directory(session, directory)
+                break
             except HTTPError as http_err:
                 # Ignore missing directories (issue #2684).
                 if http_err.code == 404:
                     log.debug(f"Directory {directory} not found.")
-                    continue
+                    return []
                 if http_err.code in [400, 403]:
                     log.debug(f"Got error {http_err.code} while scraping {directory} : {http_err.reason}")
                     raise
                 if http_err.code in [429, 504]:
+                    if retry_count > 4:
+                        log.debug(f"Exceeded maximum retry limit for {directory}")
+                        raise
                     # See if the server has told us how long to back off for
-                    retry_after = http_err.hdrs.get('Retry-After', 2)
+                    delay = http_err.hdrs.get('Retry-After', 2)
                     try:
                         # Ensure that we can parse the header as an int in sec
-                        retry_after = int(retry_after)
+                        delay = int(delay)
                     except Exception as e:
                         log.debug(f"Converting retry_after failed: {e}")
-                        retry_after = 2
+                        delay = 2
                     log.debug(
-                        f"Got {http_err.code} while scraping {directory}, waiting for {retry_after} seconds before retrying."
+                        f"Got {http_err.code} while scraping {directory}, waiting for {delay} seconds before retrying."
                     )
-                    sleep(retry_after)
-                    if retry_counts.get(directory, 0) > 4:
-                        log.debug(f"Exceeded maximum retry limit for {directory}")
-                        raise
-                    retry_counts[directory] = retry_counts.get(directory, 0) + 1
-                    directories.insert(0, directory)
+                    # The other directories also wait, as the server has asked us to back off
+                    retry_after.delay(delay)
+                    retry_count += 1
                     continue
+                log.debug(f"Got error {http_err.code} while scraping {directory}, skipping it.")
+                return []
             except URLError as url_err:
                 log.debug(f"Failed to parse content from {directory}: {url_err}")
                 raise
             except Exception as e:
                 log.debug(f"Failed to parse: {e}")
                 raise
+
+        filesurls = list()
+        try:
+            parser = _LinkParser()
+            parser.feed(UnicodeDammit(content, is_html=True).unicode_markup)
+            parser.close()
+            for href in parser.links:
+                if href[0] == '/':
+                    fullpath = self.domain + href[1:]
+                else:
+                    fullpath = directory + href
+                if self._url_follows_pattern(fullpath):
+                    if self._check_timerange(fullpath, timerange):
+                        filesurls.append(fullpath)
+        except Exception as e:
+            log.debug(f"Failed to parse: {e}")
+            raise
         return filesurls
 
     def _check_timerange(self, url, timerange):
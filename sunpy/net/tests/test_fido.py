@@ -1,5 +1,8 @@
+import asyncio
+import http.server
 import os
 import pathlib
+import threading
 from stat import S_IREAD, S_IRGRP, S_IROTH
 from unittest import mock
 
@@ -511,3 +514,163 @@ def test_fido_stereo_extent_type():
     res = Fido.search(a.Time('2008/01/14', '2008/01/14 01:00:00'), a.Instrument.secchi, a.Source('STEREO_A'), a.ExtentType('CORONA'))
     assert len(res[0]) == 123
     assert not all(res[0].columns["Extent Type"] == "CORONA")
+
+
+@pytest.fixture
+def local_file_server(tmp_path, local_http_server):
+    """
+    A local HTTP server for the files in a directory. Requests for the file
+    ``slow.fits`` wait until ``release`` is set.
+    """
+    root = tmp_path / "server"
+    root.mkdir()
+    for name in ["slow.fits", "fast1.fits", "fast2.fits"]:
+        (root / name).write_bytes(name.encode() * 1000)
+    release = threading.Event()
+
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.endswith("slow.fits"):
+                release.wait(10)
+            super().do_GET()
+
+    url = local_http_server(Handler, directory=root)
+    yield f"{url}/", release
+    release.set()
+
+
+def local_query_response(url, names):
+    return QueryResponse([{'url': url + name} for name in names], client=GenericClient())
+
+
+def test_fetch_iter(local_file_server, tmp_path):
+    url, release = local_file_server
+    qr = local_query_response(url, ["slow.fits", "missing.fits", "fast1.fits", "fast2.fits"])
+
+    downloads = Fido.fetch_iter(qr, path=tmp_path / "out", progress=False)
+    filepaths = []
+    for filepath in downloads:
+        filepaths.append(pathlib.Path(filepath).name)
+        # The fast files are yielded while the slow file is still being downloaded
+        if len(filepaths) == 2:
+            assert set(filepaths) == {"fast1.fits", "fast2.fits"}
+            release.set()
+    assert filepaths[-1] == "slow.fits"
+    assert len(filepaths) == 3
+
+    assert list(downloads.results) == [str(tmp_path / "out" / name) for name in filepaths]
+    assert len(downloads.errors) == 1
+    assert downloads.errors[0].url == url + "missing.fits"
+
+    with pytest.raises(RuntimeError, match="only be iterated over once"):
+        list(downloads)
+
+
+def test_fetch_iter_matches_fetch(local_file_server, tmp_path):
+    url, release = local_file_server
+    release.set()
+    qr = local_query_response(url, ["slow.fits", "missing.fits", "fast1.fits"])
+
+    expected = Fido.fetch(qr, path=tmp_path / "fetch", progress=False)
+    downloads = Fido.fetch_iter(qr, path=tmp_path / "fetch_iter", progress=False)
+
+    async def download():
+        return [filepath async for filepath in downloads]
+
+    filepaths = asyncio.run(download())
+    assert sorted(pathlib.Path(f).name for f in filepaths) == sorted(pathlib.Path(f).name for f in expected)
+    assert [e.url for e in downloads.errors] == [e.url for e in expected.errors]
+
+
+def test_fetch_iter_break(local_file_server, tmp_path):
+    url, release = local_file_server
+    qr = local_query_response(url, ["fast1.fits", "slow.fits"])
+
+    downloads = Fido.fetch_iter(qr, path=tmp_path, progress=False, max_conn=1)
+    for filepath in downloads:
+        break
+    # Stopping early cancels the download that has not finished
+    assert list(downloads.results) == [filepath]
+    assert pathlib.Path(filepath).name == "fast1.fits"
+
+
+def test_fetch_iter_reuses_connections(local_http_server, tmp_path):
+    root = tmp_path / "server"
+    root.mkdir()
+    names = [f"file{i}.fits" for i in range(5)]
+    for name in names:
+        (root / name).write_bytes(name.encode() * 1000)
+    connections = []
+
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            connections.append(self.client_address)
+            super().do_GET()
+
+    url = local_http_server(Handler, directory=root)
+    qr = local_query_response(f"{url}/", names)
+    filepaths = list(Fido.fetch_iter(qr, path=tmp_path / "out", progress=False, max_conn=1, max_splits=1))
+    assert len(filepaths) == len(names)
+    # All of the files are downloaded over the same connection
+    assert len(connections) == len(names)
+    assert len(set(connections)) == 1
+
+
+def test_fetch_iter_jsoc_only():
+    response = jsoc.JSOCResponse([{'T_REC': '2011-01-01T00:00:00Z'}], client=jsoc.JSOCClient())
+    downloads = Fido.fetch_iter(response, progress=False, max_conn=4)
+    assert downloads._downloader.config.max_conn == 1
+    assert downloads._downloader.config.max_splits == 1
+
+
+def test_fetch_iter_retry_error():
+    with pytest.raises(TypeError, match="only be retried with Fido.fetch"):
+        Fido.fetch_iter(Results())
+
+
+def delayed_search(wait, instrument):
+    def search(self, *query):
+        wait()
+        return QueryResponseTable([{'Instrument': instrument}], client=self)
+    return search
+
+
+@no_vso
+def test_search_concurrent():
+    # Each search waits until both have started, which only happens if they run at the same time
+    barrier = threading.Barrier(2, timeout=10)
+    with mock.patch("sunpy.net.dataretriever.sources.eve.EVEClient.search",
+                    delayed_search(barrier.wait, 'EVE')), \
+         mock.patch("sunpy.net.dataretriever.sources.norh.NoRHClient.search",
+                    delayed_search(barrier.wait, 'NORH')):
+        results = Fido.search(a.Time("2016/10/01", "2016/10/02"),
+                              (a.Instrument.eve & a.Level.zero) |
+                              (a.Instrument.norh & a.Wavelength(17*u.GHz)))
+    # The order is the same as that of the query
+    assert results.keys() == ['eve', 'norh']
+    assert not results.errors
+    for response in results:
+        assert response.search_time > 0*u.s
+
+
+@no_vso
+def test_search_timeout():
+    release = threading.Event()
+    with mock.patch("sunpy.net.dataretriever.sources.eve.EVEClient.search",
+                    delayed_search(lambda: release.wait(10), 'EVE')), \
+         mock.patch("sunpy.net.dataretriever.sources.norh.NoRHClient.search",
+                    delayed_search(lambda: None, 'NORH')):
+        results = Fido.search(a.Time("2016/10/01", "2016/10/02"),
+                              (a.Instrument.eve & a.Level.zero) |
+                              (a.Instrument.norh & a.Wavelength(17*u.GHz)),
+                              timeout=0.5)
+        release.set()
+    # The search that finished is kept, and the search that timed out is empty
+    assert results.keys() == ['eve', 'norh']
+    assert len(results['eve']) == 0
+    assert isinstance(results['eve'].errors, TimeoutError)
+    assert results['eve'].search_time == 0.5*u.s
+    assert len(results['norh']) == 1
+    assert results['norh'].errors == []
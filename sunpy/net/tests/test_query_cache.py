@@ -0,0 +1,120 @@
+from unittest import mock
+
+import pytest
+
+import astropy.units as u
+from astropy.time import Time
+
+from sunpy.net import Fido
+from sunpy.net import attrs as a
+from sunpy.net.base_client import QueryResponseTable
+from sunpy.net.dataretriever.sources.eve import EVEClient
+from sunpy.net.query_cache import QueryCache
+from sunpy.tests.helpers import no_vso
+
+PAST_QUERY = (a.Time("2016/10/01", "2016/10/02"), a.Instrument.eve, a.Level.zero)
+
+
+@pytest.fixture
+def query_cache(tmp_path):
+    return QueryCache(tmp_path)
+
+
+def response(client, nrows=1):
+    return QueryResponseTable([{'Instrument': 'EVE', 'url': f'file{i}'} for i in range(nrows)],
+                              client=client)
+
+
+def test_key_order():
+    client = EVEClient()
+    key = QueryCache._key(client, PAST_QUERY)
+    # Equal attrs which are different objects, in a different order
+    assert QueryCache._key(client, (a.Level.zero, a.Instrument.eve,
+                                    a.Time("2016-10-01T00:00", "2016-10-02T00:00"))) == key
+    assert QueryCache._key(client, (a.Time("2016/10/01", "2016/10/03"), *PAST_QUERY[1:])) != key
+    assert QueryCache._key(client, (*PAST_QUERY, a.Wavelength(30*u.nm))) != key
+
+
+def test_get_store(query_cache):
+    client = EVEClient()
+    assert query_cache.get(client, PAST_QUERY) is None
+    stored = response(client, 3)
+    stored.search_time = 1*u.s
+    query_cache.store(client, PAST_QUERY, stored)
+    # The response which was stored is unchanged
+    assert stored.client is client
+    assert stored.search_time == 1*u.s
+
+    new_client = EVEClient()
+    cached = query_cache.get(new_client, PAST_QUERY)
+    assert cached.client is new_client
+    assert cached.search_time is None
+    assert list(cached['url']) == ['file0', 'file1', 'file2']
+    assert query_cache.get(client, PAST_QUERY[:2]) is None
+
+
+def test_errors_not_stored(query_cache):
+    client = EVEClient()
+    query_cache.store(client, PAST_QUERY, QueryResponseTable([], client=client, errors=ValueError()))
+    assert query_cache.get(client, PAST_QUERY) is None
+
+
+def test_expiry(tmp_path):
+    client = EVEClient()
+    now = Time.now()
+    recent_query = (a.Time(now - 1*u.day, now + 1*u.day), a.Instrument.eve)
+    query_cache = QueryCache(tmp_path, expiry=0*u.s)
+    query_cache.store(client, recent_query, response(client))
+    query_cache.store(client, PAST_QUERY, response(client))
+    assert query_cache.get(client, recent_query) is None
+    # A time range which ended before the expiry interval does not expire
+    assert query_cache.get(client, PAST_QUERY) is not None
+
+
+def test_client_expiry(tmp_path):
+    client = EVEClient()
+    now = Time.now()
+    recent_query = (a.Time(now - 1*u.day, now + 1*u.day), a.Instrument.eve)
+    query_cache = QueryCache(tmp_path, expiry=0*u.s, client_expiry={EVEClient: 1*u.day})
+    query_cache.store(client, recent_query, response(client))
+    assert query_cache.get(client, recent_query) is not None
+
+
+def test_max_size(tmp_path):
+    client = EVEClient()
+    queries = [(a.Time("2016/10/01", "2016/10/02"), a.Instrument.eve, a.Level(level))
+               for level in range(3)]
+    query_cache = QueryCache(tmp_path, max_size=None)
+    query_cache.store(client, queries[0], response(client))
+    size = (tmp_path / f"{QueryCache._key(client, queries[0])}.pickle").stat().st_size
+
+    # Room for two responses, and the first is used after the second is stored
+    query_cache = QueryCache(tmp_path, max_size=2.5 * size * u.byte)
+    query_cache.store(client, queries[1], response(client))
+    assert query_cache.get(client, queries[0]) is not None
+    query_cache.store(client, queries[2], response(client))
+    assert query_cache.get(client, queries[0]) is not None
+    assert query_cache.get(client, queries[1]) is None
+    assert query_cache.get(client, queries[2]) is not None
+    assert len(list(tmp_path.glob('*.pickle'))) == 2
+
+
+def test_clear(query_cache, tmp_path):
+    client = EVEClient()
+    query_cache.store(client, PAST_QUERY, response(client))
+    query_cache.clear()
+    assert query_cache.get(client, PAST_QUERY) is None
+    assert not list(tmp_path.glob('*.pickle'))
+
+
+@no_vso
+def test_fido_query_cache(query_cache, monkeypatch):
+    monkeypatch.setattr(Fido, 'query_cache', query_cache)
+    with mock.patch("sunpy.net.dataretriever.sources.eve.EVEClient.search",
+                    autospec=True, side_effect=lambda self, *query: response(self, 2)) as search:
+        results = Fido.search(*PAST_QUERY)
+        cached_results = Fido.search(a.Level.zero, a.Instrument.eve, PAST_QUERY[0])
+    search.assert_called_once()
+    assert len(cached_results['eve']) == 2
+    assert list(cached_results['eve']['url']) == list(results['eve']['url'])
+    assert cached_results['eve'].search_time.unit == u.s
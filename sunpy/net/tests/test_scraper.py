@@ -1,5 +1,6 @@
 import datetime
 import logging
+from http.server import SimpleHTTPRequestHandler
 from unittest.mock import Mock, patch
 from urllib.error import HTTPError, URLError
 
@@ -253,8 +254,8 @@ def test_yearly_overlap():
     ],
 )
 def test_http_errors_with_enqueue_limit(error_code, expected_number_calls, error_message):
-    with patch("sunpy.net.scraper.urlopen") as mocked_urlopen:
-        mocked_urlopen.side_effect = HTTPError(
+    with patch("sunpy.net.scraper._get_directory") as mocked_get:
+        mocked_get.side_effect = HTTPError(
             "https://example.com", error_code, error_message, {}, None
         )
         time_range = TimeRange("2012/3/4", "2012/3/4 02:00")
@@ -263,12 +264,12 @@ def test_http_errors_with_enqueue_limit(error_code, expected_number_calls, error
         with pytest.raises(HTTPError, match=error_message) as excinfo:
             scraper._httpfilelist(time_range)
         assert excinfo.value.code == error_code
-        assert mocked_urlopen.call_count == expected_number_calls
+        assert mocked_get.call_count == expected_number_calls
 
 
 def test_connection_error():
-    with patch('sunpy.net.scraper.urlopen') as mocked_urlopen:
-        mocked_urlopen.side_effect = URLError('connection error')
+    with patch('sunpy.net.scraper._get_directory') as mocked_get:
+        mocked_get.side_effect = URLError('connection error')
         time = TimeRange('2012/3/4', '2012/3/4 02:00')
         pattern = "https://proba2.sidc.be/lyra/data/bsd/{{year:4d}}/{{month:2d}}/{{day:2d}}/{{}}_lev{{Level:1d}}_std.fits"
         scraper = Scraper(format=pattern)
@@ -281,9 +282,9 @@ def test_http_404_error_debug_message(caplog):
     with caplog.at_level(logging.DEBUG, logger='sunpy'):
         def patch_range(self, range):
             return ['https://test.com/']
-        with patch('sunpy.net.scraper.urlopen') as mocked_urlopen:
+        with patch('sunpy.net.scraper._get_directory') as mocked_get:
             with patch.object(Scraper, 'range', patch_range):
-                mocked_urlopen.side_effect = HTTPError('https://example.com', 404, '', {}, None)
+                mocked_get.side_effect = HTTPError('https://example.com', 404, '', {}, None)
                 time = TimeRange('2012/3/4', '2012/3/4 02:00')
                 pattern = "https://proba2.sidc.be/lyra/data/bsd/{{year:4d}}/{{month:2d}}/{{day:2d}}/{{}}_lev{{Level:1d}}_std.fits"
                 scraper = Scraper(format=pattern)
@@ -328,3 +329,53 @@ def test_local_expected_directory_doesnt_exist(tmp_path):
     meta = s._extract_files_meta(TimeRange("2025-01-01", "2025-01-02"))
     assert len(files) == 1
     assert len(meta) == 1
+
+
+@pytest.fixture
+def http_archive(tmp_path, local_http_server):
+    # Daily directories of six hourly files, without a directory for the 5th
+    for day in range(1, 11):
+        if day == 5:
+            continue
+        directory = tmp_path / '2020' / '01' / f'{day:02d}'
+        directory.mkdir(parents=True)
+        (directory / 'README.txt').write_text('')
+        for hour in range(0, 24, 6):
+            (directory / f'xrs_202001{day:02d}_{hour:02d}.fits').write_text('')
+
+    requests = []
+    # The server asks for the first request for this directory to be retried
+    rate_limited = {'/2020/01/03/'}
+
+    class Handler(SimpleHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            requests.append((self.path, self.client_address))
+            if self.path in rate_limited:
+                rate_limited.discard(self.path)
+                self.send_response(429)
+                self.send_header("Retry-After", "1")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            super().do_GET()
+
+    return local_http_server(Handler, directory=tmp_path), tmp_path, requests
+
+
+@pytest.mark.parametrize('max_conn', [1, 4])
+def test_http_filelist_matches_local(http_archive, max_conn):
+    url, path, requests = http_archive
+    file_pattern = '{{year:4d}}/{{month:2d}}/{{day:2d}}/xrs_{{year:4d}}{{month:2d}}{{day:2d}}_{{hour:2d}}.fits'
+    timerange = TimeRange('2020-01-02 03:00', '2020-01-09 07:00')
+    http_files = Scraper(format=f'{url}/{file_pattern}')._httpfilelist(timerange, max_conn=max_conn)
+    local_files = Scraper(format=f'{path.as_uri()}/{file_pattern}').filelist(timerange)
+
+    assert len(http_files) == 25
+    # The server lists the files of a directory in order
+    assert http_files == sorted(file.replace(path.as_uri(), url) for file in local_files)
+    # The rate limited directory was retried
+    assert [request_path for request_path, _ in requests].count('/2020/01/03/') == 2
+    # The connections were reused, except the one the server closed after the missing directory
+    assert len({address for _, address in requests}) <= max_conn + 1
@@ -1,4 +1,8 @@
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from functools import partial
 
 import numpy as np
 
@@ -27,7 +31,7 @@ from sunpy.time import parse_time
 from sunpy.util import expand_list
 from sunpy.util.exceptions import warn_user
 
-__all__ = ['solar_rotate_coordinate', 'differential_rotate']
+__all__ = ['solar_rotate_coordinate', 'differential_rotate', 'DifferentialRotationWarp']
 
 
 def _validate_observer_args(initial_obstime, observer, time):
@@ -300,6 +304,67 @@ def _get_bounding_coordinates(coords):
                     frame=coords[0].frame)
 
 
+def _output_heliographic_coordinates(xy, smap, new_observer):
+    """
+    Return the heliographic Stonyhurst coordinates of pixels in the warped image, as seen by
+    ``new_observer``.
+
+    We need to get the input pixel coordinates into the OUTPUT HPC frame.
+    To save us having to construct a WCS etc, we do the transformation
+    using the output map, and then replace the observer in place before
+    transforming to HGS. This is acceptable because the pixel -> world
+    transformation is independent of the observer.
+    """
+    input_pixels = xy.T
+    map_coord = smap.wcs.pixel_to_world(*input_pixels)
+    output_hpc_coords = SkyCoord(map_coord.Tx,
+                                 map_coord.Ty,
+                                 map_coord.distance,
+                                 obstime=new_observer.obstime,
+                                 observer=new_observer,
+                                 frame=Helioprojective)
+    return output_hpc_coords.transform_to(HeliographicStonyhurst)
+
+
+def _heliographic_to_map_pixels(heliographic_coordinate, smap, new_observer, **diff_rot_kwargs):
+    """
+    Return the pixel locations in ``smap`` of heliographic Stonyhurst coordinates as seen by
+    ``new_observer``, after rotating them back to the observation time of ``smap``.
+    Coordinates that are behind the Sun as seen from the map observer are NaN.
+    """
+    # The time interval between the new observer time and the map observation time.
+    interval = (parse_time(new_observer.obstime) - parse_time(smap.date)).to(u.s)
+
+    # Compute the differential rotation.
+    drot = sunpy.sun.models.differential_rotation(interval, heliographic_coordinate.lat.to(u.degree), **diff_rot_kwargs)
+
+    # The change in longitude is negative because we are mapping from the
+    # new coordinates to the old.
+    rotated_coord = SkyCoord(heliographic_coordinate.lon - drot,
+                             heliographic_coordinate.lat,
+                             heliographic_coordinate.radius,
+                             obstime=heliographic_coordinate.obstime,
+                             frame=HeliographicStonyhurst)
+
+    with transform_with_sun_center():
+        # As seen from the map observer, which coordinates are behind the Sun.
+        where_off_disk_from_map_observer = rotated_coord.transform_to(
+            Heliocentric(observer=smap.observer_coordinate)).z.value < 0
+
+        # Re-project the pixels which are on disk back to location of the original observer
+        coordinates_at_map_observer = rotated_coord.transform_to(smap.coordinate_frame)
+
+    # Go back to pixel coordinates
+    x2, y2 = smap.wcs.world_to_pixel(coordinates_at_map_observer)
+
+    # Re-stack the data to make it correct output form
+    xy2 = np.dstack([x2.T.flat, y2.T.flat])[0]
+    # Set the off disk coordinates to NaN so they are not included in the output image.
+    xy2[where_off_disk_from_map_observer.flat] = np.nan
+
+    return xy2
+
+
 def _warp_sun_coordinates(xy, smap, new_observer, **diff_rot_kwargs):
     """
     This function takes pixel coordinates in the warped image (`xy`) and
@@ -332,56 +397,352 @@ def _warp_sun_coordinates(xy, smap, new_observer, **diff_rot_kwargs):
     See :func:`~sunpy.coordinates.transform_with_sun_center`.
     """
     # Suppress NaN warnings in coordinate transforms
-    import warnings
     with warnings.catch_warnings():
         warnings.simplefilter('ignore')
+        heliographic_coordinate = _output_heliographic_coordinates(xy, smap, new_observer)
+        return _heliographic_to_map_pixels(heliographic_coordinate, smap, new_observer, **diff_rot_kwargs)
 
-        # The time interval between the new observer time and the map observation time.
-        interval = (parse_time(new_observer.obstime) - parse_time(smap.date)).to(u.s)
-
-        # We need to get the input pixel coordinates into the OUTPUT HPC frame.
-        # To save us having to construct a WCS etc, we do the transformation
-        # using the output map, and then replace the observer in place before
-        # transforming to HGS. This is acceptable because the pixel -> world
-        # transformation is independent of the observer.
-        input_pixels = xy.T
-        map_coord = smap.wcs.pixel_to_world(*input_pixels)
-        output_hpc_coords = SkyCoord(map_coord.Tx,
-                                     map_coord.Ty,
-                                     map_coord.distance,
-                                     obstime=new_observer.obstime,
-                                     observer=new_observer,
-                                     frame=Helioprojective)
-        heliographic_coordinate = output_hpc_coords.transform_to(HeliographicStonyhurst)
-
-        # Compute the differential rotation.
-        drot = sunpy.sun.models.differential_rotation(interval, heliographic_coordinate.lat.to(u.degree), **diff_rot_kwargs)
-
-        # The change in longitude is negative because we are mapping from the
-        # new coordinates to the old.
-        rotated_coord = SkyCoord(heliographic_coordinate.lon - drot,
-                                 heliographic_coordinate.lat,
-                                 heliographic_coordinate.radius,
-                                 obstime=heliographic_coordinate.obstime,
-                                 frame=HeliographicStonyhurst)
-
-        with transform_with_sun_center():
-            # As seen from the map observer, which coordinates are behind the Sun.
-            where_off_disk_from_map_observer = rotated_coord.transform_to(
-                Heliocentric(observer=smap.observer_coordinate)).z.value < 0
-
-            # Re-project the pixels which are on disk back to location of the original observer
-            coordinates_at_map_observer = rotated_coord.transform_to(smap.coordinate_frame)
-
-        # Go back to pixel coordinates
-        x2, y2 = smap.wcs.world_to_pixel(coordinates_at_map_observer)
 
-    # Re-stack the data to make it correct output form
-    xy2 = np.dstack([x2.T.flat, y2.T.flat])[0]
-    # Set the off disk coordinates to NaN so they are not included in the output image.
-    xy2[where_off_disk_from_map_observer.flat] = np.nan
+# The largest error in pixels of the interpolated pixel mapping at the center of a grid cell
+# before the pixels of that cell are calculated exactly
+_GRID_TOLERANCE = 0.01
 
-    return xy2
+
+def _grid_nodes(shape, grid_step):
+    """
+    Return the rows and the columns of a grid with a spacing of ``grid_step`` pixels
+    that includes the last row and column.
+    """
+    rows = np.union1d(np.arange(0, shape[0], grid_step), [shape[0] - 1])
+    cols = np.union1d(np.arange(0, shape[1], grid_step), [shape[1] - 1])
+    return rows, cols
+
+
+def _pixel_geometry(smap):
+    return (smap.data.shape,
+            u.Quantity(smap.reference_pixel).to_value(u.pix),
+            u.Quantity([smap.reference_coordinate.Tx, smap.reference_coordinate.Ty]).to_value(u.arcsec),
+            u.Quantity(smap.scale).to_value(u.arcsec / u.pix),
+            smap.rotation_matrix)
+
+
+class DifferentialRotationWarp:
+    """
+    The warp of `differential_rotate` for maps with a given pixel grid, which can be applied
+    to many maps.
+
+    All of the geometric work of `differential_rotate` (finding the on-disk region, padding,
+    and the location in the output map of each pixel of the input map) depends only on the
+    pixel grid, observation time, and observer of the map. This object does that work once
+    for the map that it is created with, so that applying it to other maps with the same pixel
+    grid costs little more than the interpolation of the data. The pixel mapping for the most
+    recent observation time and observer is kept, so it is only reused as a whole for maps
+    with the same date and observer.
+
+    Maps with the same pixel grid but a different observation time (for example, the frames
+    of an image sequence) are rotated by the correct amount for their own observation time,
+    and the output maps all have the same pixel grid. The heliographic coordinates of the
+    output pixels are calculated once and reused, but the mapping back to the input pixels
+    is recalculated for each of these maps, which is cheaper when ``grid_step`` is greater
+    than 1.
+
+    Parameters
+    ----------
+    smap : `~sunpy.map.GenericMap`
+        A map with the pixel grid of the maps to warp.
+    observer : `~astropy.coordinates.BaseCoordinateFrame`, `~astropy.coordinates.SkyCoord`, `None`, optional
+        The location of the new observer. See `differential_rotate`.
+    time : sunpy-compatible time, `~astropy.time.TimeDelta`, `~astropy.units.Quantity`, `None`, optional
+        Used to define the duration over which the amount of solar rotation is
+        calculated. See `differential_rotate`.
+    grid_step : `int`, optional
+        If greater than 1, the pixel mapping is calculated only every ``grid_step`` pixels in
+        each direction and bilinearly interpolated in between. Pixels near the limb, and pixels
+        where the interpolation is not accurate to about 0.01 pixels, are calculated exactly.
+        Defaults to 1, which calculates the mapping for every pixel.
+    **diff_rot_kwargs : `dict`
+        Keyword arguments are passed on to `~sunpy.sun.models.differential_rotation`.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> from sunpy.physics.differential_rotation import DifferentialRotationWarp
+    >>> warp = DifferentialRotationWarp(aia_maps[0], time=aia_maps[0].date + 1*u.day)  # doctest: +SKIP
+    >>> rotated_maps = warp.apply(aia_maps, workers=4)  # doctest: +SKIP
+    """
+    def __init__(self, smap, observer=None, time=None, *, grid_step=1, **diff_rot_kwargs):
+        # If the entire map is off-disk, return an error so the user is aware.
+        if is_all_off_disk(smap):
+            raise ValueError("The entire map is off disk. No data to differentially rotate.")
+        if grid_step < 1:
+            raise ValueError("grid_step must be a positive integer.")
+
+        # Get the new observer
+        self.observer = _get_new_observer(smap.date, observer, time)
+        self.grid_step = int(grid_step)
+        self._diff_rot_kwargs = diff_rot_kwargs
+        self._geometry = _pixel_geometry(smap)
+        self._lock = threading.Lock()
+        self._cached_key = None
+        self._cached_coordinates = None
+
+        # Check whether the input contains the full disk of the Sun
+        self._is_sub_full_disk = not contains_full_disk(smap)
+        self._on_disk_corners = None
+        if self._is_sub_full_disk:
+            # Find the minimal submap of the input map that includes all the
+            # on disk pixels. This is required in order to calculate how
+            # much to pad the output (solar-differentially rotated) data array by
+            # compared to the input map.
+            # The amount of padding is dependent on the amount of solar differential
+            # rotation and where the on-disk pixels are (since these pixels are the only ones
+            # subject to solar differential rotation).
+            if not is_all_on_disk(smap):
+                # Get the bottom left and top right coordinates that are the
+                # vertices that define a box that encloses the on disk pixels
+                self._on_disk_corners = on_disk_bounding_coordinates(smap)
+
+                # Create a submap that excludes the off disk emission that does
+                # not need to be rotated.
+                smap = smap.submap(self._on_disk_corners[0], top_right=self._on_disk_corners[1])
+            bottom_left = smap.bottom_left_coord
+            top_right = smap.top_right_coord
+
+            # Get the edges of the minimal submap that contains all the on-disk pixels.
+            edges = map_edges(smap)
+
+            # Calculate where the output array moves to.
+            # Rotate the top and bottom edges
+            rotated_top = _rotate_submap_edge(smap, edges[0], observer=self.observer, **diff_rot_kwargs)
+            rotated_bottom = _rotate_submap_edge(
+                smap, edges[1], observer=self.observer, **diff_rot_kwargs)
+
+            # Rotate the left and right hand edges
+            rotated_lhs = _rotate_submap_edge(smap, edges[2], observer=self.observer, **diff_rot_kwargs)
+            rotated_rhs = _rotate_submap_edge(smap, edges[3], observer=self.observer, **diff_rot_kwargs)
+
+            # Calculate the bounding box of the rotated map
+            self._rotated_corners = _get_bounding_coordinates(
+                [rotated_top, rotated_bottom, rotated_lhs, rotated_rhs])
+            rotated_bl, rotated_tr = self._rotated_corners
+
+            # Calculate the maximum distance in pixels the map has moved by comparing
+            # how far the original and rotated bounding boxes have moved.
+            diff_x = [(np.abs(rotated_bl.Tx - bottom_left.Tx)).value,
+                      (np.abs(rotated_tr.Tx - top_right.Tx)).value]
+            deltax = int(np.ceil(np.max(diff_x) / smap.scale.axis1).value)
+
+            diff_y = [(np.abs(rotated_bl.Ty - bottom_left.Ty)).value,
+                      (np.abs(rotated_tr.Ty - top_right.Ty)).value]
+            deltay = int(np.ceil(np.max(diff_y) / smap.scale.axis2).value)
+            self._padding = (deltay, deltax)
+
+            smap = self._pad(smap)
+
+            # Define a new reference pixel and the value at the reference pixel.
+            # Note that according to the FITS convention the first pixel in the
+            # image is at (1.0, 1.0).
+            center_rotated = solar_rotate_coordinate(
+                smap.center, observer=self.observer, **diff_rot_kwargs)
+            self._reference_meta = {
+                'crval1': center_rotated.Tx.value,
+                'crval2': center_rotated.Ty.value,
+                'crpix1': 1 + smap.data.shape[1]/2.0 + ((center_rotated.Tx - smap.center.Tx)/smap.scale.axis1).value,
+                'crpix2': 1 + smap.data.shape[0]/2.0 + ((center_rotated.Ty - smap.center.Ty)/smap.scale.axis2).value,
+            }
+
+        self._shape = smap.data.shape
+        # The heliographic coordinates of the output pixels are the same for every map
+        if self.grid_step == 1:
+            rows, cols = np.indices(self._shape)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                self._pixel_heliographic = _output_heliographic_coordinates(
+                    np.column_stack([cols.ravel(), rows.ravel()]), smap, self.observer)
+        else:
+            self._nodes = _grid_nodes(self._shape, self.grid_step)
+            rows, cols = self._nodes
+            centers = ((rows[:-1] + rows[1:]) / 2, (cols[:-1] + cols[1:]) / 2)
+            node_xy = np.stack(np.meshgrid(cols, rows), axis=-1).reshape(-1, 2)
+            center_xy = np.stack(np.meshgrid(*centers[::-1]), axis=-1).reshape(-1, 2)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                self._node_heliographic = _output_heliographic_coordinates(node_xy, smap, self.observer)
+                self._center_heliographic = _output_heliographic_coordinates(center_xy, smap,
+                                                                             self.observer)
+
+    def _pad(self, smap):
+        """
+        Create a new map with the padding around it that is needed for the rotated data.
+        """
+        deltay, deltax = self._padding
+        padded_data = np.pad(smap.data, ((deltay, deltay), (deltax, deltax)),
+                             'constant', constant_values=0)
+        padded_meta = deepcopy(smap.meta)
+        padded_meta['naxis2'], padded_meta['naxis1'] = smap.data.shape
+
+        padded_meta['crpix1'] += deltax
+        padded_meta['crpix2'] += deltay
+
+        # Create the padded map that will be used to create the rotated map.
+        return smap._new_instance(padded_data, padded_meta, smap.plot_settings)
+
+    def _coordinates(self, smap):
+        """
+        Return the coordinate array of the warp for the padded map ``smap``, in the form
+        accepted by `skimage.transform.warp`.
+        """
+        observer = smap.observer_coordinate
+        key = (smap.date.jd1, smap.date.jd2, tuple(observer.cartesian.xyz.to_value(u.m)))
+        with self._lock:
+            if key == self._cached_key:
+                return self._cached_coordinates
+
+        inverse_map = partial(_warp_sun_coordinates, smap=smap, new_observer=self.observer,
+                              **self._diff_rot_kwargs)
+        if self.grid_step == 1:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                xy2 = _heliographic_to_map_pixels(self._pixel_heliographic, smap, self.observer,
+                                                  **self._diff_rot_kwargs)
+            # Rows, then columns, to match the coordinate array
+            coordinates = xy2.T.reshape(2, *self._shape)[::-1]
+        else:
+            from scipy import ndimage
+
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                node_xy2 = _heliographic_to_map_pixels(self._node_heliographic, smap, self.observer,
+                                                       **self._diff_rot_kwargs)
+                center_xy2 = _heliographic_to_map_pixels(self._center_heliographic, smap,
+                                                         self.observer, **self._diff_rot_kwargs)
+            rows, cols = self._nodes
+            # Rows of the grid nodes, then columns, to match the coordinate array
+            node_coordinates = node_xy2.T.reshape(2, len(rows), len(cols))[::-1]
+            center_coordinates = center_xy2.T.reshape(2, len(rows) - 1, len(cols) - 1)[::-1]
+
+            # The position of every pixel in units of grid nodes
+            grid = np.meshgrid(np.interp(np.arange(self._shape[0]), rows, np.arange(len(rows))),
+                               np.interp(np.arange(self._shape[1]), cols, np.arange(len(cols))),
+                               indexing='ij')
+            coordinates = np.stack([ndimage.map_coordinates(np.nan_to_num(c), grid, order=1, mode='nearest')
+                                    for c in node_coordinates])
+
+            # Check the interpolation of each grid cell at its center, where it is the mean of
+            # the four corners. Cells that are entirely off the disk are off the disk, and cells
+            # that are partly off the disk (i.e., at the limb) or where the interpolation is not
+            # accurate enough are calculated exactly.
+            corners = np.stack([node_coordinates[:, :-1, :-1], node_coordinates[:, :-1, 1:],
+                                node_coordinates[:, 1:, :-1], node_coordinates[:, 1:, 1:]])
+            corners_on_disk = np.isfinite(corners).all(axis=1)
+            center_on_disk = np.isfinite(center_coordinates).all(axis=0)
+            off_disk = ~corners_on_disk.any(axis=0) & ~center_on_disk
+            with np.errstate(invalid='ignore'):
+                error = np.abs(corners.mean(axis=0) - center_coordinates).max(axis=0)
+            refine = ~off_disk & ~(error <= _GRID_TOLERANCE)
+
+            # The grid cell of every pixel
+            cell = np.meshgrid(np.clip(np.searchsorted(rows, np.arange(self._shape[0]), side='right') - 1,
+                                       0, len(rows) - 2),
+                               np.clip(np.searchsorted(cols, np.arange(self._shape[1]), side='right') - 1,
+                                       0, len(cols) - 2),
+                               indexing='ij')
+            coordinates[:, off_disk[tuple(cell)]] = np.nan
+            exact = refine[tuple(cell)]
+            if exact.any():
+                row_index, col_index = np.nonzero(exact)
+                coordinates[:, exact] = inverse_map(np.column_stack([col_index, row_index])).T[::-1]
+
+        with self._lock:
+            self._cached_key, self._cached_coordinates = key, coordinates
+        return coordinates
+
+    def __call__(self, smap):
+        """
+        Warp a map that has the same pixel grid as the map that this warp was created with.
+
+        Parameters
+        ----------
+        smap : `~sunpy.map.GenericMap`
+            The map to warp.
+
+        Returns
+        -------
+        `~sunpy.map.GenericMap`
+            A map with the result of applying solar differential rotation to the
+            input map.
+        """
+        if not all(np.array_equal(a, b) if i == 0 else np.allclose(a, b)
+                   for i, (a, b) in enumerate(zip(_pixel_geometry(smap), self._geometry))):
+            raise ValueError("The map does not have the same pixel grid as the map that the warp was created with.")
+
+        # Only this function needs scikit image
+        from skimage import transform
+
+        if self._is_sub_full_disk:
+            if self._on_disk_corners is not None:
+                smap = smap.submap(self._on_disk_corners[0], top_right=self._on_disk_corners[1])
+            smap = self._pad(smap)
+
+        # Check for masked maps
+        if smap.mask is not None:
+            smap_data = np.ma.array(smap.data, mask=smap.mask)
+        else:
+            smap_data = smap.data
+
+        # Apply solar differential rotation as a scikit-image warp
+        out_data = transform.warp(smap_data, inverse_map=self._coordinates(smap),
+                                  preserve_range=True, cval=np.nan)
+
+        out_meta = deepcopy(smap.meta)
+
+        # Need to update the observer location for the output map.
+        # Remove all the possible observer keys
+        all_keys = expand_list([e[0] for e in smap._supported_observer_coordinates])
+        for key in all_keys:
+            out_meta.pop(key)
+
+        # Add a new HGS observer
+        out_meta.update(get_observer_meta(self.observer, smap.rsun_meters))
+
+        if self._is_sub_full_disk:
+            out_meta.update(self._reference_meta)
+
+        outmap = smap._new_instance(out_data, out_meta, smap.plot_settings)
+
+        # Update the meta information with the new date and time.
+        outmap._set_date(self.observer.obstime)
+        outmap._set_reference_date(self.observer.obstime)
+
+        if self._is_sub_full_disk:
+            return outmap.submap(self._rotated_corners[0], top_right=self._rotated_corners[1])
+        return outmap
+
+    def apply(self, maps, *, workers=None, executor=None):
+        """
+        Warp many maps that have the same pixel grid as the map that this warp was created
+        with, concurrently.
+
+        Parameters
+        ----------
+        maps : iterable of `~sunpy.map.GenericMap`
+            The maps to warp, for example a `~sunpy.map.MapSequence`.
+        workers : `int`, optional
+            The number of threads to use if ``executor`` is not given.
+            Defaults to the `~concurrent.futures.ThreadPoolExecutor` default.
+        executor : `concurrent.futures.Executor`, optional
+            The executor to use instead of creating a thread pool. It is not shut down
+            afterwards.
+
+        Returns
+        -------
+        `list` of `~sunpy.map.GenericMap`
+            The warped maps, in the same order as ``maps``.
+        """
+        if executor is not None:
+            return list(executor.map(self, maps))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self, maps))
 
 
 def differential_rotate(smap, observer=None, time=None, **diff_rot_kwargs):
@@ -439,121 +800,8 @@ def differential_rotate(smap, observer=None, time=None, **diff_rot_kwargs):
     -----
     The translational motion of the Sun over the time interval will be ignored.
     See :func:`~sunpy.coordinates.transform_with_sun_center`.
-    """
-    # If the entire map is off-disk, return an error so the user is aware.
-    if is_all_off_disk(smap):
-        raise ValueError("The entire map is off disk. No data to differentially rotate.")
-
-    # Get the new observer
-    new_observer = _get_new_observer(smap.date, observer, time)
-
-    # Only this function needs scikit image
-    from skimage import transform
-
-    # Check whether the input contains the full disk of the Sun
-    is_sub_full_disk = not contains_full_disk(smap)
-    if is_sub_full_disk:
-        # Find the minimal submap of the input map that includes all the
-        # on disk pixels. This is required in order to calculate how
-        # much to pad the output (solar-differentially rotated) data array by
-        # compared to the input map.
-        # The amount of padding is dependent on the amount of solar differential
-        # rotation and where the on-disk pixels are (since these pixels are the only ones
-        # subject to solar differential rotation).
-        if not is_all_on_disk(smap):
-            # Get the bottom left and top right coordinates that are the
-            # vertices that define a box that encloses the on disk pixels
-            bottom_left, top_right = on_disk_bounding_coordinates(smap)
-
-            # Create a submap that excludes the off disk emission that does
-            # not need to be rotated.
-            smap = smap.submap(bottom_left, top_right=top_right)
-        bottom_left = smap.bottom_left_coord
-        top_right = smap.top_right_coord
-
-        # Get the edges of the minimal submap that contains all the on-disk pixels.
-        edges = map_edges(smap)
-
-        # Calculate where the output array moves to.
-        # Rotate the top and bottom edges
-        rotated_top = _rotate_submap_edge(smap, edges[0], observer=new_observer, **diff_rot_kwargs)
-        rotated_bottom = _rotate_submap_edge(
-            smap, edges[1], observer=new_observer, **diff_rot_kwargs)
-
-        # Rotate the left and right hand edges
-        rotated_lhs = _rotate_submap_edge(smap, edges[2], observer=new_observer, **diff_rot_kwargs)
-        rotated_rhs = _rotate_submap_edge(smap, edges[3], observer=new_observer, **diff_rot_kwargs)
-
-        # Calculate the bounding box of the rotated map
-        rotated_bl, rotated_tr = _get_bounding_coordinates(
-            [rotated_top, rotated_bottom, rotated_lhs, rotated_rhs])
-
-        # Calculate the maximum distance in pixels the map has moved by comparing
-        # how far the original and rotated bounding boxes have moved.
-        diff_x = [(np.abs(rotated_bl.Tx - bottom_left.Tx)).value,
-                  (np.abs(rotated_tr.Tx - top_right.Tx)).value]
-        deltax = int(np.ceil(np.max(diff_x) / smap.scale.axis1).value)
-
-        diff_y = [(np.abs(rotated_bl.Ty - bottom_left.Ty)).value,
-                  (np.abs(rotated_tr.Ty - top_right.Ty)).value]
-        deltay = int(np.ceil(np.max(diff_y) / smap.scale.axis2).value)
-
-        # Create a new `smap` with the padding around it
-        padded_data = np.pad(smap.data, ((deltay, deltay), (deltax, deltax)),
-                             'constant', constant_values=0)
-        padded_meta = deepcopy(smap.meta)
-        padded_meta['naxis2'], padded_meta['naxis1'] = smap.data.shape
-
-        padded_meta['crpix1'] += deltax
-        padded_meta['crpix2'] += deltay
 
-        # Create the padded map that will be used to create the rotated map.
-        smap = smap._new_instance(padded_data, padded_meta, smap.plot_settings)
-
-    # Check for masked maps
-    if smap.mask is not None:
-        smap_data = np.ma.array(smap.data, mask=smap.mask)
-    else:
-        smap_data = smap.data
-
-    # Create the arguments for the warp function.
-    warp_args = {'smap': smap, 'new_observer': new_observer}
-    warp_args.update(diff_rot_kwargs)
-
-    # Apply solar differential rotation as a scikit-image warp
-    out_data = transform.warp(smap_data, inverse_map=_warp_sun_coordinates,
-                              map_args=warp_args, preserve_range=True, cval=np.nan)
-
-    out_meta = deepcopy(smap.meta)
-
-    # Need to update the observer location for the output map.
-    # Remove all the possible observer keys
-    all_keys = expand_list([e[0] for e in smap._supported_observer_coordinates])
-    for key in all_keys:
-        out_meta.pop(key)
-
-    # Add a new HGS observer
-    out_meta.update(get_observer_meta(new_observer, smap.rsun_meters))
-
-    if is_sub_full_disk:
-        # Define a new reference pixel and the value at the reference pixel.
-        # Note that according to the FITS convention the first pixel in the
-        # image is at (1.0, 1.0).
-        center_rotated = solar_rotate_coordinate(
-            smap.center, observer=new_observer, **diff_rot_kwargs)
-        out_meta['crval1'] = center_rotated.Tx.value
-        out_meta['crval2'] = center_rotated.Ty.value
-        out_meta['crpix1'] = 1 + smap.data.shape[1]/2.0 + \
-            ((center_rotated.Tx - smap.center.Tx)/smap.scale.axis1).value
-        out_meta['crpix2'] = 1 + smap.data.shape[0]/2.0 + \
-            ((center_rotated.Ty - smap.center.Ty)/smap.scale.axis2).value
-
-    outmap = smap._new_instance(out_data, out_meta, smap.plot_settings)
-
-    # Update the meta information with the new date and time.
-    outmap._set_date(new_observer.obstime)
-    outmap._set_reference_date(new_observer.obstime)
-
-    if is_sub_full_disk:
-        return outmap.submap(rotated_bl, top_right=rotated_tr)
-    return outmap
+    To warp many maps with the same pixel grid, use `DifferentialRotationWarp`, which
+    does the geometric work only once.
+    """
+    return DifferentialRotationWarp(smap, observer=observer, time=time, **diff_rot_kwargs)(smap)
@@ -1,5 +1,6 @@
 import warnings
 from copy import deepcopy
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -15,6 +16,7 @@ from sunpy.coordinates.ephemeris import get_earth
 from sunpy.coordinates.metaframes import RotatedSunFrame
 from sunpy.map.maputils import map_edges
 from sunpy.physics.differential_rotation import (
+    DifferentialRotationWarp,
     _get_bounding_coordinates,
     _get_extreme_position,
     _get_new_observer,
@@ -418,3 +420,60 @@ def test_rsun_fallback(aia171_test_map):
     new_observer = get_earth(aia171_test_map.date + 2 * u.day)
     rot_map = differential_rotate(aia171_test_map, observer=new_observer)
     assert_quantity_allclose(rot_map.rsun_meters, R_sun)
+
+
+def test_differential_rotation_warp(aia171_test_map, straddles_limb_map):
+    pytest.importorskip("skimage")
+    for smap in [aia171_test_map, straddles_limb_map]:
+        new_observer = get_earth(smap.date + 2*u.day)
+        warp = DifferentialRotationWarp(smap, observer=new_observer)
+        expected = differential_rotate(smap, observer=new_observer)
+        for rot_map in [warp(smap), *warp.apply([smap, smap], workers=2)]:
+            np.testing.assert_array_equal(rot_map.data, expected.data)
+            assert rot_map.meta == expected.meta
+
+
+def test_differential_rotation_warp_different_time(aia171_test_map):
+    pytest.importorskip("skimage")
+    later_map = deepcopy(aia171_test_map)
+    later_map._set_date(aia171_test_map.date + 1*u.hr)
+    later_map._set_reference_date(aia171_test_map.date + 1*u.hr)
+
+    new_observer = get_earth(aia171_test_map.date + 2*u.day)
+    warp = DifferentialRotationWarp(aia171_test_map, observer=new_observer)
+    # The heliographic coordinates of the output pixels are not calculated again
+    with mock.patch('sunpy.physics.differential_rotation._output_heliographic_coordinates') as output:
+        rot_map = warp(later_map)
+    output.assert_not_called()
+    np.testing.assert_array_equal(rot_map.data,
+                                  differential_rotate(later_map, observer=new_observer).data)
+
+
+def test_differential_rotation_warp_grid_step(aia171_test_map):
+    pytest.importorskip("skimage")
+    pytest.importorskip("scipy")
+    # The test map is too coarse for the interpolation to be accurate enough anywhere
+    smap = aia171_test_map.resample((512, 512)*u.pix)
+    new_observer = get_earth(smap.date + 2*u.day)
+    exact = DifferentialRotationWarp(smap, observer=new_observer)._coordinates(smap)
+    coarse = DifferentialRotationWarp(smap, observer=new_observer, grid_step=2)._coordinates(smap)
+    assert coarse.shape == exact.shape
+
+    # Only a few pixels at the limb can differ in whether they are on the disk
+    both = np.isfinite(exact).all(axis=0) & np.isfinite(coarse).all(axis=0)
+    either = np.isfinite(exact).all(axis=0) | np.isfinite(coarse).all(axis=0)
+    assert np.count_nonzero(either & ~both) < 0.001 * both.size
+    # Some of the pixels are interpolated
+    assert np.any(coarse[:, both] != exact[:, both])
+    np.testing.assert_allclose(coarse[:, both], exact[:, both], atol=0.02)
+
+
+def test_differential_rotation_warp_errors(aia171_test_map, all_off_disk_map):
+    with pytest.raises(ValueError, match="The entire map is off disk"):
+        DifferentialRotationWarp(all_off_disk_map, observer=get_earth(all_off_disk_map.date))
+    with pytest.raises(ValueError, match="grid_step must be a positive integer"):
+        DifferentialRotationWarp(aia171_test_map, observer=get_earth(aia171_test_map.date), grid_step=0)
+
+    warp = DifferentialRotationWarp(aia171_test_map, observer=get_earth(aia171_test_map.date + 1*u.day))
+    with pytest.raises(ValueError, match="does not have the same pixel grid"):
+        warp(aia171_test_map.submap((0, 0)*u.pix, top_right=(50, 50)*u.pix))
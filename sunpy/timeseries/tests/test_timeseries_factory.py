@@ -73,6 +73,24 @@ def test_factory_generate_list_of_ts():
         assert isinstance(ts, sunpy.timeseries.sources.eve.EVESpWxTimeSeries)
 
 
+@pytest.mark.filterwarnings('ignore:Unknown units')
+def test_factory_concurrent_read():
+    serial_ts = sunpy.timeseries.TimeSeries(eve_many_filepath[0].parent, source='EVE')
+    concurrent_ts = sunpy.timeseries.TimeSeries(eve_many_filepath[0].parent, source='EVE', workers=2)
+    assert len(concurrent_ts) == len(serial_ts)
+    for concurrent, serial in zip(concurrent_ts, serial_ts):
+        assert concurrent == serial
+
+
+def test_factory_concurrent_read_invalid_file():
+    invalid_filepath = os.path.join(rootdir, 'annotation_ppt.db')
+    with pytest.raises(NoMatchError):
+        sunpy.timeseries.TimeSeries(invalid_filepath, workers=2)
+    with pytest.warns(SunpyUserWarning, match="One of the files failed to validate with"):
+        ts = sunpy.timeseries.TimeSeries(invalid_filepath, allow_errors=True, workers=2)
+    assert ts == []
+
+
 @pytest.mark.filterwarnings('ignore:Unknown units')
 def test_factory_generate_from_glob():
     # Test making a TimeSeries from a glob
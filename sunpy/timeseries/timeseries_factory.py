@@ -6,6 +6,7 @@ import copy
 import os
 import pathlib
 from collections import OrderedDict
+from functools import partial
 from urllib.request import Request
 
 import fsspec
@@ -33,7 +34,15 @@ from sunpy.util.datatype_factory_base import (
 )
 from sunpy.util.exceptions import warn_user
 from sunpy.util.functools import seconddispatch
-from sunpy.util.io import HDPair, expand_fsspec_open_file, is_uri, is_url, parse_path, possibly_a_path
+from sunpy.util.io import (
+    HDPair,
+    expand_fsspec_open_file,
+    expand_path_args,
+    is_uri,
+    is_url,
+    parse_path,
+    possibly_a_path,
+)
 from sunpy.util.metadata import MetaDict
 
 __all__ = ["TimeSeries", "TimeSeriesFactory", "NoTimeSeriesFound", "InvalidTimeSeriesInput", "InvalidTimeSeriesType"]
@@ -307,7 +316,7 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                 parsed_args.append(arg)
         return parsed_args
 
-    def _parse_args(self, *args, **kwargs):
+    def _parse_args(self, *args, workers=None, executor=None, **kwargs):
         """
         Parses an `args` list for data-header pairs. `args` can contain any mixture of the following
         entries:
@@ -333,10 +342,22 @@ class TimeSeriesFactory(BasicRegistrationFactory):
                          '*.fits')
         """
         args = self._sanitise_args(args, **kwargs)
+        if workers is not None or executor is not None:
+            # Expand directories and globs so that every file is read in its own task
+            args = expand_path_args(args)
+            outcomes = self._map_concurrently(partial(_parse_arg_in_worker, self, **kwargs),
+                                              args, workers=workers, executor=executor)
+        else:
+            outcomes = [(None, None)] * len(args)
+
         all_ts = []
-        for arg in args:
+        for arg, (timeseries, error) in zip(args, outcomes):
             try:
-                all_ts += self._parse_arg(arg, **kwargs)
+                if error is not None:
+                    raise error
+                if timeseries is None:
+                    timeseries = self._parse_arg(arg, **kwargs)
+                all_ts += timeseries
             except (NoMatchError, MultipleMatchError, ValidationFunctionError) as e:
                 msg = f"One of the files failed to validate with: {e}"
                 if self.allow_errors:
@@ -432,7 +453,7 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         # use fsspec for everything, but for now we parse the URI through
         return self._read_file(arg.full_name, **kwargs)
 
-    def __call__(self, *args, allow_errors=False, **kwargs):
+    def __call__(self, *args, allow_errors=False, workers=None, executor=None, **kwargs):
         """
         Method for running the factory. Takes arbitrary arguments and keyword
         arguments and passes them to a sequence of pre-registered types to
@@ -447,13 +468,21 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         allow_errors : `bool`, optional
             If set, bypass data-header pairs or files which cause an exception and warn instead.
             Defaults to `False`.
+        workers : `int`, optional
+            If given, files are read concurrently using a thread pool with this
+            many threads. The order of the returned timeseries does not depend on
+            the order in which the files finish reading.
+        executor : `concurrent.futures.Executor`, optional
+            An executor to read the files concurrently with, instead of creating
+            a thread pool. This can be a `~concurrent.futures.ProcessPoolExecutor`,
+            in which case all inputs and keyword arguments must be picklable.
 
         Notes
         -----
         Extra keyword arguments are passed through to `sunpy.io.read_file` such as `memmap` for FITS files.
         """
         self.allow_errors = allow_errors
-        new_timeseries = self._parse_args(*args, **kwargs)
+        new_timeseries = self._parse_args(*args, workers=workers, executor=executor, **kwargs)
 
         # Concatenate the timeseries into one if specified.
         concatenate = kwargs.get("concatenate", False)
@@ -519,6 +548,11 @@ class TimeSeriesFactory(BasicRegistrationFactory):
         return WidgetType(data, meta, units, **kwargs)
 
 
+def _parse_arg_in_worker(factory, arg, **kwargs):
+    # A module level function, so that it can be pickled and sent to a process pool
+    return factory._parse_arg(arg, **kwargs)
+
+
 def _apply_result(data_header_pairs, filepaths, result):
     read, result = result
     if read:
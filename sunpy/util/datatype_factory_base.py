@@ -3,6 +3,8 @@ This module provides the base registration factory used for all SunPy data/net
 factories.
 """
 import inspect
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 __all__ = ["BasicRegistrationFactory", "NoMatchError",
            "MultipleMatchError", "ValidationFunctionError"]
@@ -142,6 +144,44 @@ class BasicRegistrationFactory:
         """
         self.registry.pop(WidgetType)
 
+    @staticmethod
+    def _map_concurrently(func, args, workers=None, executor=None):
+        """
+        Call ``func`` on each of ``args`` concurrently.
+
+        Parameters
+        ----------
+        func : callable
+            The function to call with each argument. To use a process pool,
+            this must be picklable.
+        args : iterable
+            The arguments.
+        workers : `int`, optional
+            The number of threads to use if ``executor`` is not given.
+            Defaults to the `~concurrent.futures.ThreadPoolExecutor` default.
+        executor : `concurrent.futures.Executor`, optional
+            The executor to use. It is not shut down afterwards.
+
+        Returns
+        -------
+        `list`
+            A ``(result, exception)`` tuple for each argument, in the order of
+            ``args``. Exceptions raised by ``func`` are returned rather than raised,
+            so that the caller can handle them in order.
+        """
+        func = partial(_call_capturing_exception, func)
+        if executor is not None:
+            return list(executor.map(func, args))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, args))
+
+
+def _call_capturing_exception(func, arg):
+    try:
+        return func(arg), None
+    except Exception as e:
+        return None, e
+
 
 class NoMatchError(Exception):
     """
@@ -188,7 +188,10 @@ def cached_property_based_on(attr_name):
 
     Notes
     -----
-    The cached value of ``meth(instance)`` is stored under the key ``meth.__name__``.
+    The cached value of ``prop(instance)`` is stored under the key ``prop.__name__``,
+    and the value of the attribute used to compute it is stored under the key
+    ``prop.__name__ + attr_name``, so that several properties can be cached based
+    on the same attribute.
     """
     def outer(prop):
         """
@@ -205,10 +208,11 @@ def cached_property_based_on(attr_name):
             """
             cache = instance.__dict__
             prop_key = prop.__name__
+            attr_key = prop_key + attr_name
 
             # Check if our caching method has changed output
             new_attr_val = getattr(instance, attr_name)
-            old_attr_val = cache.get(attr_name, _NOT_FOUND)
+            old_attr_val = cache.get(attr_key, _NOT_FOUND)
             if (old_attr_val is _NOT_FOUND or
                     new_attr_val != old_attr_val or
                     prop_key not in cache):
@@ -216,7 +220,7 @@ def cached_property_based_on(attr_name):
                 new_val = prop(instance)
                 cache[prop_key] = new_val
                 # Store the new attribute value after the property is computed successfully
-                cache[attr_name] = new_attr_val
+                cache[attr_key] = new_attr_val
 
             return cache[prop_key]
         return inner
@@ -26,43 +26,75 @@ def expand_fsspec_open_file(open_file):
     return [open_file]
 
 
-def parse_path(path, f, **kwargs):
+def expand_path(path):
     """
-    Read in a series of files at *path* using the function *f*.
+    Expand a path to a file, a directory or a glob pattern into a list of paths.
 
     Parameters
     ----------
     path : pathlib.Path
-    f : callable
-        Must return a list of read-in data.
-    kwargs :
-        Additional keyword arguments are handed to ``f``.
 
     Returns
     -------
     list
-        List of files read in by ``f``.
+        The path itself if it is a file, otherwise the sorted paths in the
+        directory or matching the glob pattern.
     """
     if not isinstance(path, os.PathLike):
         raise ValueError("path must be a pathlib.Path object")
     path = path.expanduser()
     if is_file(path):
-        return f(path, **kwargs)
+        return [path]
     elif is_dir(path):
-        read_files = []
-        for afile in sorted(path.glob("*")):
-            read_files += f(afile, **kwargs)
-        return read_files
+        return sorted(path.glob("*"))
     elif glob.glob(str(path)):
-        read_files = []
-        for afile in sorted(glob.glob(str(path))):
-            afile = pathlib.Path(afile)
-            read_files += f(afile, **kwargs)
-        return read_files
+        return [pathlib.Path(afile) for afile in sorted(glob.glob(str(path)))]
     else:
         raise ValueError(f"Did not find any files at {path}")
 
 
+def expand_path_args(args):
+    """
+    Replace each `pathlib.Path` in a list of factory arguments with the files it refers to.
+
+    Paths which do not refer to any files are left as they are, so that the error
+    is raised when they are parsed.
+    """
+    expanded_args = []
+    for arg in args:
+        if isinstance(arg, pathlib.Path):
+            try:
+                expanded_args += expand_path(arg)
+                continue
+            except ValueError:
+                pass
+        expanded_args.append(arg)
+    return expanded_args
+
+
+def parse_path(path, f, **kwargs):
+    """
+    Read in a series of files at *path* using the function *f*.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+    f : callable
+        Must return a list of read-in data.
+    kwargs :
+        Additional keyword arguments are handed to ``f``.
+
+    Returns
+    -------
+    list
+        List of files read in by ``f``.
+    """
+    read_files = []
+    for afile in expand_path(path):
+        read_files += f(afile, **kwargs)
+    return read_files
+
+
 # In python<3.8 paths with un-representable chars (ie. '*' on windows)
 # raise an error, so make our own version that returns False instead of
 # erroring. These can be removed when we support python >= 3.8
@@ -4,12 +4,17 @@ parsing, normalization, and maintaining coherence between keys and keycomments.
 """
 from collections import OrderedDict, namedtuple
 from collections.abc import Mapping
+from itertools import count
 
 __all__ = ['MetaDict']
 
 ModifiedItem = namedtuple('ModifiedItem', ['original', 'current'])
 ModifiedItem.__repr__ = lambda t: f"(original={t.original}, current={t.current})"
 
+# Shared between all instances so that a revision number uniquely identifies
+# the state of one particular MetaDict
+_revision_counter = count()
+
 
 class MetaDict(OrderedDict):
     """
@@ -25,6 +30,10 @@ class MetaDict(OrderedDict):
     Additionally, any extraneous keycomments will be removed when the
     :class:`MetaDict` is instantiated.
 
+    Every mutation of the :class:`MetaDict` through its own methods assigns a
+    new value to `revision`, which can be used to cheaply check whether the
+    contents may have changed.
+
     Parameters
     ----------
     save_original : bool, optional
@@ -60,6 +69,7 @@ class MetaDict(OrderedDict):
             args[0] = tags
 
         super().__init__(*args)
+        self._bump_revision()
         # Use `copy=True` to avoid mutating the caller's keycomments
         # dictionary (if they provided one).
         self._prune_keycomments(copy=True)
@@ -73,6 +83,26 @@ class MetaDict(OrderedDict):
     def __repr__(self):
         return f"{self.__class__.__name__}([{self}])"
 
+    # Deliberately a property to prevent external modification
+    @property
+    def revision(self):
+        """
+        An integer that changes every time this instance is modified.
+
+        Revisions are unique across all instances, so two different
+        `MetaDict` objects never share a revision. In-place changes to mutable
+        values (e.g., the 'keycomments' dictionary) are not tracked.
+        """
+        return self._revision
+
+    def _bump_revision(self):
+        self._revision = next(_revision_counter)
+
+    def __setstate__(self, state):
+        # A revision restored from a pickle may have been issued by another process
+        self.__dict__.update(state)
+        self._bump_revision()
+
     # Deliberately a property to prevent external modification
     @property
     def original_meta(self):
@@ -170,10 +200,12 @@ class MetaDict(OrderedDict):
         """
         Override ``[]`` indexing.
         """
+        self._bump_revision()
         return OrderedDict.__setitem__(self, key.lower(), value)
 
     def popitem(self, last):
         key, value = super().popitem(last)
+        self._bump_revision()
         self._prune_keycomments()
         return key, value
 
@@ -182,6 +214,7 @@ class MetaDict(OrderedDict):
         Override ``del dict[key]`` key deletion.
         """
         OrderedDict.__delitem__(self, key.lower())
+        self._bump_revision()
         self._prune_keycomments()
 
     def item_hash(self):
@@ -219,6 +252,7 @@ class MetaDict(OrderedDict):
         has_key = key in self
         result = OrderedDict.pop(self, key.lower(), default)
         if has_key:
+            self._bump_revision()
             self._prune_keycomments()
         return result
 
@@ -226,10 +260,20 @@ class MetaDict(OrderedDict):
         """
         Override ``.update()`` to perform case-insensitively.
         """
-        return OrderedDict.update(self, OrderedDict((k.lower(), v) for k, v in d2.items()))
+        OrderedDict.update(self, OrderedDict((k.lower(), v) for k, v in d2.items()))
+        self._bump_revision()
 
     def setdefault(self, key, default=None):
         """
         Override ``.setdefault()`` to perform case-insensitively.
         """
+        if key not in self:
+            self._bump_revision()
         return OrderedDict.setdefault(self, key.lower(), default)
+
+    def clear(self):
+        """
+        Override ``.clear()`` to track the modification.
+        """
+        OrderedDict.clear(self)
+        self._bump_revision()
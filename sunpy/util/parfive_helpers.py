@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 from functools import wraps
@@ -6,6 +7,7 @@ import aiohttp
 import parfive
 from packaging.version import Version
 from parfive import Results, SessionConfig
+from parfive.utils import FailedDownload, Token
 
 import sunpy
 
@@ -28,3 +30,71 @@ class Downloader(parfive.Downloader):
         if "config" not in kwargs:
             kwargs["config"] = config
         super().__init__(*args, **kwargs)
+
+
+class _StreamingDownloader(Downloader):
+    """
+    A downloader which downloads its queued files one at a time and returns
+    the result for each file as soon as it finishes.
+
+    The files are downloaded by `run_download_iter` rather than by
+    `~parfive.Downloader.download`, with up to ``max_conn`` files at once
+    over a single HTTP session.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.queued_files = []
+
+    def enqueue_file(self, url, *args, **kwargs):
+        # parfive queues a function which downloads the file, given a session
+        # for HTTP files, which is kept so that the files can be downloaded in order
+        nhttp = len(self.http_queue)
+        super().enqueue_file(url, *args, **kwargs)
+        if len(self.http_queue) > nhttp:
+            self.queued_files.append((self.http_queue[-1], True))
+        else:
+            self.queued_files.append((self.ftp_queue[-1], False))
+
+
+    async def run_download_iter(self):
+        """
+        Download all of the queued files, yielding a `parfive.Results` for each
+        file (containing either its path or its error) as soon as it finishes.
+        """
+        self._init_queues()
+        queued_files = iter(self.queued_files)
+        finished = asyncio.Queue()
+
+        async def worker(session, token):
+            for get_file, is_http in queued_files:
+                file_pb = self.tqdm if self.config.file_progress else False
+                result = Results()
+                try:
+                    url, path = await get_file(session if is_http else None, token=token, file_pb=file_pb)
+                    result.append(path=path, url=url)
+                except FailedDownload as e:
+                    result.add_error(e.filepath_partial, e.url, e.exception)
+                except Exception as e:
+                    result = e
+                await finished.put(result)
+
+        nfiles = len(self.queued_files)
+        main_pb = self.tqdm(total=nfiles, unit="file", desc="Files Downloaded",
+                            position=0) if self.config.progress else None
+        async with self.config.aiohttp_client_session() as session:
+            workers = [asyncio.create_task(worker(session, Token(i + 1)))
+                       for i in range(min(self.config.max_conn, nfiles))]
+            try:
+                for _ in range(nfiles):
+                    result = await finished.get()
+                    if isinstance(result, Exception):
+                        raise result
+                    if main_pb is not None and not result.errors:
+                        main_pb.update(1)
+                    yield result
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                if main_pb is not None:
+                    main_pb.close()
@@ -2,7 +2,12 @@ import warnings
 
 import pytest
 
-from sunpy.util.decorators import _active_contexts, deprecated, sunpycontextmanager
+from sunpy.util.decorators import (
+    _active_contexts,
+    cached_property_based_on,
+    deprecated,
+    sunpycontextmanager,
+)
 from sunpy.util.exceptions import SunpyDeprecationWarning
 
 
@@ -61,3 +66,33 @@ def test_context_tracking():
         assert _active_contexts.get() == [ctx1_name]
 
     assert _active_contexts.get() == []
+
+
+def test_cached_property_based_on_shared_attribute():
+    class Cached:
+        def __init__(self):
+            self.key = 0
+            self.ncalls = {'a': 0, 'b': 0}
+
+        @property
+        @cached_property_based_on('key')
+        def a(self):
+            self.ncalls['a'] += 1
+            return ('a', self.key)
+
+        @property
+        @cached_property_based_on('key')
+        def b(self):
+            self.ncalls['b'] += 1
+            return ('b', self.key)
+
+    obj = Cached()
+    assert obj.a == ('a', 0)
+    assert obj.a == ('a', 0)
+    assert obj.ncalls['a'] == 1
+
+    obj.key = 1
+    # Recomputing one property must not mark the other as up to date
+    assert obj.b == ('b', 1)
+    assert obj.a == ('a', 1)
+    assert obj.ncalls == {'a': 2, 'b': 1}
@@ -558,3 +558,45 @@ def test_original_copy():
     # Check removal of items
     md.pop('foo')
     assert md.removed_items == {'foo': 'bar'}
+
+
+def test_revision_changes_on_modification():
+    md = MetaDict({'foo': 'bar', 'baz': 1})
+    revisions = [md.revision]
+
+    def check_new_revision():
+        assert md.revision not in revisions
+        revisions.append(md.revision)
+
+    md['FOO'] = 'qux'
+    check_new_revision()
+    del md['baz']
+    check_new_revision()
+    md.update({'a': 1})
+    check_new_revision()
+    md.setdefault('b', 2)
+    check_new_revision()
+    md.pop('a')
+    check_new_revision()
+    md.popitem(last=True)
+    check_new_revision()
+    md.clear()
+    check_new_revision()
+
+
+def test_revision_unchanged_on_access():
+    md = MetaDict({'foo': 'bar'})
+    revision = md.revision
+    md['foo']
+    md.get('foo')
+    md.pop('missing')
+    md.setdefault('foo', 'baz')
+    assert 'foo' in md
+    assert md.revision == revision
+
+
+def test_revision_unique_across_instances():
+    md = MetaDict({'foo': 'bar'})
+    assert md.copy().revision != md.revision
+    assert copy.deepcopy(md).revision != md.revision
+    assert MetaDict(md).revision != md.revision